@@ -14,6 +14,8 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     ENVIRONMENT: str = "development"
     LOG_LEVEL: str = "INFO"
+    LOG_SAMPLE_RATE: float = 1.0  # Fraction of requests whose info/debug logs are kept
+    LOG_QUEUE_SIZE: int = 10000  # Records buffered for the log writer thread
     API_VERSION: str = "v1"
     
     # API Configuration
@@ -43,6 +45,59 @@ class Settings(BaseSettings):
     DEFAULT_MONTE_CARLO_ITERATIONS: int = 10000
     MAX_MONTE_CARLO_ITERATIONS: int = 50000
     
+    # Parallel simulation (iterations split into shards over a process pool)
+    MONTE_CARLO_PARALLEL_ENABLED: bool = False  # Use the pool automatically for large runs
+    MONTE_CARLO_POOL_SIZE: int = 0  # Worker processes, 0 = one per CPU core
+    MONTE_CARLO_SHARD_SIZE: int = 10000  # Paths simulated per shard
+    
+    # Streaming simulation (constant memory, for large offline runs)
+    MAX_STREAMING_ITERATIONS: int = 10000000
+    STREAMING_BLOCK_SIZE: int = 10000  # Paths simulated per block
+    STREAMING_SKETCH_COMPRESSION: int = 500  # Quantile sketch accuracy/memory trade-off
+    
+    # Adaptive simulation (stop once percentiles converge)
+    ADAPTIVE_BATCH_SIZE: int = 2000  # Paths simulated between convergence checks
+    ADAPTIVE_TARGET_PRECISION: float = 0.002  # Relative CI half-width of p10/p50/p90
+    ADAPTIVE_CONFIDENCE_LEVEL: float = 0.95
+    
+    # Path bank (shared precomputed return paths for in-memory runs)
+    PATH_BANK_ENABLED: bool = False
+    PATH_BANK_SIZE: int = 10000  # Paths per entry; larger runs draw fresh paths
+    PATH_BANK_MAX_BYTES: int = 256 * 1024 * 1024  # Memory budget before LRU eviction
+    PATH_BANK_SEED: int = 20240601  # Seed for simulations that do not request one
+    PATH_BANK_PRELOAD_YEARS: int = 52  # Horizon generated at startup, 0 = on first use
+    PATH_BANK_DIR: str = ""  # Persist and memory-map the bank here, "" = memory only
+    
+    # Result cache (identical simulation requests served from memory)
+    RESULT_CACHE_ENABLED: bool = True
+    RESULT_CACHE_MAX_ENTRIES: int = 1024  # Entries before LRU eviction
+    RESULT_CACHE_TTL_SECONDS: float = 600.0  # Lifetime of a cached result
+    
+    # Stage timing (Server-Timing header on forecast responses)
+    SERVER_TIMING_ENABLED: bool = True
+    
+    # Request profiling (X-Profile header or ?profile=true; DEBUG or admin token)
+    PROFILING_ADMIN_TOKEN: str = ""  # Allows profiling outside DEBUG, "" = DEBUG only
+    PROFILING_DIR: str = ""  # Also write .prof files here, "" = response only
+    PROFILING_TOP_N: int = 25  # Hotspots returned in the response
+    
+    # Simulation executor (blocking simulations run off the event loop)
+    SIMULATION_EXECUTOR: str = "thread"  # "thread" or "process"
+    SIMULATION_WORKERS: int = 0  # Pool workers, 0 = one per CPU core
+    SIMULATION_QUEUE_LIMIT: int = 32  # Requests allowed to wait for a worker before 503
+    
+    # Admission control (cost budget of iterations x years x simulations in flight)
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_BUDGET: int = 20000000  # Path-years running at once; larger requests run alone
+    ADMISSION_QUEUE_LIMIT: int = 64  # Requests allowed to wait for budget before 429
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 10.0  # Wait for budget before 429
+    
+    # Background jobs (/jobs: long analyses polled for status and result)
+    JOBS_WORKERS: int = 2  # Jobs run at once
+    JOBS_MAX_PENDING: int = 100  # Queued plus running jobs before 429
+    JOBS_RESULT_TTL_SECONDS: float = 3600.0  # Lifetime of a finished job and its result
+    JOBS_DIR: str = ""  # Persist jobs and results here, "" = memory only
+    
     # Risk scenario parameters (annual returns in %)
     CONSERVATIVE_RETURN_MIN: float = 4.0
     CONSERVATIVE_RETURN_MAX: float = 6.0
@@ -38,3 +38,30 @@ class ResourceNotFoundException(AppException):
     
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message, status_code=404, details=details)
+
+
+class ConflictException(AppException):
+    """Raised when a request conflicts with the current state of a resource"""
+    
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(message, status_code=409, details=details)
+
+
+class ServiceUnavailableException(AppException):
+    """Raised when the service is temporarily overloaded"""
+    
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(message, status_code=503, details=details)
+
+
+class TooManyRequestsException(AppException):
+    """Raised when a request is shed to protect shared capacity"""
+    
+    def __init__(
+        self,
+        message: str,
+        retry_after: int = 1,
+        details: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(message, status_code=429, details=details)
+        self.retry_after = retry_after
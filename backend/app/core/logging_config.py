@@ -1,13 +1,87 @@
 """
 Structured logging configuration
+
+Records are handed to a QueueHandler and written by a QueueListener thread,
+so the JSON formatting and stdout writes never run on a request thread.
+Per-request info/debug logs can be sampled with sample_request().
 """
+import atexit
+import copy
 import logging
+import queue
+import random
 import sys
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
 from pythonjsonlogger import jsonlogger
 
+from app.core.metrics import REGISTRY, stat_family
+
+# Whether the current request's below-WARNING records are logged
+_request_sampled: ContextVar[bool] = ContextVar("request_sampled", default=True)
+_sample_rate = 1.0
+
+_queue_handler: Optional["NonBlockingQueueHandler"] = None
+_listener: Optional[QueueListener] = None
 
-def setup_logging(log_level: str = "INFO") -> None:
-    """Configure structured JSON logging"""
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full"""
+    
+    _exception_formatter = logging.Formatter()
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merge args into the message and render any traceback to text
+        
+        Unlike the base class this leaves formatting to the listener's
+        handler, so the JSON formatter still sees the traceback as exc_info.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class RequestSamplingFilter(logging.Filter):
+    """Drop below-WARNING records of requests that were not sampled"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or _request_sampled.get()
+
+
+def setup_logging(
+    log_level: str = "INFO",
+    sample_rate: float = 1.0,
+    queue_size: int = 10000
+) -> None:
+    """
+    Configure structured JSON logging
+    
+    Args:
+        log_level: Root logger level
+        sample_rate: Fraction of requests whose info/debug logs are kept
+        queue_size: Records buffered for the writer thread before dropping
+    """
+    global _queue_handler, _listener, _sample_rate
+    stop_logging()
+    _sample_rate = sample_rate
     
     # Create JSON formatter
     log_handler = logging.StreamHandler(sys.stdout)
@@ -17,15 +91,68 @@ def setup_logging(log_level: str = "INFO") -> None:
     )
     log_handler.setFormatter(formatter)
     
+    # Request threads only enqueue; the listener thread formats and writes
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    _queue_handler.addFilter(RequestSamplingFilter())
+    _listener = QueueListener(log_queue, log_handler, respect_handler_level=True)
+    _listener.start()
+    
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.addHandler(log_handler)
+    root_logger.addHandler(_queue_handler)
     root_logger.setLevel(getattr(logging, log_level.upper()))
     
     # Reduce noise from uvicorn
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 
 
+def stop_logging() -> None:
+    """Flush queued records and stop the writer thread"""
+    global _queue_handler, _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+
+atexit.register(stop_logging)
+
+
+def sample_request(sample_rate: Optional[float] = None) -> bool:
+    """
+    Decide whether the current request's info/debug logs are kept
+    
+    The decision is stored in a context variable, so it follows the request
+    into handlers and the simulation threads they start.
+    
+    Args:
+        sample_rate: Override for the configured rate
+    
+    Returns:
+        True when the request is sampled
+    """
+    rate = _sample_rate if sample_rate is None else sample_rate
+    sampled = rate >= 1.0 or random.random() < rate
+    _request_sampled.set(sampled)
+    return sampled
+
+
+def dropped_records() -> int:
+    """Records dropped because the log queue was full"""
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+REGISTRY.register_collector(lambda: [
+    stat_family(
+        "log_records_dropped_total", "counter",
+        "Log records dropped because the log queue was full", dropped_records()
+    )
+])
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with the given name"""
     return logging.getLogger(name)
@@ -0,0 +1,260 @@
+"""
+In-process metrics in the Prometheus text exposition format
+
+A small, dependency-free subset of the Prometheus client: counters, gauges
+and histograms with labels, plus collectors that read existing stats() at
+scrape time. Values are per process; runs on the process simulation
+executor or parallel engine shards are recorded by the parent only where
+the parent does the timing.
+"""
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+# (labels, value) samples of one metric family
+Samples = List[Tuple[Dict[str, str], float]]
+# (name, type, help, samples) produced by a collector at scrape time
+Family = Tuple[str, str, str, Samples]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_sample(name: str, labels: Dict[str, str], value: float) -> str:
+    if labels:
+        rendered = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+        return f"{name}{{{rendered}}} {_format_value(value)}"
+    return f"{name} {_format_value(value)}"
+
+
+class _Metric:
+    """Base for labelled metrics; values are keyed by label values"""
+    
+    TYPE = "untyped"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+    
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+    
+    def _labels(self, key: LabelValues) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+    
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+        lines.extend(self._render_samples())
+        return lines
+    
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing total"""
+    
+    TYPE = "counter"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        # Unlabelled metrics are exported as 0 before their first update
+        self._values: Dict[LabelValues, float] = {} if self.labelnames else {(): 0.0}
+    
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+    
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+    
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [_format_sample(self.name, self._labels(key), value) for key, value in items]
+
+
+class Gauge(Counter):
+    """Value that can go up and down"""
+    
+    TYPE = "gauge"
+    
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+    
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets, with their sum"""
+    
+    TYPE = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # Per label set: non-cumulative bucket counts, then sum
+        self._values: Dict[LabelValues, Tuple[List[int], float]] = {}
+    
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = next(i for i, bound in enumerate(self.buckets) if value <= bound)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+    
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            counts, _ = self._values.get(self._key(labels), ([0], 0.0))
+            return sum(counts)
+    
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(
+                (key, (list(counts), total)) for key, (counts, total) in self._values.items()
+            )
+        
+        lines = []
+        for key, (counts, total) in items:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(_format_sample(
+                    f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+                ))
+            lines.append(_format_sample(f"{self.name}_sum", labels, total))
+            lines.append(_format_sample(f"{self.name}_count", labels, cumulative))
+        return lines
+
+
+def stat_family(name: str, metric_type: str, documentation: str, value: float) -> Family:
+    """Unlabelled family for a collector reading an existing stats() counter"""
+    return name, metric_type, documentation, [({}, value)]
+
+
+class MetricsRegistry:
+    """Metrics and scrape-time collectors rendered together by /metrics"""
+    
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+        self._lock = threading.Lock()
+    
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+    
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+    
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+    
+    def register_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        """Add a callable returning (name, type, help, samples) families at scrape time"""
+        with self._lock:
+            self._collectors.append(collector)
+    
+    def render(self) -> str:
+        """All metrics in the text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        for collector in collectors:
+            for name, metric_type, documentation, samples in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                lines.extend(_format_sample(name, labels, value) for labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# HTTP layer, recorded by RequestLoggingMiddleware
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+
+# Simulation layer, recorded by MonteCarloSimulator
+SIMULATION_DURATION = REGISTRY.histogram(
+    "simulation_duration_seconds",
+    "Wall time of one Monte Carlo simulation call",
+    ("risk_profile", "engine"),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+SIMULATION_ITERATIONS = REGISTRY.histogram(
+    "simulation_iterations",
+    "Paths simulated per Monte Carlo simulation call",
+    ("risk_profile", "engine"),
+    buckets=(100, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000, 1000000),
+)
+SIMULATION_PATHS_PER_SECOND = REGISTRY.histogram(
+    "simulation_paths_per_second",
+    "Throughput of one Monte Carlo simulation call",
+    ("risk_profile", "engine"),
+    buckets=(1e4, 5e4, 1e5, 2.5e5, 5e5, 1e6, 2.5e6, 5e6, 1e7),
+)
+SIMULATION_PATHS = REGISTRY.counter(
+    "simulation_paths_total",
+    "Paths simulated",
+    ("risk_profile", "engine"),
+)
+SIMULATIONS_IN_FLIGHT = REGISTRY.gauge(
+    "simulations_in_flight",
+    "Monte Carlo simulation calls currently running in this process",
+)
@@ -1,97 +1,175 @@
 """
 Custom middleware for error handling and logging
+
+Both middlewares are plain ASGI callables rather than BaseHTTPMiddleware
+subclasses: they wrap `send` instead of re-streaming the response through an
+extra task, so streaming responses pass through unbuffered.
 """
+import json
 import time
 import uuid
-from typing import Callable
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 
-from app.core.logging_config import get_logger
+from starlette.datastructures import URL, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging_config import get_logger, sample_request
+from app.core.metrics import HTTP_REQUEST_DURATION
 from app.core.exceptions import AppException
 
 logger = get_logger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+def _request_id(scope: Scope):
+    """Request ID stored by RequestLoggingMiddleware, if any"""
+    return scope.get("state", {}).get("request_id")
+
+
+def _route_template(scope: Scope) -> str:
+    """
+    Path template of the matched route, e.g. /api/v1/forecast/retirement
+    
+    Routes of included routers may carry only their router-relative path,
+    so the prefix is recovered from the part of the request path before
+    the segment the route matched.
+    """
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+    
+    path = scope["path"]
+    for start, char in enumerate(path):
+        if char == "/" and route.path_regex.match(path[start:]):
+            return path[:start] + route.path
+    return route.path
+
+
+class RequestLoggingMiddleware:
     """Middleware to log all incoming requests and responses"""
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Generate request ID
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # Generate request ID; visible to handlers as request.state.request_id
         request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
+        # Keep or drop this request's info logs (LOG_SAMPLE_RATE)
+        sample_request()
         
         # Log request
-        start_time = time.time()
+        start_time = time.perf_counter()
+        client = scope.get("client")
         logger.info(
             "Incoming request",
             extra={
                 "request_id": request_id,
-                "method": request.method,
-                "url": str(request.url),
-                "client": request.client.host if request.client else None,
+                "method": scope["method"],
+                "url": str(URL(scope=scope)),
+                "client": client[0] if client else None,
             }
         )
         
-        # Process request
-        response = await call_next(request)
-        
-        # Log response
-        process_time = time.time() - start_time
-        logger.info(
-            "Request completed",
-            extra={
-                "request_id": request_id,
-                "status_code": response.status_code,
-                "process_time_ms": round(process_time * 1000, 2),
-            }
-        )
+        status_code = 500
         
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
         
-        return response
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            # Log response once the body has been fully sent
+            process_time = time.perf_counter() - start_time
+            # Label by route template (bounded), not the raw path
+            HTTP_REQUEST_DURATION.observe(
+                process_time,
+                method=scope["method"],
+                route=_route_template(scope),
+                status=str(status_code)
+            )
+            logger.info(
+                "Request completed",
+                extra={
+                    "request_id": request_id,
+                    "status_code": status_code,
+                    "process_time_ms": round(process_time * 1000, 2),
+                }
+            )
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class ErrorHandlingMiddleware:
     """Middleware to handle exceptions and return proper error responses"""
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send_tracking_start)
         except AppException as e:
             # Handle custom application exceptions
             logger.error(
-                f"Application error: {e.message}",
+                "Application error: %s", e.message,
                 extra={
-                    "request_id": getattr(request.state, "request_id", None),
+                    "request_id": _request_id(scope),
                     "status_code": e.status_code,
                     "details": e.details,
                 },
                 exc_info=True
             )
-            return JSONResponse(
-                status_code=e.status_code,
-                content={
-                    "detail": e.message,
-                    "details": e.details,
-                    "request_id": getattr(request.state, "request_id", None),
-                }
-            )
+            if response_started:
+                raise
+            await self._send_json(send, e.status_code, {
+                "detail": e.message,
+                "details": e.details,
+                "request_id": _request_id(scope),
+            })
         except Exception as e:
             # Handle unexpected exceptions
             logger.error(
-                f"Unexpected error: {str(e)}",
+                "Unexpected error: %s", e,
                 extra={
-                    "request_id": getattr(request.state, "request_id", None),
+                    "request_id": _request_id(scope),
                 },
                 exc_info=True
             )
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "detail": "Internal server error",
-                    "request_id": getattr(request.state, "request_id", None),
-                }
-            )
+            if response_started:
+                raise
+            await self._send_json(send, 500, {
+                "detail": "Internal server error",
+                "request_id": _request_id(scope),
+            })
+    
+    @staticmethod
+    async def _send_json(send: Send, status_code: int, content: dict) -> None:
+        """Send a complete JSON error response"""
+        body = json.dumps(content).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,105 @@
+"""
+On-demand cProfile profiling of individual requests
+
+A request opts in with the X-Profile header or ?profile=true; it is only
+honoured when DEBUG is on or the X-Admin-Token header matches
+PROFILING_ADMIN_TOKEN. The blocking compute function then runs under
+cProfile on its worker, and the top-N hotspots (and optionally a .prof
+file in PROFILING_DIR) are returned alongside the result.
+"""
+import cProfile
+import hmac
+import os
+import pstats
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Tuple
+
+from fastapi import HTTPException, Request
+
+from app.core.config import settings
+
+TRUE_VALUES = ("1", "true", "yes", "on")
+
+
+def profiling_requested(request: Request) -> bool:
+    """
+    FastAPI dependency: whether this request asked to be profiled
+    
+    Raises:
+        HTTPException: 403 when profiling was asked for but is not allowed
+    """
+    flag = request.headers.get("X-Profile") or request.query_params.get("profile")
+    if flag is None or flag.lower() not in TRUE_VALUES:
+        return False
+    
+    token = request.headers.get("X-Admin-Token", "")
+    admin = bool(settings.PROFILING_ADMIN_TOKEN) and hmac.compare_digest(
+        token.encode(), settings.PROFILING_ADMIN_TOKEN.encode()
+    )
+    if not (settings.DEBUG or admin):
+        raise HTTPException(
+            status_code=403,
+            detail="Profiling requires DEBUG or a valid X-Admin-Token"
+        )
+    return True
+
+
+def _function_label(func: Tuple[str, int, str]) -> str:
+    filename, line, name = func
+    if filename == "~":
+        # Built-in functions have no file
+        return name
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+
+def profile_call(
+    name: str, fn: Callable[..., Any], *args: Any
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Run fn(*args) under cProfile
+    
+    Module-level so it can be submitted to a thread or process pool; it
+    profiles only the thread it runs on.
+    
+    Args:
+        name: Label used in the profile file name
+        fn: Function to profile
+    
+    Returns:
+        Tuple of (fn's result, profile report). The report holds the top
+        PROFILING_TOP_N functions by cumulative time and the path of the
+        written .prof file when PROFILING_DIR is set.
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(fn, *args)
+    
+    stats = pstats.Stats(profiler).sort_stats(pstats.SortKey.CUMULATIVE)
+    hotspots = []
+    for func in stats.fcn_list[:settings.PROFILING_TOP_N]:
+        primitive_calls, calls, total_time, cumulative_time, _ = stats.stats[func]
+        hotspots.append({
+            "function": _function_label(func),
+            "calls": calls,
+            "primitive_calls": primitive_calls,
+            "total_ms": round(total_time * 1000, 3),
+            "cumulative_ms": round(cumulative_time * 1000, 3),
+        })
+    
+    profile_file = None
+    if settings.PROFILING_DIR:
+        os.makedirs(settings.PROFILING_DIR, exist_ok=True)
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        profile_file = os.path.join(
+            settings.PROFILING_DIR, f"{name}-{timestamp}-{uuid.uuid4().hex[:8]}.prof"
+        )
+        stats.dump_stats(profile_file)
+    
+    report = {
+        "sort": "cumulative",
+        "total_calls": stats.total_calls,
+        "total_ms": round(stats.total_tt * 1000, 3),
+        "hotspots": hotspots,
+        "file": profile_file,
+    }
+    return result, report
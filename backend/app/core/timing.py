@@ -0,0 +1,69 @@
+"""
+Per-request stage timing
+
+A StageTimer activated by a handler collects wall time per named stage.
+Code further down the call stack records into it with stage(), which is a
+no-op when no timer is active. The timer travels in a context variable, so
+stages timed on the thread simulation executor land in the request's timer.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+_current_timer: ContextVar[Optional["StageTimer"]] = ContextVar("stage_timer", default=None)
+
+
+class StageTimer:
+    """Wall time (ms) per named stage of one request"""
+    
+    def __init__(self):
+        self._start = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+    
+    @classmethod
+    def activate(cls) -> "StageTimer":
+        """Create a timer and make it current for this request's context"""
+        timer = cls()
+        _current_timer.set(timer)
+        return timer
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block; repeated stages accumulate"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+    
+    def elapsed_ms(self) -> float:
+        """Time since the timer was created"""
+        return (time.perf_counter() - self._start) * 1000
+    
+    def timings(self) -> Dict[str, float]:
+        """Stage durations in ms, in the order first recorded, plus the total"""
+        timings = {name: round(ms, 3) for name, ms in self.stages.items()}
+        timings["total"] = round(self.elapsed_ms(), 3)
+        return timings
+    
+    def server_timing(self) -> str:
+        """Server-Timing header value, e.g. "simulation;dur=12.5, total;dur=14.1" """
+        return ", ".join(f"{name};dur={ms:.3f}" for name, ms in self.timings().items())
+
+
+def current_timer() -> Optional[StageTimer]:
+    """Timer of the current request, if a handler activated one"""
+    return _current_timer.get()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the enclosed block into the current request's timer, if any"""
+    timer = _current_timer.get()
+    if timer is None:
+        yield
+        return
+    with timer.stage(name):
+        yield
@@ -8,10 +8,18 @@ from contextlib import asynccontextmanager
 from app.core.config import settings
 from app.core.logging_config import setup_logging, get_logger
 from app.core.middleware import RequestLoggingMiddleware, ErrorHandlingMiddleware
-from app.routes import health, forecast, projections
+from app.routes import health, forecast, jobs, metrics, projections
+from app.services.job_manager import shutdown_job_manager
+from app.services.monte_carlo_simulator import shutdown_process_pool
+from app.services.path_bank import get_path_bank
+from app.services.simulation_executor import shutdown_simulation_executor
 
 # Setup logging
-setup_logging(log_level="INFO" if not settings.DEBUG else "DEBUG")
+setup_logging(
+    log_level="INFO" if not settings.DEBUG else "DEBUG",
+    sample_rate=settings.LOG_SAMPLE_RATE,
+    queue_size=settings.LOG_QUEUE_SIZE
+)
 logger = get_logger(__name__)
 
 
@@ -20,12 +28,21 @@ async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events"""
     # Startup
     logger.info(
-        f"Starting {settings.APP_NAME} v{settings.APP_VERSION}",
+        "Starting %s v%s", settings.APP_NAME, settings.APP_VERSION,
         extra={"debug_mode": settings.DEBUG}
     )
+    path_bank = get_path_bank()
+    if path_bank is not None and settings.PATH_BANK_PRELOAD_YEARS:
+        path_bank.warm(settings.PATH_BANK_PRELOAD_YEARS)
+    elif path_bank is not None and path_bank.directory is not None:
+        # Map a bank built offline even when nothing is preloaded
+        path_bank.load()
     yield
     # Shutdown
-    logger.info(f"Shutting down {settings.APP_NAME}")
+    logger.info("Shutting down %s", settings.APP_NAME)
+    shutdown_job_manager()
+    shutdown_simulation_executor()
+    shutdown_process_pool()
 
 
 # Create FastAPI application
@@ -53,7 +70,9 @@ app.add_middleware(RequestLoggingMiddleware)
 
 # Include routers
 app.include_router(health.router)
+app.include_router(metrics.router)
 app.include_router(forecast.router, prefix=settings.API_V1_PREFIX)
+app.include_router(jobs.router, prefix=settings.API_V1_PREFIX)
 app.include_router(projections.router, prefix=settings.API_V1_PREFIX)
 
 
@@ -2,9 +2,12 @@
 Pydantic models for request/response validation
 """
 from enum import Enum
-from typing import Optional, Dict, List
+from typing import Any, Optional, Dict, List, Literal
 from pydantic import BaseModel, Field, field_validator
 
+# Largest seed accepted: JavaScript's safe integer range, like generated seeds
+MAX_SEED = 2 ** 53 - 1
+
 
 class InsightSeverity(str, Enum):
     """Severity levels for insights"""
@@ -27,6 +30,14 @@ class RiskProfile(str, Enum):
     AGGRESSIVE = "aggressive"
 
 
+class SamplingMethod(str, Enum):
+    """Random sampling schemes for Monte Carlo return paths"""
+    UNIFORM = "uniform"
+    ANTITHETIC = "antithetic"
+    STRATIFIED = "stratified"
+    SOBOL = "sobol"
+
+
 class RetirementInput(BaseModel):
     """Input parameters for retirement corpus calculation"""
     
@@ -64,6 +75,32 @@ class RetirementInput(BaseModel):
         le=50000,
         description="Number of Monte Carlo simulation iterations"
     )
+    seed: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=MAX_SEED,
+        description="Random seed for reproducible simulations (generated when omitted)"
+    )
+    target_precision: Optional[float] = Field(
+        default=None,
+        gt=0,
+        le=0.1,
+        description=(
+            "Stop simulating once p10/p50/p90 are within this relative precision "
+            "(e.g. 0.005 = ±0.5%); monte_carlo_iterations becomes the upper bound"
+        )
+    )
+    sampling_method: SamplingMethod = Field(
+        default=SamplingMethod.UNIFORM,
+        description="Sampling scheme for simulated returns (variance reduction)"
+    )
+    control_variate: bool = Field(
+        default=False,
+        description=(
+            "Sharpen estimates using the deterministic corpus as a control variate; "
+            "cannot be combined with target_precision"
+        )
+    )
     
     @field_validator('retirement_age')
     @classmethod
@@ -73,6 +110,14 @@ class RetirementInput(BaseModel):
             raise ValueError('Retirement age must be greater than current age')
         return v
     
+    @field_validator('control_variate')
+    @classmethod
+    def validate_control_variate(cls, v, info):
+        """Control variates run on the fixed-size vectorized engine only"""
+        if v and info.data.get('target_precision') is not None:
+            raise ValueError('control_variate cannot be combined with target_precision')
+        return v
+    
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -111,6 +156,23 @@ class PensionEstimate(BaseModel):
     monthly_pension_90th: float = Field(..., description="90th percentile monthly pension")
 
 
+class SimulationMetadata(BaseModel):
+    """Details of the Monte Carlo run behind a forecast"""
+    
+    seed: int = Field(..., description="Random seed used; resubmit it to reproduce the forecast")
+    iterations_used: Optional[int] = Field(default=None, description="Number of paths actually simulated")
+    sampling_method: SamplingMethod = Field(default=SamplingMethod.UNIFORM, description="Sampling scheme used for returns")
+    achieved_precision: Optional[float] = Field(
+        default=None,
+        description="Relative confidence-interval half-width of p10/p50/p90 (adaptive runs only)"
+    )
+    variance_reduction_factor: Optional[float] = Field(
+        default=None,
+        description="Variance reduction of the mean achieved by the control variate (1 / (1 - rho^2))"
+    )
+    served_from_cache: bool = Field(default=False, description="Whether this result was served from the result cache")
+
+
 class RetirementForecastResponse(BaseModel):
     """Complete retirement forecast response"""
     
@@ -121,6 +183,13 @@ class RetirementForecastResponse(BaseModel):
     pension_estimate: PensionEstimate
     risk_profile_details: Dict[str, float]
     insights: List[Insight] = Field(default=[], description="Intelligent financial insights")
+    simulation: Optional[SimulationMetadata] = Field(default=None, description="Monte Carlo run details")
+    timings: Optional[Dict[str, float]] = Field(
+        default=None, description="Wall time per processing stage in ms (requested with ?timings=true)"
+    )
+    profile: Optional[Dict[str, Any]] = Field(
+        default=None, description="cProfile hotspots (requested with X-Profile; DEBUG or admin only)"
+    )
     
     model_config = {
         "json_schema_extra": {
@@ -187,6 +256,9 @@ class ScenarioResult(BaseModel):
     risk_profile: RiskProfile
     corpus_projection: PensionProjection
     pension_estimate: PensionEstimate
+    simulation: Optional[SimulationMetadata] = Field(
+        default=None, description="Monte Carlo run details of this risk profile"
+    )
 
 
 class ScenarioComparisonResponse(BaseModel):
@@ -196,6 +268,10 @@ class ScenarioComparisonResponse(BaseModel):
     investment_horizon_years: int
     total_contributions: float
     insights: List[Insight] = Field(default=[], description="Comparative insights across scenarios")
+    simulation: Optional[SimulationMetadata] = Field(default=None, description="Monte Carlo run details")
+    profile: Optional[Dict[str, Any]] = Field(
+        default=None, description="cProfile hotspots (requested with X-Profile; DEBUG or admin only)"
+    )
     
     model_config = {
         "json_schema_extra": {
@@ -386,6 +462,14 @@ class SensitivityRequest(BaseModel):
     annual_income_growth: float = Field(default=5.0, ge=0, le=20, description="Annual income growth %")
     risk_profile: RiskProfile = Field(default=RiskProfile.MODERATE, description="Risk profile")
     monte_carlo_iterations: Optional[int] = Field(default=10000, ge=1000, le=50000)
+    seed: Optional[int] = Field(default=None, ge=0, le=MAX_SEED, description="Random seed for reproducible simulations")
+    sampling_method: SamplingMethod = Field(default=SamplingMethod.UNIFORM, description="Sampling scheme for simulated returns")
+    scenarios: Optional[List[float]] = Field(
+        default=None,
+        min_length=1,
+        max_length=500,
+        description="Contribution change percentages to evaluate (default [5, 10, 20])"
+    )
     
     @field_validator('retirement_age')
     @classmethod
@@ -393,6 +477,14 @@ class SensitivityRequest(BaseModel):
         if 'current_age' in info.data and v <= info.data['current_age']:
             raise ValueError('Retirement age must be greater than current age')
         return v
+    
+    @field_validator('scenarios')
+    @classmethod
+    def validate_scenarios(cls, v):
+        """Ensure every scenario leaves a positive contribution"""
+        if v is not None and any(pct <= -100 for pct in v):
+            raise ValueError('Contribution change scenarios must be greater than -100%')
+        return v
 
 
 class DelayImpactRequest(BaseModel):
@@ -404,6 +496,8 @@ class DelayImpactRequest(BaseModel):
     annual_income_growth: float = Field(default=5.0, ge=0, le=20, description="Annual income growth %")
     risk_profile: RiskProfile = Field(default=RiskProfile.MODERATE, description="Risk profile")
     monte_carlo_iterations: Optional[int] = Field(default=10000, ge=1000, le=50000)
+    seed: Optional[int] = Field(default=None, ge=0, le=MAX_SEED, description="Random seed for reproducible simulations")
+    sampling_method: SamplingMethod = Field(default=SamplingMethod.UNIFORM, description="Sampling scheme for simulated returns")
     
     @field_validator('planned_retirement_age')
     @classmethod
@@ -413,6 +507,66 @@ class DelayImpactRequest(BaseModel):
         return v
 
 
+class JobStatus(str, Enum):
+    """Lifecycle states of a background job"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class JobTask(BaseModel):
+    """One forecast analysis run as a step of a job"""
+    
+    endpoint: Literal[
+        "retirement", "scenario-comparison", "sensitivity-analysis", "delay-impact"
+    ] = Field(..., description="Forecast endpoint whose computation this step runs")
+    payload: Dict[str, Any] = Field(..., description="Request body as for that endpoint")
+
+
+class JobRequest(BaseModel):
+    """Request to run forecast analyses in the background"""
+    
+    tasks: List[JobTask] = Field(
+        ...,
+        min_length=1,
+        max_length=20,
+        description="Analyses run in order; progress is the fraction completed"
+    )
+
+
+class JobStatusResponse(BaseModel):
+    """Status and progress of a background job"""
+    
+    job_id: str
+    status: JobStatus
+    progress: float = Field(description="Fraction of tasks completed (0-1)")
+    tasks_completed: int
+    tasks_total: int
+    created_at: str = Field(description="ISO 8601 UTC timestamp")
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    expires_at: Optional[str] = Field(None, description="When the result is discarded")
+    error: Optional[str] = None
+    result_url: str
+
+
+class JobTaskResult(BaseModel):
+    """Result of one job task, as its endpoint would have returned it"""
+    
+    endpoint: str
+    result: Dict[str, Any]
+
+
+class JobResultResponse(BaseModel):
+    """Results of a succeeded background job"""
+    
+    job_id: str
+    status: JobStatus
+    results: List[JobTaskResult]
+
+
 class ErrorResponse(BaseModel):
     """Standard error response"""
     
@@ -1,10 +1,22 @@
 """
 Retirement forecasting and pension calculation endpoints
 """
-from fastapi import APIRouter, HTTPException
+from contextlib import nullcontext
+from typing import Any, Awaitable, Callable, Dict, Tuple, Type, Union
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel
+
+from app.core.config import settings
 from app.core.logging_config import get_logger
-from app.core.exceptions import ValidationException, CalculationException
+from app.core.exceptions import (
+    ValidationException,
+    CalculationException,
+    ServiceUnavailableException,
+    TooManyRequestsException,
+)
+from app.core.profiling import profile_call, profiling_requested
+from app.core.timing import StageTimer, stage
 from app.models.schemas import (
     RetirementInput,
     RetirementForecastResponse,
@@ -23,10 +35,16 @@ from app.models.schemas import (
     VolatilityIndexRequest,
     VolatilityIndex,
     ConfidenceInterval,
+    SimulationMetadata,
     SensitivityRequest,
     DelayImpactRequest
 )
+from app.services.admission import estimate_cost, get_admission_controller
 from app.services.monte_carlo_simulator import MonteCarloSimulator
+from app.services.path_bank import get_path_bank
+from app.services.result_cache import cache_key, get_result_cache
+from app.services.simulation_executor import get_simulation_executor
+from app.services.single_flight import simulation_flights
 from app.services.financial_calculator import FinancialCalculator
 from app.services.insight_generator import InsightGenerator
 from app.services.annuity_manager import AnnuityManager
@@ -41,57 +59,134 @@ logger = get_logger(__name__)
 insight_generator = InsightGenerator()
 
 
-@router.post("/retirement", response_model=RetirementForecastResponse)
-async def calculate_retirement_forecast(input_data: RetirementInput):
+def _retry_later(e: Union[ServiceUnavailableException, TooManyRequestsException]) -> HTTPException:
+    """503 or 429 response asking the client to retry after a delay"""
+    logger.warning("Rejecting simulation request: %s", e.message)
+    retry_after = getattr(e, "retry_after", 1)
+    return HTTPException(
+        status_code=e.status_code, detail=e.message, headers={"Retry-After": str(retry_after)}
+    )
+
+
+def _served_from_cache(result: Any) -> Any:
+    """Shallow copy of a cached result flagged as served from cache"""
+    if isinstance(result, dict):
+        return {
+            **result,
+            "analysis_metadata": {**result["analysis_metadata"], "served_from_cache": True}
+        }
+    return result.model_copy(update={
+        "simulation": result.simulation.model_copy(update={"served_from_cache": True})
+    })
+
+
+def _with_profile(result: Any, report: Dict[str, Any]) -> Any:
+    """Copy of a result carrying its profile report"""
+    if isinstance(result, dict):
+        return {**result, "profile": report}
+    return result.model_copy(update={"profile": report})
+
+
+async def _admitted(cost: int, run: Callable[[], Awaitable[Any]]) -> Any:
+    """Await run() once the admission controller grants `cost` path-years"""
+    controller = get_admission_controller()
+    if controller is None:
+        return await run()
+    async with controller.admit(cost):
+        return await run()
+
+
+async def _run_simulation(
+    endpoint: str,
+    payload: Any,
+    compute: Callable[[Any], Any],
+    cost: int,
+    profile: bool = False
+) -> Any:
     """
-    Calculate retirement corpus and pension forecast using Monte Carlo simulation
-    
-    Args:
-        input_data: Retirement planning input parameters
+    Serve a simulation request from cache, an identical in-flight run or compute()
     
-    Returns:
-        Complete retirement forecast with corpus projections and pension estimates
+    compute is blocking, so it runs on the bounded simulation executor once
+    the admission controller has granted its cost (path-years); cache hits
+    and coalesced requests cost nothing. Concurrent requests with the same
+    cache key wait on the first one instead of re-simulating. Profiled
+    requests always compute afresh, under cProfile, and bypass the cache
+    and coalescing.
     """
-    try:
-        logger.info(
-            f"Processing retirement forecast: age={input_data.current_age}, "
-            f"retirement={input_data.retirement_age}, "
-            f"contribution={input_data.monthly_contribution}"
-        )
-        
-        # Calculate investment horizon
-        years = input_data.retirement_age - input_data.current_age
-        
-        # Run Monte Carlo simulation
-        simulator = MonteCarloSimulator()
+    if profile:
+        logger.info("Profiling %s request", endpoint)
+        result, report = await _admitted(cost, lambda: get_simulation_executor().run(
+            profile_call, endpoint, compute, payload
+        ))
+        return _with_profile(result, report)
+    
+    key = cache_key(endpoint, payload)
+    cache = get_result_cache()
+    with stage("cache"):
+        cached = cache.get(key) if cache is not None else None
+    if cached is not None:
+        logger.info("Serving %s from cache", endpoint)
+        return _served_from_cache(cached)
+    
+    # Includes waiting for budget, a worker or the in-flight leader
+    with stage("compute"):
+        result, coalesced = await simulation_flights.do(
+            key, lambda: _admitted(cost, lambda: get_simulation_executor().run(compute, payload))
+        )
+    if coalesced:
+        logger.info("Joined in-flight %s simulation", endpoint)
+    elif cache is not None:
+        cache.set(key, result)
+    return result
+
+
+def _compute_retirement_forecast(input_data: RetirementInput) -> RetirementForecastResponse:
+    """Run the retirement forecast simulation (blocking; runs off the event loop)"""
+    logger.info(
+        "Processing retirement forecast: age=%s, retirement=%s, contribution=%s",
+        input_data.current_age, input_data.retirement_age, input_data.monthly_contribution
+    )
+    
+    # Calculate investment horizon
+    years = input_data.retirement_age - input_data.current_age
+    
+    # Run Monte Carlo simulation
+    simulator = MonteCarloSimulator(seed=input_data.seed, path_bank=get_path_bank())
+    with stage("simulation"):
         simulation_results = simulator.simulate_retirement_corpus(
             monthly_contribution=input_data.monthly_contribution,
             years=years,
             risk_profile=input_data.risk_profile,
             annual_income_growth=input_data.annual_income_growth,
-            iterations=input_data.monte_carlo_iterations
+            iterations=input_data.monte_carlo_iterations,
+            target_precision=input_data.target_precision,
+            sampling_method=input_data.sampling_method,
+            control_variate=input_data.control_variate
         )
-        
-        # Calculate total contributions
+    
+    # Calculate total contributions
+    with stage("contributions"):
         total_contributions = FinancialCalculator.calculate_total_contributions(
             initial_monthly_contribution=input_data.monthly_contribution,
             years=years,
             annual_income_growth=input_data.annual_income_growth
         )
-        
-        # Use new AnnuityManager for transparent pension calculations
+    
+    # Use new AnnuityManager for transparent pension calculations
+    with stage("pension"):
         pension_range = AnnuityManager.calculate_pension_range(
             p10_corpus=simulation_results["percentile_10"],
             p50_corpus=simulation_results["percentile_50"],
             p90_corpus=simulation_results["percentile_90"]
         )
-        
-        # Get risk profile details
-        min_return, max_return = FinancialCalculator.get_risk_profile_returns(
-            input_data.risk_profile
-        )
-        
-        # Generate insights
+    
+    # Get risk profile details
+    min_return, max_return = FinancialCalculator.get_risk_profile_returns(
+        input_data.risk_profile
+    )
+    
+    # Generate insights
+    with stage("insights"):
         insights = insight_generator.generate_insights(
             p10=simulation_results["percentile_10"],
             p50=simulation_results["percentile_50"],
@@ -100,8 +195,9 @@ async def calculate_retirement_forecast(input_data: RetirementInput):
             years_to_retirement=years,
             risk_profile=input_data.risk_profile
         )
-        
-        # Build response with extended fields
+    
+    # Build response with extended fields
+    with stage("response"):
         response = RetirementForecastResponse(
             input_parameters=input_data,
             investment_horizon_years=years,
@@ -126,116 +222,212 @@ async def calculate_retirement_forecast(input_data: RetirementInput):
                 "min_return": min_return,
                 "max_return": max_return
             },
-            insights=insights
+            insights=insights,
+            simulation=SimulationMetadata(
+                seed=simulator.seed,
+                iterations_used=simulation_results.get(
+                    "iterations_used", input_data.monte_carlo_iterations
+                ),
+                sampling_method=input_data.sampling_method,
+                achieved_precision=simulation_results.get("achieved_precision"),
+                variance_reduction_factor=simulation_results.get("variance_reduction_factor")
+            )
         )
-        
-        logger.info(
-            f"Forecast completed: corpus_median={simulation_results['percentile_50']:.2f}, "
-            f"pension_median={pension_range['p50']['monthly_pension']:.2f}"
+    
+    logger.info(
+        "Forecast completed: corpus_median=%.2f, pension_median=%.2f",
+        simulation_results["percentile_50"], pension_range["p50"]["monthly_pension"]
+    )
+    
+    return response
+
+
+def _retirement_cost(input_data: RetirementInput) -> int:
+    """Admission cost of a retirement forecast: one simulation to retirement"""
+    return estimate_cost(
+        input_data.monte_carlo_iterations, input_data.retirement_age - input_data.current_age
+    )
+
+
+@router.post("/retirement", response_model=RetirementForecastResponse)
+async def calculate_retirement_forecast(
+    input_data: RetirementInput,
+    response: Response,
+    timings: bool = Query(False, description="Include per-stage timings in the response"),
+    profile: bool = Depends(profiling_requested)
+):
+    """
+    Calculate retirement corpus and pension forecast using Monte Carlo simulation
+    
+    Stage durations are reported in the Server-Timing header (cache,
+    compute, and within compute simulation, contributions, pension,
+    insights and response construction).
+    
+    Args:
+        input_data: Retirement planning input parameters
+        timings: Also return the stage durations as a timings block
+        profile: Run under cProfile and return hotspots (X-Profile or ?profile=true)
+    
+    Returns:
+        Complete retirement forecast with corpus projections and pension estimates
+    """
+    timer = StageTimer.activate()
+    try:
+        forecast = await _run_simulation(
+            "retirement", input_data, _compute_retirement_forecast,
+            _retirement_cost(input_data), profile
         )
         
-        return response
+        if settings.SERVER_TIMING_ENABLED:
+            response.headers["Server-Timing"] = timer.server_timing()
+        if timings:
+            # Copy, so the cached response is never modified
+            forecast = forecast.model_copy(update={"timings": timer.timings()})
+        return forecast
+    
+    except (ServiceUnavailableException, TooManyRequestsException) as e:
+        raise _retry_later(e)
     
     except ValidationException as e:
-        logger.error(f"Validation error: {e.message}")
+        logger.error("Validation error: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=e.message)
     
     except CalculationException as e:
-        logger.error(f"Calculation error: {e.message}")
+        logger.error("Calculation error: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=e.message)
     
     except Exception as e:
-        logger.error(f"Unexpected error in retirement forecast: {str(e)}", exc_info=True)
+        logger.error("Unexpected error in retirement forecast: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+def _compute_scenario_comparison(request: ScenarioComparisonRequest) -> ScenarioComparisonResponse:
+    """Simulate and compare all three risk profiles (blocking; runs off the event loop)"""
+    logger.info("Processing scenario comparison request")
+    
+    base_input = request.base_input
+    years = base_input.retirement_age - base_input.current_age
+    
+    # Calculate total contributions (same for all scenarios)
+    total_contributions = FinancialCalculator.calculate_total_contributions(
+        initial_monthly_contribution=base_input.monthly_contribution,
+        years=years,
+        annual_income_growth=base_input.annual_income_growth
+    )
+    
+    # Run simulations for all risk profiles from one shared draw
+    simulator = MonteCarloSimulator(seed=base_input.seed, path_bank=get_path_bank())
+    scenarios = simulator.simulate_pension_scenarios(
+        monthly_contribution=base_input.monthly_contribution,
+        years=years,
+        annual_income_growth=base_input.annual_income_growth,
+        iterations=base_input.monte_carlo_iterations,
+        target_precision=base_input.target_precision,
+        sampling_method=base_input.sampling_method,
+        control_variate=base_input.control_variate
+    )
+    scenario_results = []
+    
+    for risk_profile, simulation_results in scenarios.items():
+        # Use new AnnuityManager for pension calculations
+        pension_range = AnnuityManager.calculate_pension_range(
+            p10_corpus=simulation_results["percentile_10"],
+            p50_corpus=simulation_results["percentile_50"],
+            p90_corpus=simulation_results["percentile_90"]
+        )
+        
+        # Add to results
+        scenario_results.append(
+            ScenarioResult(
+                risk_profile=risk_profile,
+                corpus_projection=PensionProjection(
+                    percentile_10=simulation_results["percentile_10"],
+                    percentile_25=simulation_results["percentile_25"],
+                    percentile_50=simulation_results["percentile_50"],
+                    percentile_75=simulation_results["percentile_75"],
+                    percentile_90=simulation_results["percentile_90"],
+                    mean=simulation_results["mean"],
+                    std_deviation=simulation_results["std_deviation"]
+                ),
+                pension_estimate=PensionEstimate(
+                    lump_sum_amount=pension_range["p50"]["lump_sum_amount"],
+                    annuity_purchase_amount=pension_range["p50"]["annuity_corpus"],
+                    monthly_pension_10th=pension_range["p10"]["monthly_pension"],
+                    monthly_pension_50th=pension_range["p50"]["monthly_pension"],
+                    monthly_pension_90th=pension_range["p90"]["monthly_pension"]
+                ),
+                # Adaptive runs stop at a different path count per profile
+                simulation=SimulationMetadata(
+                    seed=simulator.seed,
+                    iterations_used=simulation_results.get(
+                        "iterations_used", base_input.monte_carlo_iterations
+                    ),
+                    sampling_method=base_input.sampling_method,
+                    achieved_precision=simulation_results.get("achieved_precision"),
+                    variance_reduction_factor=simulation_results.get("variance_reduction_factor")
+                )
+            )
+        )
+    
+    # Generate comparison insights
+    insights = insight_generator.generate_scenario_comparison_insights(
+        conservative_median=scenarios[RiskProfile.CONSERVATIVE]["percentile_50"],
+        moderate_median=scenarios[RiskProfile.MODERATE]["percentile_50"],
+        aggressive_median=scenarios[RiskProfile.AGGRESSIVE]["percentile_50"],
+        years=years
+    )
+    
+    response = ScenarioComparisonResponse(
+        scenarios=scenario_results,
+        investment_horizon_years=years,
+        total_contributions=total_contributions,
+        insights=insights,
+        simulation=SimulationMetadata(
+            seed=simulator.seed,
+            sampling_method=base_input.sampling_method
+        )
+    )
+    
+    logger.info("Scenario comparison completed successfully")
+    return response
+
+
+def _scenario_comparison_cost(request: ScenarioComparisonRequest) -> int:
+    """Admission cost of a scenario comparison: one simulation per risk profile"""
+    base_input = request.base_input
+    return estimate_cost(
+        base_input.monte_carlo_iterations,
+        base_input.retirement_age - base_input.current_age,
+        len(RiskProfile)
+    )
+
+
 @router.post("/scenario-comparison", response_model=ScenarioComparisonResponse)
-async def compare_scenarios(request: ScenarioComparisonRequest):
+async def compare_scenarios(
+    request: ScenarioComparisonRequest,
+    profile: bool = Depends(profiling_requested)
+):
     """
     Compare retirement forecasts across all three risk profiles
     
     Args:
         request: Base retirement parameters
+        profile: Run under cProfile and return hotspots (X-Profile or ?profile=true)
     
     Returns:
         Comparison of conservative, moderate, and aggressive scenarios
     """
     try:
-        logger.info("Processing scenario comparison request")
-        
-        base_input = request.base_input
-        years = base_input.retirement_age - base_input.current_age
-        
-        # Calculate total contributions (same for all scenarios)
-        total_contributions = FinancialCalculator.calculate_total_contributions(
-            initial_monthly_contribution=base_input.monthly_contribution,
-            years=years,
-            annual_income_growth=base_input.annual_income_growth
+        return await _run_simulation(
+            "scenario-comparison", request, _compute_scenario_comparison,
+            _scenario_comparison_cost(request), profile
         )
-        
-        # Run simulations for all risk profiles
-        simulator = MonteCarloSimulator()
-        scenario_results = []
-        
-        for risk_profile in RiskProfile:
-            logger.info(f"Simulating {risk_profile.value} scenario")
-            
-            # Run simulation
-            simulation_results = simulator.simulate_retirement_corpus(
-                monthly_contribution=base_input.monthly_contribution,
-                years=years,
-                risk_profile=risk_profile,
-                annual_income_growth=base_input.annual_income_growth,
-                iterations=base_input.monte_carlo_iterations
-            )
-            
-            # Use new AnnuityManager for pension calculations
-            pension_range = AnnuityManager.calculate_pension_range(
-                p10_corpus=simulation_results["percentile_10"],
-                p50_corpus=simulation_results["percentile_50"],
-                p90_corpus=simulation_results["percentile_90"]
-            )
-            
-            # Add to results
-            scenario_results.append(
-                ScenarioResult(
-                    risk_profile=risk_profile,
-                    corpus_projection=PensionProjection(
-                        percentile_10=simulation_results["percentile_10"],
-                        percentile_25=simulation_results["percentile_25"],
-                        percentile_50=simulation_results["percentile_50"],
-                        percentile_75=simulation_results["percentile_75"],
-                        percentile_90=simulation_results["percentile_90"],
-                        mean=simulation_results["mean"],
-                        std_deviation=simulation_results["std_deviation"]
-                    ),
-                    pension_estimate=PensionEstimate(
-                        lump_sum_amount=pension_range["p50"]["lump_sum_amount"],
-                        annuity_purchase_amount=pension_range["p50"]["annuity_corpus"],
-                        monthly_pension_10th=pension_range["p10"]["monthly_pension"],
-                        monthly_pension_50th=pension_range["p50"]["monthly_pension"],
-                        monthly_pension_90th=pension_range["p90"]["monthly_pension"]
-                    )
-                )
-            )
-        
-        # Generate comparison insights
-        insights = insight_generator.generate_scenario_comparison_insights(
-            scenario_results
-        )
-        
-        response = ScenarioComparisonResponse(
-            scenarios=scenario_results,
-            investment_horizon_years=years,
-            total_contributions=total_contributions,
-            insights=insights
-        )
-        
-        logger.info("Scenario comparison completed successfully")
-        return response
+    
+    except (ServiceUnavailableException, TooManyRequestsException) as e:
+        raise _retry_later(e)
     
     except Exception as e:
-        logger.error(f"Error in scenario comparison: {str(e)}", exc_info=True)
+        logger.error("Error in scenario comparison: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to compare scenarios")
 
 
@@ -252,8 +444,8 @@ async def calculate_reverse_pension(request: ReversePensionRequest):
     """
     try:
         logger.info(
-            f"Processing reverse pension calculation: "
-            f"desired_pension={request.desired_monthly_pension}"
+            "Processing reverse pension calculation: desired_pension=%s",
+            request.desired_monthly_pension
         )
         
         years = request.retirement_age - request.current_age
@@ -283,10 +475,11 @@ async def calculate_reverse_pension(request: ReversePensionRequest):
         
         # Generate reverse calculator insights
         insights = insight_generator.generate_reverse_calculator_insights(
+            target_pension=request.desired_monthly_pension,
             required_contribution=required_contribution,
-            desired_pension=request.desired_monthly_pension,
-            years=years,
-            risk_profile=request.risk_profile
+            required_corpus=required_corpus,
+            total_investment=total_contributions,
+            years=years
         )
         
         # Generate strategic suggestions
@@ -308,14 +501,14 @@ async def calculate_reverse_pension(request: ReversePensionRequest):
         )
         
         logger.info(
-            f"Reverse calculation completed: "
-            f"required_contribution={required_contribution:.2f}"
+            "Reverse calculation completed: required_contribution=%.2f",
+            required_contribution
         )
         
         return response
     
     except Exception as e:
-        logger.error(f"Error in reverse pension calculation: {str(e)}", exc_info=True)
+        logger.error("Error in reverse pension calculation: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Failed to calculate required contribution"
@@ -340,8 +533,8 @@ async def calculate_readiness_score(request: ReadinessScoreRequest):
     """
     try:
         logger.info(
-            f"Calculating readiness score: median={request.median_corpus:.2f}, "
-            f"required={request.required_corpus:.2f}, years={request.years_to_retirement}"
+            "Calculating readiness score: median=%.2f, required=%.2f, years=%s",
+            request.median_corpus, request.required_corpus, request.years_to_retirement
         )
         
         # Calculate readiness score
@@ -355,14 +548,14 @@ async def calculate_readiness_score(request: ReadinessScoreRequest):
         response = ReadinessScore(**score_data)
         
         logger.info(
-            f"Readiness score calculated: score={score_data['score']}, "
-            f"label={score_data['label']}"
+            "Readiness score calculated: score=%s, label=%s",
+            score_data["score"], score_data["label"]
         )
         
         return response
     
     except Exception as e:
-        logger.error(f"Error calculating readiness score: {str(e)}", exc_info=True)
+        logger.error("Error calculating readiness score: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Failed to calculate readiness score"
@@ -387,8 +580,8 @@ async def calculate_volatility_index(request: VolatilityIndexRequest):
     """
     try:
         logger.info(
-            f"Calculating volatility index: std_dev={request.standard_deviation:.2f}, "
-            f"mean={request.mean_corpus:.2f}"
+            "Calculating volatility index: std_dev=%.2f, mean=%.2f",
+            request.standard_deviation, request.mean_corpus
         )
         
         # Calculate volatility index
@@ -400,69 +593,135 @@ async def calculate_volatility_index(request: VolatilityIndexRequest):
         response = VolatilityIndex(**volatility_data)
         
         logger.info(
-            f"Volatility index calculated: {volatility_data['volatility_percentage']:.2f}%, "
-            f"level={volatility_data['volatility_level']}"
+            "Volatility index calculated: %.2f%%, level=%s",
+            volatility_data["volatility_percentage"], volatility_data["volatility_level"]
         )
         
         return response
     
     except Exception as e:
-        logger.error(f"Error calculating volatility index: {str(e)}", exc_info=True)
+        logger.error("Error calculating volatility index: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Failed to calculate volatility index"
         )
 
+
+def _compute_sensitivity_analysis(request: SensitivityRequest) -> Dict[str, Any]:
+    """Run the contribution sensitivity analysis (blocking; runs off the event loop)"""
+    logger.info(
+        "Processing sensitivity analysis: age=%s, contribution=%s",
+        request.current_age, request.monthly_contribution
+    )
+    
+    years = request.retirement_age - request.current_age
+    
+    result = SensitivityAnalyzer.analyze_contribution_sensitivity(
+        base_monthly_contribution=request.monthly_contribution,
+        years=years,
+        risk_profile=request.risk_profile,
+        annual_income_growth=request.annual_income_growth,
+        scenarios=request.scenarios,
+        iterations=request.monte_carlo_iterations,
+        seed=request.seed,
+        sampling_method=request.sampling_method
+    )
+    
+    logger.info(
+        "Sensitivity analysis completed: %s scenarios analyzed", len(result["sensitivity_scenarios"])
+    )
+    
+    result["analysis_metadata"]["served_from_cache"] = False
+    return result
+
+
+def _sensitivity_analysis_cost(request: SensitivityRequest) -> int:
+    """Admission cost of a sensitivity analysis: all scenarios share one simulation"""
+    return estimate_cost(
+        request.monte_carlo_iterations, request.retirement_age - request.current_age
+    )
+
+
 @router.post("/sensitivity-analysis")
-async def sensitivity_analysis(request: SensitivityRequest):
+async def sensitivity_analysis(
+    request: SensitivityRequest,
+    profile: bool = Depends(profiling_requested)
+):
     """
     Analyze impact of contribution increases on retirement corpus
     
-    Simulates contribution increases of +5%, +10%, and +20% to show
-    the impact on final corpus and pension amounts.
+    Evaluates contribution changes (default +5%, +10%, and +20%) to show
+    the impact on final corpus and pension amounts. All scenarios are
+    derived from a single simulation, so long scenario lists are cheap.
     
     Args:
         request: Current parameters with age, retirement age, contribution, risk profile
+        profile: Run under cProfile and return hotspots (X-Profile or ?profile=true)
     
     Returns:
         Sensitivity analysis showing base and adjusted scenarios with impact metrics
     """
     try:
-        logger.info(
-            f"Processing sensitivity analysis: age={request.current_age}, "
-            f"contribution={request.monthly_contribution}"
-        )
-        
-        years = request.retirement_age - request.current_age
-        
-        result = SensitivityAnalyzer.analyze_contribution_sensitivity(
-            base_monthly_contribution=request.monthly_contribution,
-            years=years,
-            risk_profile=request.risk_profile,
-            annual_income_growth=request.annual_income_growth,
-            iterations=request.monte_carlo_iterations
-        )
-        
-        logger.info(
-            f"Sensitivity analysis completed: {len(result['sensitivity_scenarios'])} scenarios analyzed"
+        return await _run_simulation(
+            "sensitivity-analysis", request, _compute_sensitivity_analysis,
+            _sensitivity_analysis_cost(request), profile
         )
-        
-        return result
     
-    except CalculationException as e:
-        logger.error(f"Calculation error in sensitivity: {e.message}")
+    except (ServiceUnavailableException, TooManyRequestsException) as e:
+        raise _retry_later(e)
+    
+    except (ValidationException, CalculationException) as e:
+        logger.error("Calculation error in sensitivity: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=e.message)
     
     except Exception as e:
-        logger.error(f"Error in sensitivity analysis: {str(e)}", exc_info=True)
+        logger.error("Error in sensitivity analysis: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Failed to analyze contribution sensitivity"
         )
 
 
+def _compute_delay_impact(request: DelayImpactRequest) -> Dict[str, Any]:
+    """Run the retirement delay impact analysis (blocking; runs off the event loop)"""
+    logger.info(
+        "Processing delay impact analysis: current_age=%s, planned_retirement_age=%s",
+        request.current_age, request.planned_retirement_age
+    )
+    
+    result = DelaySimulator.simulate_retirement_delay(
+        base_retirement_age=request.planned_retirement_age,
+        current_age=request.current_age,
+        monthly_contribution=request.monthly_contribution,
+        risk_profile=request.risk_profile,
+        annual_income_growth=request.annual_income_growth,
+        iterations=request.monte_carlo_iterations,
+        seed=request.seed,
+        sampling_method=request.sampling_method
+    )
+    
+    logger.info(
+        "Delay impact analysis completed: %s scenarios analyzed", len(result["delay_scenarios"])
+    )
+    
+    result["analysis_metadata"]["served_from_cache"] = False
+    return result
+
+
+def _delay_impact_cost(request: DelayImpactRequest) -> int:
+    """Admission cost of a delay analysis: one simulation of the longest delayed horizon"""
+    return estimate_cost(
+        request.monte_carlo_iterations,
+        request.planned_retirement_age - request.current_age
+        + max(DelaySimulator.DEFAULT_DELAY_SCENARIOS)
+    )
+
+
 @router.post("/delay-impact")
-async def retirement_delay_impact(request: DelayImpactRequest):
+async def retirement_delay_impact(
+    request: DelayImpactRequest,
+    profile: bool = Depends(profiling_requested)
+):
     """
     Simulate impact of delaying retirement on corpus and pension
     
@@ -471,38 +730,64 @@ async def retirement_delay_impact(request: DelayImpactRequest):
     
     Args:
         request: Current parameters with age, continuation, retirement age target
+        profile: Run under cProfile and return hotspots (X-Profile or ?profile=true)
     
     Returns:
         Delay impact analysis showing base scenario and delay scenarios with benefits
     """
     try:
-        logger.info(
-            f"Processing delay impact analysis: current_age={request.current_age}, "
-            f"planned_retirement_age={request.planned_retirement_age}"
-        )
-        
-        result = DelaySimulator.simulate_retirement_delay(
-            base_retirement_age=request.planned_retirement_age,
-            current_age=request.current_age,
-            monthly_contribution=request.monthly_contribution,
-            risk_profile=request.risk_profile,
-            annual_income_growth=request.annual_income_growth,
-            iterations=request.monte_carlo_iterations
+        return await _run_simulation(
+            "delay-impact", request, _compute_delay_impact,
+            _delay_impact_cost(request), profile
         )
-        
-        logger.info(
-            f"Delay impact analysis completed: {len(result['delay_scenarios'])} scenarios analyzed"
-        )
-        
-        return result
+    
+    except (ServiceUnavailableException, TooManyRequestsException) as e:
+        raise _retry_later(e)
     
     except CalculationException as e:
-        logger.error(f"Calculation error in delay analysis: {e.message}")
+        logger.error("Calculation error in delay analysis: %s", e.message)
         raise HTTPException(status_code=e.status_code, detail=e.message)
     
     except Exception as e:
-        logger.error(f"Error in delay impact analysis: {str(e)}", exc_info=True)
+        logger.error("Error in delay impact analysis: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Failed to analyze retirement delay impact"
-        )
\ No newline at end of file
+        )
+
+# Request model, blocking computation and admission cost of each simulation endpoint
+SIMULATIONS: Dict[str, Tuple[Type[BaseModel], Callable[[Any], Any], Callable[[Any], int]]] = {
+    "retirement": (RetirementInput, _compute_retirement_forecast, _retirement_cost),
+    "scenario-comparison": (
+        ScenarioComparisonRequest, _compute_scenario_comparison, _scenario_comparison_cost
+    ),
+    "sensitivity-analysis": (
+        SensitivityRequest, _compute_sensitivity_analysis, _sensitivity_analysis_cost
+    ),
+    "delay-impact": (DelayImpactRequest, _compute_delay_impact, _delay_impact_cost),
+}
+
+
+def compute_simulation(endpoint: str, payload: BaseModel) -> Any:
+    """
+    Blocking counterpart of _run_simulation for background jobs
+    
+    Shares the result cache with the synchronous endpoints. A miss waits
+    for its cost on the admission controller and runs on the simulation
+    executor, so job steps count against the same budget and workers as
+    interactive requests.
+    """
+    key = cache_key(endpoint, payload)
+    cache = get_result_cache()
+    cached = cache.get(key) if cache is not None else None
+    if cached is not None:
+        logger.info("Serving %s job step from cache", endpoint)
+        return _served_from_cache(cached)
+    
+    _, compute, cost = SIMULATIONS[endpoint]
+    controller = get_admission_controller()
+    with controller.hold(cost(payload)) if controller is not None else nullcontext():
+        result = get_simulation_executor().call(compute, payload)
+    if cache is not None:
+        cache.set(key, result)
+    return result
@@ -6,6 +6,12 @@ from fastapi import APIRouter
 
 from app.core.config import settings
 from app.models.schemas import HealthCheckResponse
+from app.services.admission import get_admission_controller
+from app.services.job_manager import get_job_manager
+from app.services.path_bank import get_path_bank
+from app.services.result_cache import get_result_cache
+from app.services.simulation_executor import get_simulation_executor
+from app.services.single_flight import simulation_flights
 
 router = APIRouter(tags=["Health"])
 
@@ -25,6 +31,28 @@ async def health_check():
     )
 
 
+@router.get("/health/stats")
+async def simulation_stats():
+    """
+    Counters for the simulation serving layers
+    
+    Returns:
+        Result cache, request coalescing, admission, executor, job and path
+        bank statistics (null when a layer is disabled)
+    """
+    result_cache = get_result_cache()
+    admission = get_admission_controller()
+    path_bank = get_path_bank()
+    return {
+        "result_cache": result_cache.stats() if result_cache is not None else None,
+        "single_flight": simulation_flights.stats(),
+        "admission": admission.stats() if admission is not None else None,
+        "executor": get_simulation_executor().stats(),
+        "jobs": get_job_manager().stats(),
+        "path_bank": path_bank.stats() if path_bank is not None else None,
+    }
+
+
 @router.get("/")
 async def root():
     """
@@ -0,0 +1,183 @@
+"""
+Background job endpoints for long-running forecast analyses
+"""
+from datetime import datetime, timezone
+from typing import Any, Callable, List, Optional
+
+from fastapi import APIRouter, Header, HTTPException, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.core.exceptions import ConflictException, TooManyRequestsException
+from app.models.schemas import (
+    JobRequest,
+    JobResultResponse,
+    JobStatus,
+    JobStatusResponse,
+    JobTaskResult
+)
+from app.routes.forecast import SIMULATIONS, compute_simulation
+from app.services.job_manager import Job, get_job_manager
+from app.services.result_cache import cache_key
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+logger = get_logger(__name__)
+
+
+def _timestamp(seconds: Optional[float]) -> Optional[str]:
+    if seconds is None:
+        return None
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat()
+
+
+def _job_url(job: Job) -> str:
+    return f"{settings.API_V1_PREFIX}/jobs/{job.job_id}"
+
+
+def _status(job: Job) -> JobStatusResponse:
+    return JobStatusResponse(
+        job_id=job.job_id,
+        status=job.status,
+        progress=job.progress,
+        tasks_completed=job.steps_completed,
+        tasks_total=len(job.labels),
+        created_at=_timestamp(job.created_at),
+        started_at=_timestamp(job.started_at),
+        finished_at=_timestamp(job.finished_at),
+        expires_at=_timestamp(job.expires_at),
+        error=job.error,
+        result_url=f"{_job_url(job)}/result"
+    )
+
+
+def _get_job(job_id: str) -> Job:
+    job = get_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job
+
+
+def _validate_payloads(request: JobRequest) -> List[BaseModel]:
+    """
+    Validate each task's payload against its endpoint's request model
+    
+    Errors are reported like FastAPI's own, located under the task.
+    """
+    payloads = []
+    for index, task in enumerate(request.tasks):
+        model, _, _ = SIMULATIONS[task.endpoint]
+        try:
+            payloads.append(model.model_validate(task.payload))
+        except ValidationError as e:
+            raise RequestValidationError([
+                {**error, "loc": ("body", "tasks", index, "payload", *error["loc"])}
+                for error in e.errors(include_url=False, include_context=False)
+            ])
+    return payloads
+
+
+def _step(endpoint: str, payload: BaseModel) -> Callable[[], Any]:
+    """Job step computing one task, JSON-encoded so it can be persisted"""
+    return lambda: jsonable_encoder(compute_simulation(endpoint, payload))
+
+
+@router.post("", response_model=JobStatusResponse, status_code=202)
+async def submit_job(
+    request: JobRequest,
+    response: Response,
+    idempotency_key: Optional[str] = Header(
+        None, max_length=255, description="Retries with the same key return the same job"
+    )
+):
+    """
+    Run forecast analyses in the background and return a job ID at once
+    
+    Poll the Location URL for status and progress, then fetch the results
+    from result_url. Results are kept for JOBS_RESULT_TTL_SECONDS after the
+    job finishes.
+    
+    Args:
+        request: Analyses to run, each an endpoint name and its request body
+        idempotency_key: Identifies retries of this submission
+    
+    Returns:
+        Status of the new job, or of the existing job for a known key
+    """
+    payloads = _validate_payloads(request)
+    endpoints = [task.endpoint for task in request.tasks]
+    fingerprint = cache_key("jobs", [
+        {"endpoint": endpoint, "payload": payload.model_dump(mode="json")}
+        for endpoint, payload in zip(endpoints, payloads)
+    ])
+    
+    try:
+        job, created = get_job_manager().submit(
+            endpoints,
+            [_step(endpoint, payload) for endpoint, payload in zip(endpoints, payloads)],
+            idempotency_key=idempotency_key,
+            fingerprint=fingerprint
+        )
+    except ConflictException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except TooManyRequestsException as e:
+        logger.warning("Rejecting job: %s", e.message)
+        raise HTTPException(
+            status_code=e.status_code, detail=e.message,
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    
+    response.headers["Location"] = _job_url(job)
+    if not created:
+        response.headers["Idempotent-Replayed"] = "true"
+    return _status(job)
+
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+async def get_job(job_id: str):
+    """
+    Status and progress of a job
+    
+    Returns:
+        Job status; 404 when unknown or expired
+    """
+    return _status(_get_job(job_id))
+
+
+@router.get("/{job_id}/result", response_model=JobResultResponse)
+async def get_job_result(job_id: str):
+    """
+    Results of a succeeded job, one per task in submission order
+    
+    Returns:
+        Task results; 409 while the job is unfinished or when it did not succeed
+    """
+    job = _get_job(job_id)
+    if job.status != JobStatus.SUCCEEDED:
+        detail = f"Job is {job.status.value}"
+        raise HTTPException(status_code=409, detail=f"{detail}: {job.error}" if job.error else detail)
+    
+    return JobResultResponse(
+        job_id=job.job_id,
+        status=job.status,
+        results=[
+            JobTaskResult(endpoint=endpoint, result=result)
+            for endpoint, result in zip(job.labels, job.results)
+        ]
+    )
+
+
+@router.delete("/{job_id}", response_model=JobStatusResponse)
+async def cancel_job(job_id: str):
+    """
+    Cancel a queued or running job; a running job stops before its next task
+    
+    Returns:
+        Job status after the request; finished jobs are unchanged
+    """
+    job = get_job_manager().cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return _status(job)
@@ -0,0 +1,20 @@
+"""
+Prometheus metrics endpoint
+"""
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.core.metrics import CONTENT_TYPE, REGISTRY
+
+router = APIRouter(tags=["Health"])
+
+
+@router.get("/metrics", response_class=Response)
+async def metrics():
+    """
+    Request, simulation, cache and executor metrics
+    
+    Returns:
+        All metrics of this process in the Prometheus text exposition format
+    """
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
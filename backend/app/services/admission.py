@@ -0,0 +1,247 @@
+"""
+Admission control for simulation requests
+Bounds the total simulation work in flight, so a few very large requests
+cannot starve everyone else
+"""
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+from app.core.config import settings
+from app.core.exceptions import TooManyRequestsException
+from app.core.metrics import REGISTRY, stat_family
+
+
+def estimate_cost(iterations: Optional[int], years: int, simulations: int = 1) -> int:
+    """
+    Work of a request in path-years: iterations x years x simulations run
+    
+    The simulation kernels are linear in paths and years, so this tracks
+    their wall time closely. Adaptive runs are charged their upper bound.
+    """
+    iterations = iterations or settings.DEFAULT_MONTE_CARLO_ITERATIONS
+    return max(1, iterations * years * simulations)
+
+
+class AdmissionController:
+    """
+    Global cost budget with a bounded FIFO wait queue
+    
+    A request is admitted when its cost fits in the unused budget and no
+    earlier request is waiting. Otherwise it waits, at most `queue_timeout`
+    seconds and behind at most `queue_limit` others; beyond that it is
+    rejected with TooManyRequestsException (429) and a Retry-After hint.
+    A request costing more than the whole budget is clamped to it, so it
+    still runs, alone.
+    
+    Waiters are woken from whichever event loop or thread releases budget,
+    so one controller can be shared by several loops (e.g. test clients)
+    and by worker threads through hold().
+    """
+    
+    # Upper bound on the Retry-After hint in seconds
+    MAX_RETRY_AFTER = 60
+    
+    def __init__(self, budget: int, queue_limit: int = 64, queue_timeout: float = 10.0):
+        """
+        Initialize the controller
+        
+        Args:
+            budget: Path-years allowed in flight at once
+            queue_limit: Requests allowed to wait for budget
+            queue_timeout: Seconds a request waits before it is rejected
+        """
+        if budget < 1:
+            raise ValueError("Admission budget must be positive")
+        
+        self.budget = budget
+        self.queue_limit = queue_limit
+        self.queue_timeout = queue_timeout
+        self._lock = threading.Lock()
+        # (cost, wake) of waiting requests, oldest first; wake() is thread-safe
+        self._waiters: Deque[Tuple[int, Callable[[], Any]]] = deque()
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        # Moving average of how long admitted requests hold their budget
+        self._average_hold = 1.0
+    
+    @asynccontextmanager
+    async def admit(self, cost: int) -> AsyncIterator[None]:
+        """
+        Hold `cost` of the budget for the duration of the block
+        
+        Raises:
+            TooManyRequestsException: When the queue is full or the wait times out
+        """
+        cost = min(cost, self.budget)
+        await self._acquire(cost)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._release(cost, time.perf_counter() - start)
+    
+    @contextmanager
+    def hold(self, cost: int) -> Iterator[None]:
+        """
+        Blocking counterpart of admit() for worker threads, e.g. background jobs
+        
+        Waits in the same FIFO queue, but for as long as it takes: background
+        work is bounded by its own pool, so it is neither timed out nor shed.
+        """
+        cost = min(cost, self.budget)
+        with self._lock:
+            if not self._waiters and self.in_flight + cost <= self.budget:
+                self.in_flight += cost
+                self.admitted += 1
+                granted = None
+            else:
+                granted = threading.Event()
+                self._waiters.append((cost, granted.set))
+        if granted is not None:
+            granted.wait()
+        
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._release(cost, time.perf_counter() - start)
+    
+    async def _acquire(self, cost: int) -> None:
+        with self._lock:
+            if not self._waiters and self.in_flight + cost <= self.budget:
+                self.in_flight += cost
+                self.admitted += 1
+                return
+            if len(self._waiters) >= self.queue_limit:
+                raise self._reject(cost, "Simulation budget exhausted, please retry later")
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            waiter = (cost, partial(loop.call_soon_threadsafe, _grant, future))
+            self._waiters.append(waiter)
+        
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    # Requests behind this one may fit now
+                    self._wake_waiters()
+                    if isinstance(e, asyncio.CancelledError):
+                        raise
+                    raise self._reject(cost, "Timed out waiting for simulation budget") from None
+            # Budget was granted while timing out; a cancelled request returns it
+            if isinstance(e, asyncio.CancelledError):
+                self._release(cost, 0.0)
+                raise
+    
+    def _release(self, cost: int, held: float) -> None:
+        with self._lock:
+            self.in_flight -= cost
+            if held:
+                self._average_hold += 0.2 * (held - self._average_hold)
+            self._wake_waiters()
+    
+    def _wake_waiters(self) -> None:
+        """Grant budget to waiters in order while the oldest fits; holds the lock"""
+        while self._waiters and self.in_flight + self._waiters[0][0] <= self.budget:
+            cost, wake = self._waiters.popleft()
+            self.in_flight += cost
+            self.admitted += 1
+            wake()
+    
+    def _reject(self, cost: int, message: str) -> TooManyRequestsException:
+        """Count a rejection and build its exception; holds the lock"""
+        self.rejected += 1
+        backlog = sum(waiting for waiting, _ in self._waiters)
+        # Roughly how long until the budget ahead of this request drains
+        retry_after = math.ceil(self._average_hold * (1 + (backlog + cost) / self.budget))
+        return TooManyRequestsException(
+            message,
+            retry_after=min(max(1, retry_after), self.MAX_RETRY_AFTER),
+            details={"cost": cost, "budget": self.budget, "queued": len(self._waiters)}
+        )
+    
+    def stats(self) -> Dict[str, Any]:
+        """Budget usage and queue counters"""
+        with self._lock:
+            return {
+                "budget": self.budget,
+                "in_flight": self.in_flight,
+                "queued": len(self._waiters),
+                "queued_cost": sum(cost for cost, _ in self._waiters),
+                "queue_limit": self.queue_limit,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+            }
+
+
+def _grant(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+_admission_controller: Optional[AdmissionController] = None
+_admission_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> Optional[AdmissionController]:
+    """Return the shared controller, or None when admission control is disabled"""
+    global _admission_controller
+    if not settings.ADMISSION_CONTROL_ENABLED:
+        return None
+    with _admission_controller_lock:
+        if _admission_controller is None:
+            _admission_controller = AdmissionController(
+                budget=settings.ADMISSION_BUDGET,
+                queue_limit=settings.ADMISSION_QUEUE_LIMIT,
+                queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS
+            )
+        return _admission_controller
+
+
+def _collect_metrics():
+    """Shared controller budget usage for /metrics"""
+    if _admission_controller is None:
+        return []
+    stats = _admission_controller.stats()
+    return [
+        stat_family(
+            "admission_budget_path_years", "gauge",
+            "Simulation budget in path-years", stats["budget"]
+        ),
+        stat_family(
+            "admission_in_flight_path_years", "gauge",
+            "Path-years of admitted simulations still running", stats["in_flight"]
+        ),
+        stat_family(
+            "admission_budget_utilization", "gauge",
+            "Fraction of the simulation budget in use", stats["in_flight"] / stats["budget"]
+        ),
+        stat_family(
+            "admission_queue_depth", "gauge",
+            "Requests waiting for simulation budget", stats["queued"]
+        ),
+        stat_family(
+            "admission_queued_path_years", "gauge",
+            "Path-years of requests waiting for simulation budget", stats["queued_cost"]
+        ),
+        stat_family(
+            "admission_admitted_total", "counter",
+            "Requests admitted by the admission controller", stats["admitted"]
+        ),
+        stat_family(
+            "admission_rejected_total", "counter",
+            "Requests rejected with 429 by the admission controller", stats["rejected"]
+        ),
+    ]
+
+
+REGISTRY.register_collector(_collect_metrics)
@@ -58,7 +58,7 @@ class AnnuityManager:
             }
         
         except Exception as e:
-            logger.error(f"Error allocating corpus: {str(e)}")
+            logger.error("Error allocating corpus: %s", e)
             raise CalculationException(
                 "Failed to allocate corpus between annuity and lump sum",
                 details={"error": str(e)}
@@ -107,7 +107,7 @@ class AnnuityManager:
             }
         
         except Exception as e:
-            logger.error(f"Error calculating monthly pension: {str(e)}")
+            logger.error("Error calculating monthly pension: %s", e)
             raise CalculationException(
                 "Failed to calculate monthly pension",
                 details={"error": str(e)}
@@ -143,7 +143,7 @@ class AnnuityManager:
             return percentiles
         
         except Exception as e:
-            logger.error(f"Error calculating pension range: {str(e)}")
+            logger.error("Error calculating pension range: %s", e)
             raise CalculationException(
                 "Failed to calculate pension range",
                 details={"error": str(e)}
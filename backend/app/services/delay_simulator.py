@@ -3,7 +3,9 @@ Retirement delay impact simulator
 Simulates the financial benefit of delaying retirement
 """
 from typing import Dict, List
+from app.models.schemas import SamplingMethod
 from app.services.monte_carlo_simulator import MonteCarloSimulator
+from app.services.path_bank import get_path_bank
 from app.services.annuity_manager import AnnuityManager
 from app.core.logging_config import get_logger
 from app.core.exceptions import CalculationException
@@ -25,11 +27,16 @@ class DelaySimulator:
         risk_profile: str,
         annual_income_growth: float = 0.0,
         delay_years: List[int] = None,
-        iterations: int = None
+        iterations: int = None,
+        seed: int = None,
+        sampling_method: SamplingMethod = SamplingMethod.UNIFORM
     ) -> Dict:
         """
         Simulate impact of delaying retirement on corpus and pension
         
+        All horizons come from a single simulation of the longest one, so the
+        base and delay scenarios share return paths.
+        
         Args:
             base_retirement_age: Original planned retirement age
             current_age: Current age
@@ -38,6 +45,8 @@ class DelaySimulator:
             annual_income_growth: Annual contribution growth
             delay_years: Years to delay (default [1, 2, 5])
             iterations: MC simulation iterations
+            seed: Random seed for reproducible simulations
+            sampling_method: Sampling scheme for return paths
         
         Returns:
             Dictionary with:
@@ -49,39 +58,35 @@ class DelaySimulator:
             if delay_years is None:
                 delay_years = DelaySimulator.DEFAULT_DELAY_SCENARIOS
             
-            simulator = MonteCarloSimulator()
+            simulator = MonteCarloSimulator(seed=seed, path_bank=get_path_bank())
             
-            # Run base scenario (original retirement age)
+            # Simulate the longest horizon once and checkpoint every scenario
             base_years = base_retirement_age - current_age
-            logger.info(f"Simulating delay analysis: base age={base_retirement_age}, years={base_years}")
+            logger.info("Simulating delay analysis: base age=%s, years=%s", base_retirement_age, base_years)
             
-            base_results = simulator.simulate_retirement_corpus(
+            horizon_results = simulator.simulate_horizons(
                 monthly_contribution=monthly_contribution,
-                years=base_years,
+                horizons=[base_years] + [base_years + delay for delay in delay_years],
                 risk_profile=risk_profile,
                 annual_income_growth=annual_income_growth,
-                iterations=iterations
+                iterations=iterations,
+                sampling_method=sampling_method
             )
+            base_results = horizon_results[base_years]
             
             # Calculate base pension
             base_pension = AnnuityManager.calculate_monthly_pension(
                 base_results["percentile_50"]
             )
             
-            # Run delay scenarios
+            # Read delay scenarios from the checkpoints
             delay_results = []
             
             for delay in delay_years:
                 new_retirement_age = base_retirement_age + delay
                 new_horizon_years = new_retirement_age - current_age
                 
-                scenario_results = simulator.simulate_retirement_corpus(
-                    monthly_contribution=monthly_contribution,
-                    years=new_horizon_years,
-                    risk_profile=risk_profile,
-                    annual_income_growth=annual_income_growth,
-                    iterations=iterations
-                )
+                scenario_results = horizon_results[new_horizon_years]
                 
                 # Calculate pension for delay scenario
                 delay_pension = AnnuityManager.calculate_monthly_pension(
@@ -116,8 +121,9 @@ class DelaySimulator:
                 delay_results.append(impact)
                 
                 logger.info(
-                    f"Delay +{delay}yr: retirement at {new_retirement_age}, corpus p50={scenario_results['percentile_50']:.2f}, "
-                    f"pension_increase={impact['benefit_analysis']['monthly_pension_percentage_increase']:.1f}%"
+                    "Delay +%syr: retirement at %s, corpus p50=%.2f, pension_increase=%.1f%%",
+                    delay, new_retirement_age, scenario_results["percentile_50"],
+                    impact["benefit_analysis"]["monthly_pension_percentage_increase"]
                 )
             
             return {
@@ -133,12 +139,14 @@ class DelaySimulator:
                     "monthly_contribution": monthly_contribution,
                     "risk_profile": risk_profile,
                     "annual_income_growth": annual_income_growth,
-                    "scenarios_tested": delay_years
+                    "scenarios_tested": delay_years,
+                    "seed": simulator.seed,
+                    "sampling_method": SamplingMethod(sampling_method).value
                 }
             }
         
         except Exception as e:
-            logger.error(f"Error in delay impact simulation: {str(e)}")
+            logger.error("Error in delay impact simulation: %s", e)
             raise CalculationException(
                 "Failed to simulate retirement delay impact",
                 details={"error": str(e)}
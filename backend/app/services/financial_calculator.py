@@ -78,7 +78,7 @@ class FinancialCalculator:
             return corpus
         
         except Exception as e:
-            logger.error(f"Error in deterministic corpus calculation: {str(e)}")
+            logger.error("Error in deterministic corpus calculation: %s", e)
             raise CalculationException(
                 "Failed to calculate retirement corpus",
                 details={"error": str(e)}
@@ -106,7 +106,7 @@ class FinancialCalculator:
             return total
         
         except Exception as e:
-            logger.error(f"Error calculating total contributions: {str(e)}")
+            logger.error("Error calculating total contributions: %s", e)
             raise CalculationException(
                 "Failed to calculate total contributions",
                 details={"error": str(e)}
@@ -146,7 +146,7 @@ class FinancialCalculator:
             return lump_sum, annuity_corpus, monthly_pension
         
         except Exception as e:
-            logger.error(f"Error calculating pension: {str(e)}")
+            logger.error("Error calculating pension: %s", e)
             raise CalculationException(
                 "Failed to calculate pension estimate",
                 details={"error": str(e)}
@@ -215,7 +215,7 @@ class FinancialCalculator:
             return mid_contribution, required_total_corpus
         
         except Exception as e:
-            logger.error(f"Error in reverse calculation: {str(e)}")
+            logger.error("Error in reverse calculation: %s", e)
             raise CalculationException(
                 "Failed to calculate required contribution",
                 details={"error": str(e)}
@@ -66,7 +66,7 @@ class InsightGenerator:
         # 6. Goal Achievement Insight
         insights.extend(self._generate_goal_insight(p50, total_contributions))
         
-        logger.info(f"Generated {len(insights)} insights for projection")
+        logger.info("Generated %s insights for projection", len(insights))
         return insights
     
     def _generate_risk_interpretation(
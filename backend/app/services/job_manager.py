@@ -0,0 +1,368 @@
+"""
+Background simulation jobs
+Runs long analyses on an in-process worker pool and keeps their results
+for a fixed time, optionally on local disk
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.exceptions import ConflictException, TooManyRequestsException
+from app.core.logging_config import get_logger
+from app.core.metrics import REGISTRY, stat_family
+from app.models.schemas import JobStatus
+
+logger = get_logger(__name__)
+
+FINISHED = (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class Job:
+    """State of one job: a list of steps run in order"""
+    
+    def __init__(
+        self,
+        job_id: str,
+        labels: List[str],
+        created_at: float,
+        idempotency_key: Optional[str] = None,
+        fingerprint: str = ""
+    ):
+        self.job_id = job_id
+        # One label per step, e.g. the forecast endpoint it runs
+        self.labels = labels
+        self.created_at = created_at
+        self.idempotency_key = idempotency_key
+        self.fingerprint = fingerprint
+        self.status = JobStatus.QUEUED
+        self.results: List[Any] = []
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.expires_at: Optional[float] = None
+        self.cancel_requested = False
+    
+    @property
+    def steps_completed(self) -> int:
+        return len(self.results)
+    
+    @property
+    def progress(self) -> float:
+        """Fraction of steps completed"""
+        if self.status == JobStatus.SUCCEEDED:
+            return 1.0
+        return self.steps_completed / len(self.labels)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "labels": self.labels,
+            "created_at": self.created_at,
+            "idempotency_key": self.idempotency_key,
+            "fingerprint": self.fingerprint,
+            "status": self.status.value,
+            "results": self.results,
+            "error": self.error,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "expires_at": self.expires_at,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Job":
+        job = cls(
+            data["job_id"], data["labels"], data["created_at"],
+            data["idempotency_key"], data["fingerprint"]
+        )
+        job.status = JobStatus(data["status"])
+        job.results = data["results"]
+        job.error = data["error"]
+        job.started_at = data["started_at"]
+        job.finished_at = data["finished_at"]
+        job.expires_at = data["expires_at"]
+        return job
+
+
+class JobManager:
+    """
+    Thread pool of background jobs with result retention and idempotency keys
+    
+    Each job is a list of blocking steps; progress is the fraction of steps
+    completed. Finished jobs, and the idempotency keys that created them,
+    are kept for `ttl_seconds`. Submitting again with a known key returns
+    the existing job instead of starting another; reusing a key for a
+    different request is a conflict.
+    
+    With a storage directory every state change is written there as JSON,
+    so finished results survive a restart. Jobs still queued or running
+    when the process stopped are reloaded as failed.
+    """
+    
+    def __init__(
+        self,
+        workers: int = 2,
+        ttl_seconds: float = 3600.0,
+        max_pending: int = 100,
+        storage_dir: str = "",
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize the pool
+        
+        Args:
+            workers: Jobs run at once
+            ttl_seconds: Lifetime of a finished job and its result
+            max_pending: Queued plus running jobs accepted before rejecting
+            storage_dir: Persist jobs here, "" = memory only
+            clock: Wall-clock time source (seconds); persisted across restarts
+        """
+        self.workers = workers
+        self.ttl_seconds = ttl_seconds
+        self.max_pending = max_pending
+        self.storage_dir = Path(storage_dir) if storage_dir else None
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Job] = {}
+        self._futures: Dict[str, Future] = {}
+        self._idempotency: Dict[str, str] = {}
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.expired = 0
+        
+        if self.storage_dir is not None:
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
+            self._load()
+    
+    def submit(
+        self,
+        labels: List[str],
+        steps: List[Callable[[], Any]],
+        idempotency_key: Optional[str] = None,
+        fingerprint: str = ""
+    ) -> Tuple[Job, bool]:
+        """
+        Queue a job running steps in order; their results become the job's
+        
+        Args:
+            labels: One label per step
+            steps: Blocking callables returning JSON-serialisable results
+            idempotency_key: Client key identifying retries of one request
+            fingerprint: Hash of the request, compared on key reuse
+        
+        Returns:
+            (job, created); created is False when the key matched an existing job
+        
+        Raises:
+            ConflictException: When the key was used for a different request
+            TooManyRequestsException: When max_pending jobs are unfinished
+        """
+        with self._lock:
+            self._purge_expired()
+            
+            if idempotency_key is not None and idempotency_key in self._idempotency:
+                job = self._jobs[self._idempotency[idempotency_key]]
+                if job.fingerprint != fingerprint:
+                    raise ConflictException(
+                        "Idempotency-Key was already used for a different request",
+                        details={"job_id": job.job_id}
+                    )
+                return job, False
+            
+            pending = sum(1 for job in self._jobs.values() if job.status not in FINISHED)
+            if pending >= self.max_pending:
+                raise TooManyRequestsException(
+                    "Too many unfinished jobs, please retry later",
+                    details={"max_pending": self.max_pending}
+                )
+            
+            job = Job(uuid.uuid4().hex, labels, self._clock(), idempotency_key, fingerprint)
+            self._jobs[job.job_id] = job
+            if idempotency_key is not None:
+                self._idempotency[idempotency_key] = job.job_id
+            self.submitted += 1
+            self._save(job)
+            self._futures[job.job_id] = self._executor.submit(self._run, job, steps)
+        
+        logger.info("Job %s queued with %s steps", job.job_id, len(steps))
+        return job, True
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        """The job, or None when unknown or expired"""
+        with self._lock:
+            self._purge_expired()
+            return self._jobs.get(job_id)
+    
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Cancel a job; a running job stops before its next step
+        
+        Finished jobs are unaffected. Returns None for unknown jobs.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in FINISHED:
+                return job
+            job.cancel_requested = True
+            if self._futures[job_id].cancel():
+                self._finish(job, JobStatus.CANCELLED)
+        return job
+    
+    def _run(self, job: Job, steps: List[Callable[[], Any]]) -> None:
+        with self._lock:
+            job.status = JobStatus.RUNNING
+            job.started_at = self._clock()
+            self._save(job)
+        
+        try:
+            for label, step in zip(job.labels, steps):
+                if job.cancel_requested:
+                    break
+                result = step()
+                with self._lock:
+                    job.results.append(result)
+                    self._save(job)
+                logger.info("Job %s completed step %s", job.job_id, label)
+        except Exception as e:
+            logger.error("Job %s failed: %s", job.job_id, e, exc_info=True)
+            with self._lock:
+                job.error = str(e) or type(e).__name__
+                self._finish(job, JobStatus.FAILED)
+            return
+        
+        with self._lock:
+            self._finish(job, JobStatus.CANCELLED if job.cancel_requested else JobStatus.SUCCEEDED)
+    
+    def _finish(self, job: Job, status: JobStatus) -> None:
+        """Record a final status and start the retention clock; holds the lock"""
+        job.status = status
+        job.finished_at = self._clock()
+        job.expires_at = job.finished_at + self.ttl_seconds
+        self._futures.pop(job.job_id, None)
+        if status == JobStatus.SUCCEEDED:
+            self.succeeded += 1
+        elif status == JobStatus.FAILED:
+            self.failed += 1
+        else:
+            self.cancelled += 1
+        self._save(job)
+    
+    def _purge_expired(self) -> None:
+        """Drop finished jobs past their retention; holds the lock"""
+        now = self._clock()
+        for job in [job for job in self._jobs.values() if job.expires_at and job.expires_at <= now]:
+            del self._jobs[job.job_id]
+            if job.idempotency_key is not None:
+                self._idempotency.pop(job.idempotency_key, None)
+            if self.storage_dir is not None:
+                self._path(job.job_id).unlink(missing_ok=True)
+            self.expired += 1
+    
+    def _path(self, job_id: str) -> Path:
+        return self.storage_dir / f"{job_id}.json"
+    
+    def _save(self, job: Job) -> None:
+        """Write the job through a temporary file so readers never see partial JSON"""
+        if self.storage_dir is None:
+            return
+        path = self._path(job.job_id)
+        temporary = path.with_name(f".{path.name}.tmp")
+        with open(temporary, "w") as handle:
+            json.dump(job.to_dict(), handle)
+        os.replace(temporary, path)
+    
+    def _load(self) -> None:
+        """Reload persisted jobs; unfinished ones were lost with the old process"""
+        for path in self.storage_dir.glob("*.json"):
+            try:
+                with open(path) as handle:
+                    job = Job.from_dict(json.load(handle))
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("Skipping unreadable job file %s: %s", path, e)
+                continue
+            
+            self._jobs[job.job_id] = job
+            if job.idempotency_key is not None:
+                self._idempotency[job.idempotency_key] = job.job_id
+            if job.status not in FINISHED:
+                job.error = "Interrupted by a server restart"
+                self._finish(job, JobStatus.FAILED)
+        
+        self._purge_expired()
+        logger.info("Loaded %s jobs from %s", len(self._jobs), self.storage_dir)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Job counts by state and lifetime counters"""
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+            return {
+                "workers": self.workers,
+                "queued": statuses.count(JobStatus.QUEUED),
+                "running": statuses.count(JobStatus.RUNNING),
+                "retained": len(statuses),
+                "submitted": self.submitted,
+                "succeeded": self.succeeded,
+                "failed": self.failed,
+                "cancelled": self.cancelled,
+                "expired": self.expired,
+            }
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pool; queued jobs are cancelled"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_job_manager: Optional[JobManager] = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """Return the shared job manager, creating it from settings on first use"""
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager(
+                workers=settings.JOBS_WORKERS,
+                ttl_seconds=settings.JOBS_RESULT_TTL_SECONDS,
+                max_pending=settings.JOBS_MAX_PENDING,
+                storage_dir=settings.JOBS_DIR
+            )
+        return _job_manager
+
+
+def shutdown_job_manager() -> None:
+    """Shut down the shared job manager, if started"""
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is not None:
+            _job_manager.shutdown(wait=False)
+            _job_manager = None
+
+
+def _collect_metrics():
+    """Shared job manager counters for /metrics"""
+    if _job_manager is None:
+        return []
+    stats = _job_manager.stats()
+    return [
+        stat_family("jobs_queued", "gauge", "Jobs waiting for a worker", stats["queued"]),
+        stat_family("jobs_running", "gauge", "Jobs currently running", stats["running"]),
+        stat_family(
+            "jobs_retained", "gauge", "Jobs held in memory, including finished results",
+            stats["retained"]
+        ),
+        stat_family("jobs_submitted_total", "counter", "Jobs submitted", stats["submitted"]),
+        stat_family("jobs_succeeded_total", "counter", "Jobs succeeded", stats["succeeded"]),
+        stat_family("jobs_failed_total", "counter", "Jobs failed", stats["failed"]),
+    ]
+
+
+REGISTRY.register_collector(_collect_metrics)
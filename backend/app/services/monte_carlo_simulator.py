@@ -1,26 +1,191 @@
 """
 Monte Carlo simulation service for retirement forecasting
 """
+import os
+import secrets
+import threading
+import time
+import multiprocessing
+from statistics import NormalDist
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from app.core.config import settings
 from app.core.logging_config import get_logger
-from app.core.exceptions import CalculationException
-from app.models.schemas import RiskProfile
+from app.core.exceptions import CalculationException, ValidationException
+from app.core.metrics import (
+    SIMULATION_DURATION,
+    SIMULATION_ITERATIONS,
+    SIMULATION_PATHS,
+    SIMULATION_PATHS_PER_SECOND,
+    SIMULATIONS_IN_FLIGHT,
+)
+from app.models.schemas import RiskProfile, SamplingMethod
 from app.services.financial_calculator import FinancialCalculator
+from app.services.quantile_sketch import QuantileSketch, RunningMoments
 
 logger = get_logger(__name__)
 
+# Persistent worker pool for the parallel engine, created on first use
+_process_pool: ProcessPoolExecutor = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared simulation process pool, creating it if needed"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            max_workers = settings.MONTE_CARLO_POOL_SIZE or os.cpu_count() or 1
+            # Spawned workers behave the same on every platform and don't
+            # inherit the server's threads
+            _process_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info("Started simulation process pool with %s workers", max_workers)
+        return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared simulation process pool if it was started"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=True)
+            _process_pool = None
+
+
+def _record_simulation(
+    risk_profile: RiskProfile, engine: str, paths: int, seconds: float
+) -> None:
+    """Export one simulation call's cost to /metrics"""
+    labels = {"risk_profile": risk_profile.value, "engine": engine}
+    SIMULATION_DURATION.observe(seconds, **labels)
+    SIMULATION_ITERATIONS.observe(paths, **labels)
+    SIMULATION_PATHS.inc(paths, **labels)
+    if seconds > 0:
+        SIMULATION_PATHS_PER_SECOND.observe(paths / seconds, **labels)
+
+
+def _draw_uniforms(
+    rng: np.random.Generator,
+    size: int,
+    years: int,
+    sampling_method: SamplingMethod = SamplingMethod.UNIFORM
+) -> np.ndarray:
+    """
+    Draw a (years, size) matrix of U(0, 1) variates for return paths
+    
+    Every scheme keeps uniform marginals, so mapped returns stay unbiased:
+    - uniform: independent draws
+    - antithetic: paths come in pairs (u, 1 - u)
+    - stratified: Latin hypercube; each year's draws hit every one of the
+      size equal-probability strata exactly once
+    - sobol: scrambled Sobol' low-discrepancy points, one dimension per year
+    """
+    if sampling_method == SamplingMethod.ANTITHETIC:
+        half = rng.random((years, (size + 1) // 2))
+        return np.concatenate([half, 1 - half], axis=1)[:, :size]
+    
+    if sampling_method == SamplingMethod.STRATIFIED:
+        strata = rng.permuted(np.broadcast_to(np.arange(size), (years, size)), axis=1)
+        return (strata + rng.random((years, size))) / size
+    
+    if sampling_method == SamplingMethod.SOBOL:
+        from scipy.stats import qmc
+        
+        # Sobol' balance holds for powers of two; draw the next one and trim
+        sampler = qmc.Sobol(d=years, scramble=True, seed=rng)
+        points = sampler.random_base2(m=max(0, int(np.ceil(np.log2(size)))))
+        return np.ascontiguousarray(points[:size].T)
+    
+    return rng.random((years, size))
+
+
+def _simulate_shard(
+    rng: np.random.Generator,
+    monthly_contribution: float,
+    years: int,
+    min_return: float,
+    max_return: float,
+    annual_income_growth: float,
+    size: int,
+    kernel: str,
+    sampling_method: SamplingMethod = SamplingMethod.UNIFORM
+) -> np.ndarray:
+    """Simulate one shard of paths in a worker process"""
+    uniforms = _draw_uniforms(rng, size, years, sampling_method)
+    annual_returns = (min_return + (max_return - min_return) * uniforms).T
+    return MonteCarloSimulator._simulate_paths(
+        monthly_contribution,
+        years,
+        annual_returns,
+        annual_income_growth,
+        kernel=kernel
+    )
+
 
 class MonteCarloSimulator:
     """Monte Carlo simulation engine for probabilistic retirement forecasting"""
     
-    def __init__(self, seed: int = None):
-        """Initialize simulator with optional random seed for reproducibility"""
+    # Corpus accumulation kernels (annual is exact for constant-within-year returns)
+    KERNELS = ("annual", "monthly")
+    
+    # Execution engines: in-process arrays, shards over the process pool,
+    # constant-memory blocks summarised by a quantile sketch, or batches that
+    # stop once the percentiles converge
+    ENGINES = ("vectorized", "parallel", "streaming", "adaptive")
+    
+    # Percentiles whose precision decides when adaptive runs stop
+    ADAPTIVE_PERCENTILES = (10, 50, 90)
+    
+    # Statistics measured in currency; these scale linearly with contribution
+    CORPUS_STATISTICS = (
+        "mean", "std_deviation",
+        "percentile_10", "percentile_25", "percentile_50",
+        "percentile_75", "percentile_90",
+        "min", "max",
+    )
+    
+    def __init__(self, seed: int = None, path_bank=None):
+        """
+        Initialize simulator with its own random stream
+        
+        Each simulator owns a PCG64 generator built from a SeedSequence, so
+        concurrent simulators never share global NumPy state. When no seed is
+        given one is drawn and kept on the instance so the run can be
+        reproduced.
+        
+        Args:
+            seed: Random seed (default: the path bank's seed, else random)
+            path_bank: Optional app.services.path_bank.PathBank serving
+                precomputed uniform return paths to in-memory runs
+        """
+        if seed is None:
+            if path_bank is not None:
+                seed = path_bank.seed
+            else:
+                # Stay within JavaScript's safe integer range so clients can echo it back
+                seed = secrets.randbits(53)
+        
         self.seed = seed
-        if seed is not None:
-            np.random.seed(seed)
+        self.path_bank = path_bank
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.rng = np.random.Generator(np.random.PCG64(self.seed_sequence))
+    
+    def spawn_streams(self, count: int) -> List[np.random.Generator]:
+        """
+        Spawn independent child generators, e.g. one per parallel shard
+        
+        Children are derived from the simulator's SeedSequence, so the same
+        seed always yields the same set of streams.
+        """
+        return [
+            np.random.Generator(np.random.PCG64(child))
+            for child in self.seed_sequence.spawn(count)
+        ]
     
     def simulate_retirement_corpus(
         self,
@@ -28,7 +193,12 @@ class MonteCarloSimulator:
         years: int,
         risk_profile: RiskProfile,
         annual_income_growth: float = 0.0,
-        iterations: int = None
+        iterations: int = None,
+        kernel: str = "annual",
+        engine: str = None,
+        target_precision: float = None,
+        sampling_method: SamplingMethod = SamplingMethod.UNIFORM,
+        control_variate: bool = False
     ) -> Dict[str, float]:
         """
         Run Monte Carlo simulation for retirement corpus
@@ -39,76 +209,693 @@ class MonteCarloSimulator:
             risk_profile: Investment risk profile
             annual_income_growth: Annual growth in contribution (%)
             iterations: Number of simulation iterations
+            kernel: Accumulation kernel ("annual" or "monthly")
+            engine: "vectorized", "parallel" or "streaming"; by default the
+                parallel engine is used for runs larger than one shard when
+                MONTE_CARLO_PARALLEL_ENABLED is set. Streaming keeps memory
+                constant and allows up to MAX_STREAMING_ITERATIONS, with
+                percentiles estimated by a quantile sketch (see
+                app.services.quantile_sketch for error bounds)
+            target_precision: Relative confidence-interval half-width for
+                p10/p50/p90 at which to stop early; implies the adaptive
+                engine, with iterations as the upper bound
+            sampling_method: Sampling scheme for return paths (uniform,
+                antithetic, stratified or sobol)
+            control_variate: Adjust the summaries with the deterministic
+                corpus as a control variate (vectorized engine only)
         
         Returns:
-            Dictionary with statistical results (mean, std, percentiles)
+            Dictionary with statistical results (mean, std, percentiles);
+            adaptive runs add iterations_used and achieved_precision, control
+            variate runs add variance_reduction_factor
         """
+        self._validate_kernel(kernel)
+        sampling_method = self._validate_sampling_method(sampling_method)
+        if engine is not None and engine not in self.ENGINES:
+            raise ValidationException(
+                f"Unknown simulation engine: {engine}",
+                details={"allowed": list(self.ENGINES)}
+            )
+        if control_variate and (
+            target_precision is not None or engine not in (None, "vectorized")
+        ):
+            raise ValidationException(
+                "Control variates are only supported by the vectorized engine",
+                details={"engine": engine or "adaptive"}
+            )
+        
+        SIMULATIONS_IN_FLIGHT.inc()
+        start_time = time.perf_counter()
         try:
-            if iterations is None:
-                iterations = settings.DEFAULT_MONTE_CARLO_ITERATIONS
-            
-            # Validate iterations
-            if iterations > settings.MAX_MONTE_CARLO_ITERATIONS:
-                iterations = settings.MAX_MONTE_CARLO_ITERATIONS
-                logger.warning(
-                    f"Iterations capped at {settings.MAX_MONTE_CARLO_ITERATIONS}"
-                )
-            
-            # Get return range for risk profile
-            min_return, max_return = FinancialCalculator.get_risk_profile_returns(
-                risk_profile
+            iterations = self._resolve_iterations(
+                iterations,
+                settings.MAX_STREAMING_ITERATIONS
+                if engine == "streaming"
+                else settings.MAX_MONTE_CARLO_ITERATIONS
             )
             
+            if engine is None and target_precision is not None:
+                engine = "adaptive"
+            
+            if engine is None and control_variate:
+                engine = "vectorized"
+            
+            if engine is None:
+                engine = (
+                    "parallel"
+                    if settings.MONTE_CARLO_PARALLEL_ENABLED
+                    and iterations > settings.MONTE_CARLO_SHARD_SIZE
+                    else "vectorized"
+                )
+            
             logger.info(
-                f"Starting Monte Carlo simulation: {iterations} iterations, "
-                f"{years} years, risk={risk_profile.value}"
+                "Starting Monte Carlo simulation: %s iterations, %s years, risk=%s, engine=%s, sampling=%s",
+                iterations, years, risk_profile.value, engine, sampling_method.value
             )
             
-            # Run simulations
-            results = np.zeros(iterations)
-            
-            for i in range(iterations):
-                # Generate random annual returns for each year
-                annual_returns = np.random.uniform(
-                    min_return,
-                    max_return,
-                    size=years
+            if engine == "adaptive":
+                statistics = self._simulate_adaptive(
+                    monthly_contribution,
+                    years,
+                    risk_profile,
+                    annual_income_growth,
+                    iterations,
+                    kernel,
+                    sampling_method,
+                    target_precision or settings.ADAPTIVE_TARGET_PRECISION
                 )
-                
-                corpus = self._simulate_single_path(
+            elif engine == "streaming":
+                statistics = self._simulate_streaming(
                     monthly_contribution,
                     years,
-                    annual_returns,
-                    annual_income_growth
+                    risk_profile,
+                    annual_income_growth,
+                    iterations,
+                    kernel,
+                    sampling_method
                 )
-                results[i] = corpus
-            
-            # Calculate statistics
-            statistics = {
-                "mean": float(np.mean(results)),
-                "std_deviation": float(np.std(results)),
-                "percentile_10": float(np.percentile(results, 10)),
-                "percentile_25": float(np.percentile(results, 25)),
-                "percentile_50": float(np.percentile(results, 50)),
-                "percentile_75": float(np.percentile(results, 75)),
-                "percentile_90": float(np.percentile(results, 90)),
-                "min": float(np.min(results)),
-                "max": float(np.max(results)),
-            }
+            else:
+                if engine == "parallel":
+                    results = self._simulate_parallel(
+                        monthly_contribution,
+                        years,
+                        risk_profile,
+                        annual_income_growth,
+                        iterations,
+                        kernel,
+                        sampling_method
+                    )
+                else:
+                    annual_returns = self._banked_returns(
+                        risk_profile, iterations, years, sampling_method
+                    )
+                    if annual_returns is None:
+                        annual_returns = self._draw_returns(
+                            risk_profile, iterations, years, sampling_method
+                        )
+                    
+                    results = self._simulate_paths(
+                        monthly_contribution,
+                        years,
+                        annual_returns,
+                        annual_income_growth,
+                        kernel=kernel
+                    )
+                
+                if control_variate:
+                    statistics = self._summarize_control_variate(
+                        results,
+                        annual_returns,
+                        monthly_contribution,
+                        years,
+                        risk_profile,
+                        annual_income_growth,
+                        kernel
+                    )
+                else:
+                    statistics = self._summarize(results)
             
+            _record_simulation(
+                risk_profile,
+                engine,
+                statistics.get("iterations_used", iterations),
+                time.perf_counter() - start_time
+            )
             logger.info(
-                f"Simulation completed: mean={statistics['mean']:.2f}, "
-                f"median={statistics['percentile_50']:.2f}"
+                "Simulation completed: mean=%.2f, median=%.2f",
+                statistics["mean"], statistics["percentile_50"]
             )
             
             return statistics
         
         except Exception as e:
-            logger.error(f"Monte Carlo simulation failed: {str(e)}", exc_info=True)
+            logger.error("Monte Carlo simulation failed: %s", e, exc_info=True)
             raise CalculationException(
                 "Monte Carlo simulation failed",
                 details={"error": str(e)}
             )
+        finally:
+            SIMULATIONS_IN_FLIGHT.dec()
+    
+    def simulate_horizons(
+        self,
+        monthly_contribution: float,
+        horizons: List[int],
+        risk_profile: RiskProfile,
+        annual_income_growth: float = 0.0,
+        iterations: int = None,
+        kernel: str = "annual",
+        sampling_method: SamplingMethod = SamplingMethod.UNIFORM
+    ) -> Dict[int, Dict[str, float]]:
+        """
+        Run one Monte Carlo simulation and report several investment horizons
+        
+        Shorter horizons are prefixes of the longest one, so paths are simulated
+        once up to the longest horizon and the corpus distribution is
+        checkpointed at every requested year. Differences between horizons are
+        therefore consistent path by path.
+        
+        Args:
+            monthly_contribution: Initial monthly contribution
+            horizons: Investment horizons in years
+            risk_profile: Investment risk profile
+            annual_income_growth: Annual growth in contribution (%)
+            iterations: Number of simulation iterations
+            kernel: Accumulation kernel ("annual" or "monthly")
+            sampling_method: Sampling scheme for return paths
+        
+        Returns:
+            Dictionary mapping each horizon to its statistical results
+        """
+        self._validate_kernel(kernel)
+        sampling_method = self._validate_sampling_method(sampling_method)
+        
+        SIMULATIONS_IN_FLIGHT.inc()
+        start_time = time.perf_counter()
+        try:
+            iterations = self._resolve_iterations(iterations)
+            max_years = max(horizons)
+            
+            logger.info(
+                "Starting Monte Carlo horizon simulation: %s iterations, horizons=%s, risk=%s",
+                iterations, sorted(set(horizons)), risk_profile.value
+            )
+            
+            annual_returns = self._banked_returns(
+                risk_profile, iterations, max_years, sampling_method
+            )
+            if annual_returns is None:
+                annual_returns = self._draw_returns(
+                    risk_profile, iterations, max_years, sampling_method
+                )
+            
+            accumulate = (
+                self._accumulate_annual if kernel == "annual" else self._accumulate_monthly
+            )
+            checkpoints = accumulate(
+                monthly_contribution,
+                max_years,
+                annual_returns,
+                annual_income_growth,
+                checkpoints=horizons
+            )
+            _record_simulation(
+                risk_profile, "horizons", iterations, time.perf_counter() - start_time
+            )
+            
+            return {
+                horizon: self._summarize(results)
+                for horizon, results in checkpoints.items()
+            }
+        
+        except Exception as e:
+            logger.error("Monte Carlo horizon simulation failed: %s", e, exc_info=True)
+            raise CalculationException(
+                "Monte Carlo simulation failed",
+                details={"error": str(e)}
+            )
+        finally:
+            SIMULATIONS_IN_FLIGHT.dec()
+    
+    def _simulate_parallel(
+        self,
+        monthly_contribution: float,
+        years: int,
+        risk_profile: RiskProfile,
+        annual_income_growth: float,
+        iterations: int,
+        kernel: str,
+        sampling_method: SamplingMethod
+    ) -> np.ndarray:
+        """
+        Simulate paths in shards over the shared process pool
+        
+        Every shard draws from its own child stream of the simulator's seed, so
+        results are reproducible for a given seed and shard size. Shard results
+        are concatenated, so statistics are exact rather than approximated
+        from per-shard summaries.
+        """
+        min_return, max_return = FinancialCalculator.get_risk_profile_returns(
+            risk_profile
+        )
+        shard_size = max(1, settings.MONTE_CARLO_SHARD_SIZE)
+        shard_sizes = [
+            min(shard_size, iterations - start)
+            for start in range(0, iterations, shard_size)
+        ]
+        streams = self.spawn_streams(len(shard_sizes))
+        
+        pool = get_process_pool()
+        futures = [
+            pool.submit(
+                _simulate_shard,
+                rng,
+                monthly_contribution,
+                years,
+                min_return,
+                max_return,
+                annual_income_growth,
+                size,
+                kernel,
+                sampling_method
+            )
+            for rng, size in zip(streams, shard_sizes)
+        ]
+        
+        return np.concatenate([future.result() for future in futures])
+    
+    def _simulate_streaming(
+        self,
+        monthly_contribution: float,
+        years: int,
+        risk_profile: RiskProfile,
+        annual_income_growth: float,
+        iterations: int,
+        kernel: str,
+        sampling_method: SamplingMethod
+    ) -> Dict[str, float]:
+        """
+        Simulate paths in fixed-size blocks with constant memory
+        
+        Each block's final corpus values feed a mergeable quantile sketch and
+        running moments and are then discarded, so memory does not grow with
+        the iteration count.
+        """
+        sketch = QuantileSketch(settings.STREAMING_SKETCH_COMPRESSION)
+        moments = RunningMoments()
+        block_size = max(1, settings.STREAMING_BLOCK_SIZE)
+        
+        for start in range(0, iterations, block_size):
+            size = min(block_size, iterations - start)
+            annual_returns = self._draw_returns(
+                risk_profile, size, years, sampling_method
+            )
+            results = self._simulate_paths(
+                monthly_contribution,
+                years,
+                annual_returns,
+                annual_income_growth,
+                kernel=kernel
+            )
+            sketch.update(results)
+            moments.update(results)
+        
+        return {
+            "mean": moments.mean,
+            "std_deviation": moments.std,
+            "percentile_10": sketch.quantile(0.10),
+            "percentile_25": sketch.quantile(0.25),
+            "percentile_50": sketch.quantile(0.50),
+            "percentile_75": sketch.quantile(0.75),
+            "percentile_90": sketch.quantile(0.90),
+            "min": sketch.min,
+            "max": sketch.max,
+        }
+    
+    def _simulate_adaptive(
+        self,
+        monthly_contribution: float,
+        years: int,
+        risk_profile: RiskProfile,
+        annual_income_growth: float,
+        max_iterations: int,
+        kernel: str,
+        sampling_method: SamplingMethod,
+        target_precision: float
+    ) -> Dict[str, float]:
+        """
+        Simulate in batches until the tracked percentiles are precise enough
+        
+        After each batch the precision of p10/p50/p90 is estimated and the run
+        stops once every one is within target_precision, or when
+        max_iterations is reached.
+        """
+        batch_size = max(1, settings.ADAPTIVE_BATCH_SIZE)
+        batches = []
+        simulated = 0
+        
+        while simulated < max_iterations:
+            size = min(batch_size, max_iterations - simulated)
+            annual_returns = self._draw_returns(
+                risk_profile, size, years, sampling_method
+            )
+            batches.append(self._simulate_paths(
+                monthly_contribution,
+                years,
+                annual_returns,
+                annual_income_growth,
+                kernel=kernel
+            ))
+            simulated += size
+            
+            results = np.sort(np.concatenate(batches))
+            precision = self._percentile_precision(results)
+            if precision <= target_precision:
+                break
+        
+        logger.info(
+            "Adaptive simulation stopped after %s/%s iterations, precision=%.5f",
+            simulated, max_iterations, precision
+        )
+        
+        statistics = self._summarize(results)
+        statistics["iterations_used"] = simulated
+        statistics["achieved_precision"] = precision
+        return statistics
+    
+    def _percentile_precision(self, sorted_results: np.ndarray) -> float:
+        """
+        Worst relative confidence-interval half-width of the tracked percentiles
+        
+        Uses distribution-free order-statistic bounds: the number of samples
+        below the q-th quantile is Binomial(n, q), so the order statistics at
+        ranks n*q -/+ z*sqrt(n*q*(1-q)) bracket it with the configured
+        confidence.
+        """
+        n = len(sorted_results)
+        z = NormalDist().inv_cdf(0.5 + settings.ADAPTIVE_CONFIDENCE_LEVEL / 2)
+        worst = 0.0
+        
+        for percentile in self.ADAPTIVE_PERCENTILES:
+            q = percentile / 100
+            spread = z * np.sqrt(n * q * (1 - q))
+            lower = int(max(0, np.floor(n * q - spread)))
+            upper = int(min(n - 1, np.ceil(n * q + spread)))
+            estimate = abs(np.percentile(sorted_results, percentile))
+            if estimate == 0:
+                continue
+            half_width = (sorted_results[upper] - sorted_results[lower]) / 2
+            worst = max(worst, half_width / estimate)
+        
+        return float(worst)
+    
+    def _validate_sampling_method(self, sampling_method) -> SamplingMethod:
+        """Normalise a sampling method name, rejecting unknown ones"""
+        try:
+            return SamplingMethod(sampling_method)
+        except ValueError:
+            raise ValidationException(
+                f"Unknown sampling method: {sampling_method}",
+                details={"allowed": [method.value for method in SamplingMethod]}
+            )
+    
+    def _validate_kernel(self, kernel: str) -> None:
+        """Reject unknown accumulation kernels before any work is done"""
+        if kernel not in self.KERNELS:
+            raise ValidationException(
+                f"Unknown accumulation kernel: {kernel}",
+                details={"allowed": list(self.KERNELS)}
+            )
+    
+    def _resolve_iterations(self, iterations: int = None, cap: int = None) -> int:
+        """Apply the default iteration count and the configured cap"""
+        if iterations is None:
+            iterations = settings.DEFAULT_MONTE_CARLO_ITERATIONS
+        
+        if cap is None:
+            cap = settings.MAX_MONTE_CARLO_ITERATIONS
+        
+        if iterations > cap:
+            iterations = cap
+            logger.warning("Iterations capped at %s", cap)
+        
+        return iterations
+    
+    def _banked_returns(
+        self,
+        risk_profile: RiskProfile,
+        iterations: int,
+        years: int,
+        sampling_method: SamplingMethod
+    ) -> Optional[np.ndarray]:
+        """Read-only returns from the path bank, or None if it cannot serve the draw"""
+        if self.path_bank is None or sampling_method != SamplingMethod.UNIFORM:
+            return None
+        return self.path_bank.get_returns(risk_profile, years, iterations, self.seed)
+    
+    def _draw_returns(
+        self,
+        risk_profile: RiskProfile,
+        iterations: int,
+        years: int,
+        sampling_method: SamplingMethod = SamplingMethod.UNIFORM
+    ) -> np.ndarray:
+        """
+        Draw the (iterations, years) matrix of annual returns for a risk profile
+        
+        The matrix is drawn year-major so the annual kernel can step through
+        contiguous rows.
+        """
+        min_return, max_return = FinancialCalculator.get_risk_profile_returns(
+            risk_profile
+        )
+        uniforms = _draw_uniforms(self.rng, iterations, years, sampling_method)
+        return (min_return + (max_return - min_return) * uniforms).T
+    
+    @staticmethod
+    def _summarize(results: np.ndarray) -> Dict[str, float]:
+        """Calculate summary statistics over simulated corpus values"""
+        p10, p25, p50, p75, p90 = np.percentile(results, [10, 25, 50, 75, 90])
+        
+        return {
+            "mean": float(np.mean(results)),
+            "std_deviation": float(np.std(results)),
+            "percentile_10": float(p10),
+            "percentile_25": float(p25),
+            "percentile_50": float(p50),
+            "percentile_75": float(p75),
+            "percentile_90": float(p90),
+            "min": float(np.min(results)),
+            "max": float(np.max(results)),
+        }
+    
+    def _summarize_control_variate(
+        self,
+        results: np.ndarray,
+        annual_returns: np.ndarray,
+        monthly_contribution: float,
+        years: int,
+        risk_profile: RiskProfile,
+        annual_income_growth: float,
+        kernel: str
+    ) -> Dict[str, float]:
+        """
+        Calculate summary statistics using a linear control variate
+        
+        The control is the deterministic corpus at the mid-range return plus
+        its first-order response to each path's yearly deviations from that
+        return. It is linear in the returns, so its expectation is exactly
+        the deterministic corpus. The regression estimator is applied through
+        per-path weights (sum to one, reproduce the control's expectation),
+        which give the mean, standard deviation and weighted percentiles.
+        """
+        min_return, max_return = FinancialCalculator.get_risk_profile_returns(
+            risk_profile
+        )
+        mean_return = (min_return + max_return) / 2
+        expected_control = FinancialCalculator.calculate_corpus_deterministic(
+            monthly_contribution, years, mean_return, annual_income_growth
+        )
+        sensitivities = self._return_sensitivities(
+            monthly_contribution, years, mean_return, annual_income_growth, kernel
+        )
+        control = expected_control + (annual_returns - mean_return) @ sensitivities
+        
+        n = len(results)
+        deviation = control - control.mean()
+        sum_squares = float(deviation @ deviation)
+        weights = np.full(n, 1 / n)
+        if sum_squares > 0:
+            weights -= (control.mean() - expected_control) * deviation / sum_squares
+        
+        mean = float(weights @ results)
+        variance = float(weights @ (results - mean) ** 2)
+        
+        # First rank whose (monotone envelope of the) weighted CDF reaches q
+        order = np.argsort(results)
+        cdf = np.maximum.accumulate(np.cumsum(weights[order]))
+        ranks = np.searchsorted(cdf, [0.10, 0.25, 0.50, 0.75, 0.90])
+        p10, p25, p50, p75, p90 = results[order[np.minimum(ranks, n - 1)]]
+        
+        correlation = np.corrcoef(control, results)[0, 1] if sum_squares > 0 else 0.0
+        
+        return {
+            "mean": mean,
+            "std_deviation": float(np.sqrt(max(variance, 0.0))),
+            "percentile_10": float(p10),
+            "percentile_25": float(p25),
+            "percentile_50": float(p50),
+            "percentile_75": float(p75),
+            "percentile_90": float(p90),
+            "min": float(np.min(results)),
+            "max": float(np.max(results)),
+            "variance_reduction_factor": float(
+                1 / max(1 - correlation ** 2, np.finfo(float).eps)
+            ),
+        }
+    
+    @staticmethod
+    def _return_sensitivities(
+        monthly_contribution: float,
+        years: int,
+        annual_return: float,
+        annual_income_growth: float,
+        kernel: str,
+        step: float = 0.01
+    ) -> np.ndarray:
+        """Central-difference d(corpus)/d(return in year y) at a constant return"""
+        bumps = np.eye(years) * step
+        paths = annual_return + np.concatenate([bumps, -bumps])
+        corpus = MonteCarloSimulator._simulate_paths(
+            monthly_contribution, years, paths, annual_income_growth, kernel
+        )
+        return (corpus[:years] - corpus[years:]) / (2 * step)
+    
+    @staticmethod
+    def _simulate_paths(
+        initial_contribution: float,
+        years: int,
+        annual_returns: np.ndarray,
+        annual_income_growth: float,
+        kernel: str = "annual"
+    ) -> np.ndarray:
+        """
+        Simulate corpus accumulation for every path at once
+        
+        Vectorized equivalent of _simulate_single_path: steps are applied to
+        all paths with array operations instead of per-path loops.
+        
+        Args:
+            initial_contribution: Starting monthly contribution
+            years: Investment horizon
+            annual_returns: Matrix of annual return rates, shape (paths, years)
+            annual_income_growth: Annual contribution growth rate
+            kernel: "annual" (closed-form yearly steps) or "monthly"
+        
+        Returns:
+            Array of final corpus values, one per path
+        """
+        accumulate = (
+            MonteCarloSimulator._accumulate_annual
+            if kernel == "annual"
+            else MonteCarloSimulator._accumulate_monthly
+        )
+        return accumulate(
+            initial_contribution, years, annual_returns, annual_income_growth
+        )[years]
+    
+    @staticmethod
+    def _accumulate_monthly(
+        initial_contribution: float,
+        years: int,
+        annual_returns: np.ndarray,
+        annual_income_growth: float,
+        checkpoints: List[int] = None
+    ) -> Dict[int, np.ndarray]:
+        """
+        Accumulate all paths month by month (12 * years array steps)
+        
+        Returns:
+            Corpus values after each checkpoint year (default: final year only)
+        """
+        checkpoints = set(checkpoints or [years])
+        snapshots = {}
+        corpus = np.zeros(annual_returns.shape[:-1])
+        monthly_growth_rate = annual_income_growth / 100 / 12
+        
+        # Contribution schedule is identical for every path
+        contributions = initial_contribution * (
+            (1 + monthly_growth_rate) ** np.arange(years * 12)
+        )
+        monthly_factors = 1 + annual_returns / 100 / 12
+        
+        for year in range(years):
+            monthly_factor = monthly_factors[..., year]
+            
+            for month in range(12):
+                corpus += contributions[year * 12 + month]
+                corpus *= monthly_factor
+            
+            if year + 1 in checkpoints:
+                snapshots[year + 1] = corpus.copy()
+        
+        return snapshots
+    
+    @staticmethod
+    def _accumulate_annual(
+        initial_contribution: float,
+        years: int,
+        annual_returns: np.ndarray,
+        annual_income_growth: float,
+        checkpoints: List[int] = None
+    ) -> Dict[int, np.ndarray]:
+        """
+        Accumulate all paths year by year (years array steps)
+        
+        Returns are constant within a year, so the 12 monthly steps collapse
+        into corpus * a^12 + C * b^(12y) * a * sum(b^k * a^(11-k)), where a and
+        b are the monthly return and contribution growth factors. The
+        geometric sum has the closed form (a^12 - b^12) / (a - b).
+        
+        Returns:
+            Corpus values after each checkpoint year (default: final year only)
+        """
+        checkpoints = set(checkpoints or [years])
+        snapshots = {}
+        
+        # Work on a (years, paths) layout so each yearly step reads a
+        # contiguous row; free when the matrix was drawn that way
+        a = np.ascontiguousarray(np.moveaxis(annual_returns, -1, 0)) / 1200
+        a += 1
+        b = 1 + annual_income_growth / 100 / 12
+        
+        # a^12 by repeated squaring; much cheaper than a generic power
+        year_growth = a * a
+        year_growth *= year_growth
+        year_growth *= year_growth * year_growth
+        
+        # Growing-annuity factor for the year's 12 contributions; patch in the
+        # a == b limit where the closed form would lose precision
+        diff = a - b
+        with np.errstate(divide="ignore", invalid="ignore"):
+            year_contributions = (year_growth - b ** 12) / diff
+        near_equal = np.abs(diff) < 1e-6
+        if near_equal.any():
+            year_contributions[near_equal] = 12 * ((a[near_equal] + b) / 2) ** 11
+        
+        first_contributions = initial_contribution * b ** (12 * np.arange(years))
+        year_contributions *= a
+        year_contributions *= first_contributions.reshape((years,) + (1,) * (a.ndim - 1))
+        
+        corpus = np.zeros(a.shape[1:])
+        for year in range(years):
+            corpus *= year_growth[year]
+            corpus += year_contributions[year]
+            
+            if year + 1 in checkpoints:
+                snapshots[year + 1] = corpus.copy()
+        
+        return snapshots
     
     def _simulate_single_path(
         self,
@@ -120,6 +907,9 @@ class MonteCarloSimulator:
         """
         Simulate a single path of corpus accumulation
         
+        Reference implementation of the accumulation loop; production runs
+        use the vectorized _simulate_paths.
+        
         Args:
             initial_contribution: Starting monthly contribution
             years: Investment horizon
@@ -146,41 +936,142 @@ class MonteCarloSimulator:
         
         return corpus
     
+    @classmethod
+    def scale_statistics(
+        cls,
+        statistics: Dict[str, float],
+        factor: float
+    ) -> Dict[str, float]:
+        """
+        Rescale simulation statistics to a proportionally larger contribution
+        
+        With fixed return paths the final corpus is linear in the monthly
+        contribution, so every corpus statistic of a run at contribution
+        factor * C equals factor times the statistic at C.
+        
+        Args:
+            statistics: Results from simulate_retirement_corpus
+            factor: Positive contribution multiplier
+        
+        Returns:
+            Statistics for the scaled contribution
+        """
+        return {
+            key: value * factor if key in cls.CORPUS_STATISTICS else value
+            for key, value in statistics.items()
+        }
+    
     def simulate_pension_scenarios(
         self,
         monthly_contribution: float,
         years: int,
         annual_income_growth: float = 0.0,
-        iterations: int = None
+        iterations: int = None,
+        kernel: str = "annual",
+        target_precision: float = None,
+        sampling_method: SamplingMethod = SamplingMethod.UNIFORM,
+        control_variate: bool = False,
+        risk_profiles: List[RiskProfile] = None
     ) -> Dict[RiskProfile, Dict[str, float]]:
         """
         Simulate all three risk scenarios for comparison
         
+        The profiles differ only in their return range, so one uniform matrix
+        is drawn and mapped onto every range. This cuts RNG work by the
+        number of profiles and uses common random numbers, so differences
+        between profiles are not blurred by independent sampling noise.
+        Profiles are accumulated one after another over the shared draw: a
+        single (profiles, paths, years) pass is memory-bound and slower.
+        
+        With target_precision each profile instead runs the adaptive engine
+        on its own, since they may need different numbers of paths; it
+        cannot be combined with control_variate.
+        
+        Args:
+            risk_profiles: Profiles to simulate (default: all)
+            Other arguments as for simulate_retirement_corpus
+        
         Returns:
             Dictionary mapping risk profiles to their simulation results
         """
-        try:
-            scenarios = {}
-            
-            for risk_profile in RiskProfile:
-                logger.info(f"Simulating {risk_profile.value} scenario")
-                results = self.simulate_retirement_corpus(
+        risk_profiles = list(risk_profiles or RiskProfile)
+        
+        if target_precision is not None:
+            return {
+                risk_profile: self.simulate_retirement_corpus(
                     monthly_contribution=monthly_contribution,
                     years=years,
                     risk_profile=risk_profile,
                     annual_income_growth=annual_income_growth,
-                    iterations=iterations
+                    iterations=iterations,
+                    kernel=kernel,
+                    target_precision=target_precision,
+                    sampling_method=sampling_method,
+                    control_variate=control_variate
+                )
+                for risk_profile in risk_profiles
+            }
+        
+        self._validate_kernel(kernel)
+        sampling_method = self._validate_sampling_method(sampling_method)
+        
+        SIMULATIONS_IN_FLIGHT.inc()
+        try:
+            iterations = self._resolve_iterations(iterations)
+            logger.info(
+                "Simulating %s risk scenarios: %s iterations, %s years, sampling=%s",
+                len(risk_profiles), iterations, years, sampling_method.value
+            )
+            
+            uniforms = None
+            scenarios = {}
+            for risk_profile in risk_profiles:
+                start_time = time.perf_counter()
+                annual_returns = self._banked_returns(
+                    risk_profile, iterations, years, sampling_method
+                )
+                if annual_returns is None:
+                    if uniforms is None:
+                        uniforms = _draw_uniforms(self.rng, iterations, years, sampling_method)
+                    min_return, max_return = FinancialCalculator.get_risk_profile_returns(
+                        risk_profile
+                    )
+                    annual_returns = (min_return + (max_return - min_return) * uniforms).T
+                results = self._simulate_paths(
+                    monthly_contribution,
+                    years,
+                    annual_returns,
+                    annual_income_growth,
+                    kernel=kernel
+                )
+                
+                if control_variate:
+                    scenarios[risk_profile] = self._summarize_control_variate(
+                        results,
+                        annual_returns,
+                        monthly_contribution,
+                        years,
+                        risk_profile,
+                        annual_income_growth,
+                        kernel
+                    )
+                else:
+                    scenarios[risk_profile] = self._summarize(results)
+                
+                _record_simulation(
+                    risk_profile, "vectorized", iterations, time.perf_counter() - start_time
                 )
-                scenarios[risk_profile] = results
             
             return scenarios
         
         except Exception as e:
-            logger.error(f"Scenario simulation failed: {str(e)}", exc_info=True)
+            logger.error("Scenario simulation failed: %s", e, exc_info=True)
             raise CalculationException(
                 "Failed to simulate multiple scenarios",
                 details={"error": str(e)}
             )
+        finally:
+            SIMULATIONS_IN_FLIGHT.dec()
     
     def calculate_confidence_interval(
         self,
@@ -0,0 +1,422 @@
+"""
+Shared bank of precomputed annual return paths
+Keeps read-only return matrices per risk profile and seed so repeated
+simulations skip random generation entirely
+
+The bank can also be persisted as .npy files that every worker maps
+read-only, sharing one page-cache copy across processes and restarts:
+    
+    python -m app.services.path_bank build --dir /var/lib/nps/path-bank
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.core.metrics import REGISTRY, stat_family
+from app.models.schemas import RiskProfile
+from app.services.financial_calculator import FinancialCalculator
+from app.services.monte_carlo_simulator import MonteCarloSimulator
+
+logger = get_logger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+# Bump when the on-disk layout or the path derivation changes
+FORMAT_VERSION = 1
+
+
+def settings_fingerprint(size: int) -> str:
+    """
+    Hash of everything a banked matrix depends on
+    
+    A persisted bank is only valid while the return ranges, bank size and
+    path derivation it was built with are unchanged.
+    """
+    payload = {
+        "format_version": FORMAT_VERSION,
+        "bit_generator": "PCG64",
+        "size": size,
+        "return_ranges": {
+            risk_profile.value: FinancialCalculator.get_risk_profile_returns(risk_profile)
+            for risk_profile in RiskProfile
+        },
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _atomic_write(path: Path, write) -> None:
+    """Write through a temporary file and os.replace so readers never see partial files"""
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporary, "wb") as handle:
+            write(handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, path)
+    finally:
+        if temporary.exists():
+            temporary.unlink()
+
+
+class PathBank:
+    """
+    LRU cache of simulated annual return matrices under a memory budget
+    
+    Each entry holds `size` paths for one (risk profile, seed), drawn exactly
+    as MonteCarloSimulator draws uniform returns for that seed. Only the
+    bank's own seed and the seeds of a mapped persisted bank are served;
+    runs with any other seed draw fresh paths and nothing is stored, so
+    per-user seeds neither evict the shared entries nor pay for drawing a
+    full entry. Entries are
+    stored year-major, so a shorter horizon is a row prefix of a longer one
+    and matches a fresh draw for that horizon; one entry per profile and
+    seed therefore serves every horizon up to the longest requested so far.
+    Runs with fewer than `size` iterations use the first paths of the entry,
+    so their results depend on `size` as well as the seed.
+    
+    Matrices are marked read-only and shared by all requests without copying.
+    With a directory, entries built ahead of time are memory-mapped from
+    disk instead; mapped pages live in the shared page cache and do not
+    count against the memory budget.
+    """
+    
+    def __init__(self, size: int, max_bytes: int, seed: int, directory: str = None):
+        """
+        Initialize an empty bank
+        
+        Args:
+            size: Paths held per entry; larger runs bypass the bank
+            max_bytes: Memory budget; least recently used entries are evicted
+            seed: Seed used for simulations that do not request one
+            directory: Optional location of a persisted bank (see build)
+        """
+        self.size = size
+        self.max_bytes = max_bytes
+        self.seed = seed
+        self.directory = Path(directory) if directory else None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple[RiskProfile, int], np.ndarray]" = OrderedDict()
+        self._mapped: Dict[Tuple[RiskProfile, int], np.ndarray] = {}
+        # Seeds served from the bank: its own plus those of the mapped bank
+        self._seeds = frozenset([seed])
+        self._lock = threading.Lock()
+    
+    @property
+    def nbytes(self) -> int:
+        """Memory held by all entries"""
+        with self._lock:
+            return sum(matrix.nbytes for matrix in self._entries.values())
+    
+    def get_returns(
+        self,
+        risk_profile: RiskProfile,
+        years: int,
+        iterations: int,
+        seed: int
+    ) -> Optional[np.ndarray]:
+        """
+        Return a read-only (iterations, years) view of banked annual returns
+        
+        Returns:
+            The view, or None when iterations exceed the bank size or the
+            seed is not one the bank was built for
+        """
+        if iterations > self.size or seed not in self._seeds:
+            return None
+        
+        key = (risk_profile, seed)
+        with self._lock:
+            matrix = self._mapped.get(key)
+            if matrix is not None and matrix.shape[0] >= years:
+                self.hits += 1
+                return matrix[:years, :iterations].T
+            
+            matrix = self._entries.get(key)
+            if matrix is not None and matrix.shape[0] >= years:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return matrix[:years, :iterations].T
+            self.misses += 1
+        
+        # Generate outside the lock; a concurrent duplicate is harmless
+        matrix = self._generate(risk_profile, years, seed)
+        self._store(key, matrix)
+        return matrix[:years, :iterations].T
+    
+    def preload(self, years: int) -> None:
+        """Generate entries of the bank's seed for every risk profile up to the given horizon"""
+        for risk_profile in RiskProfile:
+            self.get_returns(risk_profile, years, self.size, self.seed)
+        logger.info("Path bank preloaded: %s years, %s bytes", years, self.nbytes)
+    
+    def warm(self, years: int) -> None:
+        """
+        Make every risk profile available up to the given horizon
+        
+        With a directory the persisted bank is mapped, and rebuilt first if
+        it is missing, too short or stale, keeping the seeds it was built
+        with; otherwise entries are generated in memory.
+        """
+        if self.directory is None:
+            self.preload(years)
+            return
+        
+        if not self.load(years):
+            manifest = self._read_manifest() or {}
+            seeds = [self.seed] + [seed for seed in manifest.get("seeds", []) if seed != self.seed]
+            self.build(years, seeds)
+            self.load(years)
+    
+    def build(self, years: int, seeds: List[int] = None) -> Path:
+        """
+        Persist entries for every risk profile and seed as .npy files
+        
+        Each file and then the manifest are replaced atomically, so workers
+        reading the bank concurrently see either the old or the new version.
+        
+        Args:
+            years: Horizon to generate (shorter horizons are prefixes)
+            seeds: Seeds to include (default: the bank's seed)
+        
+        Returns:
+            Path of the written manifest
+        """
+        if self.directory is None:
+            raise ValueError("Path bank has no directory to build into")
+        
+        seeds = seeds or [self.seed]
+        self.directory.mkdir(parents=True, exist_ok=True)
+        files = []
+        
+        for seed in seeds:
+            for risk_profile in RiskProfile:
+                matrix = self._generate(risk_profile, years, seed)
+                name = f"{risk_profile.value}_{seed}.npy"
+                _atomic_write(self.directory / name, lambda handle: np.save(handle, matrix))
+                files.append({"risk_profile": risk_profile.value, "seed": seed, "file": name})
+        
+        manifest = {
+            "format_version": FORMAT_VERSION,
+            "settings_fingerprint": settings_fingerprint(self.size),
+            "app_version": settings.APP_VERSION,
+            "numpy_version": np.__version__,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "size": self.size,
+            "years": years,
+            "seeds": seeds,
+            "files": files,
+        }
+        manifest_path = self.directory / MANIFEST_NAME
+        _atomic_write(
+            manifest_path,
+            lambda handle: handle.write(json.dumps(manifest, indent=2).encode())
+        )
+        
+        logger.info(
+            "Path bank built in %s: %s files, %s years, %s paths",
+            self.directory, len(files), years, self.size
+        )
+        return manifest_path
+    
+    def load(self, years: int = 0) -> bool:
+        """
+        Memory-map a persisted bank read-only
+        
+        The bank is rejected when its manifest is missing or unreadable,
+        shorter than the requested horizon, or built with different return
+        ranges, size or format.
+        
+        Returns:
+            True if the persisted entries are now in use
+        """
+        if self.directory is None:
+            return False
+        
+        manifest = self._read_manifest()
+        if manifest is None:
+            logger.info("No usable path bank manifest in %s", self.directory)
+            return False
+        
+        if manifest.get("settings_fingerprint") != settings_fingerprint(self.size):
+            logger.warning(
+                "Path bank in %s is stale (settings changed); ignoring it", self.directory
+            )
+            return False
+        if manifest.get("years", 0) < years:
+            logger.info(
+                "Path bank in %s covers %s years, %s needed",
+                self.directory, manifest.get("years"), years
+            )
+            return False
+        
+        mapped = {}
+        try:
+            for entry in manifest["files"]:
+                matrix = np.load(self.directory / entry["file"], mmap_mode="r")
+                if matrix.shape != (manifest["years"], self.size):
+                    raise ValueError(f"unexpected shape {matrix.shape} in {entry['file']}")
+                mapped[(RiskProfile(entry["risk_profile"]), entry["seed"])] = matrix
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning("Path bank in %s is unreadable: %s", self.directory, e)
+            return False
+        
+        with self._lock:
+            self._mapped = mapped
+            self._seeds = frozenset([self.seed, *manifest.get("seeds", [])])
+        logger.info("Path bank mapped from %s: %s entries", self.directory, len(mapped))
+        return True
+    
+    def _read_manifest(self) -> Optional[Dict]:
+        """The persisted manifest, or None when missing or unreadable"""
+        try:
+            return json.loads((self.directory / MANIFEST_NAME).read_text())
+        except (OSError, ValueError):
+            return None
+    
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._mapped = {}
+            self._seeds = frozenset([self.seed])
+    
+    def stats(self) -> Dict[str, int]:
+        """Entry count, memory use and hit/miss/eviction counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "mapped_entries": len(self._mapped),
+                "bytes": sum(matrix.nbytes for matrix in self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+    
+    def _generate(self, risk_profile: RiskProfile, years: int, seed: int) -> np.ndarray:
+        """Draw a (years, size) matrix with the simulator's own derivation"""
+        matrix = MonteCarloSimulator(seed=seed)._draw_returns(
+            risk_profile, self.size, years
+        ).T
+        matrix.flags.writeable = False
+        return matrix
+    
+    def _store(self, key: Tuple[RiskProfile, int], matrix: np.ndarray) -> None:
+        """Insert an entry, evicting least recently used ones over budget"""
+        if matrix.nbytes > self.max_bytes:
+            logger.warning(
+                "Path bank entry of %s bytes exceeds the %s byte budget; not cached",
+                matrix.nbytes, self.max_bytes
+            )
+            return
+        
+        with self._lock:
+            current = self._entries.get(key)
+            if current is not None and current.shape[0] >= matrix.shape[0]:
+                return
+            self._entries[key] = matrix
+            self._entries.move_to_end(key)
+            
+            used = sum(entry.nbytes for entry in self._entries.values())
+            while used > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                used -= evicted.nbytes
+                self.evictions += 1
+
+
+_path_bank: Optional[PathBank] = None
+_path_bank_lock = threading.Lock()
+
+
+def get_path_bank() -> Optional[PathBank]:
+    """Return the shared path bank, or None when PATH_BANK_ENABLED is off"""
+    global _path_bank
+    if not settings.PATH_BANK_ENABLED:
+        return None
+    
+    with _path_bank_lock:
+        if _path_bank is None:
+            _path_bank = PathBank(
+                size=settings.PATH_BANK_SIZE,
+                max_bytes=settings.PATH_BANK_MAX_BYTES,
+                seed=settings.PATH_BANK_SEED,
+                directory=settings.PATH_BANK_DIR or None
+            )
+        return _path_bank
+
+
+def reset_path_bank() -> None:
+    """Discard the shared bank, e.g. after settings change"""
+    global _path_bank
+    with _path_bank_lock:
+        _path_bank = None
+
+
+def _collect_metrics():
+    """Shared path bank counters for /metrics"""
+    if _path_bank is None:
+        return []
+    stats = _path_bank.stats()
+    return [
+        stat_family("path_bank_hits_total", "counter", "Path bank hits", stats["hits"]),
+        stat_family("path_bank_misses_total", "counter", "Path bank misses", stats["misses"]),
+        stat_family("path_bank_bytes", "gauge", "Memory held by path bank entries", stats["bytes"]),
+    ]
+
+
+REGISTRY.register_collector(_collect_metrics)
+
+
+def main(argv: List[str] = None) -> None:
+    """Command line entry point for managing a persisted path bank"""
+    parser = argparse.ArgumentParser(description="Manage the on-disk return path bank")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    build = commands.add_parser("build", help="Generate and persist bank entries")
+    build.add_argument("--dir", default=settings.PATH_BANK_DIR, help="Bank directory")
+    build.add_argument("--years", type=int, default=settings.PATH_BANK_PRELOAD_YEARS or 52)
+    build.add_argument("--size", type=int, default=settings.PATH_BANK_SIZE)
+    build.add_argument(
+        "--seed", type=int, action="append", dest="seeds",
+        help="Seed to include; repeatable (default: PATH_BANK_SEED)"
+    )
+    
+    check = commands.add_parser("check", help="Verify a bank against current settings")
+    check.add_argument("--dir", default=settings.PATH_BANK_DIR, help="Bank directory")
+    check.add_argument("--size", type=int, default=settings.PATH_BANK_SIZE)
+    
+    args = parser.parse_args(argv)
+    if not args.dir:
+        parser.error("--dir is required when PATH_BANK_DIR is not set")
+    
+    bank = PathBank(
+        size=args.size,
+        max_bytes=settings.PATH_BANK_MAX_BYTES,
+        seed=settings.PATH_BANK_SEED,
+        directory=args.dir
+    )
+    
+    if args.command == "build":
+        manifest_path = bank.build(args.years, args.seeds)
+        print(f"Wrote {manifest_path}")
+    elif bank.load():
+        print(f"{args.dir}: valid, {bank.stats()['mapped_entries']} entries")
+    else:
+        print(f"{args.dir}: missing or stale")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -44,8 +44,8 @@ class ProjectionService:
             Complete retirement projection response
         """
         logger.info(
-            f"Generating retirement projection - Age: {request.current_age}, "
-            f"Retirement: {request.retirement_age}, Risk: {request.risk_profile.value}"
+            "Generating retirement projection - Age: %s, Retirement: %s, Risk: %s",
+            request.current_age, request.retirement_age, request.risk_profile.value
         )
         
         # Calculate investment years
@@ -113,8 +113,8 @@ class ProjectionService:
         )
         
         logger.info(
-            f"Projection completed - Median corpus: ₹{median_corpus:,.2f}, "
-            f"Monthly pension: ₹{annuity_breakdown['monthly_pension']:,.2f}"
+            "Projection completed - Median corpus: ₹%.2f, Monthly pension: ₹%.2f",
+            median_corpus, annuity_breakdown["monthly_pension"]
         )
         
         return response
@@ -133,8 +133,8 @@ class ProjectionService:
             Comparison of all three risk scenarios
         """
         logger.info(
-            f"Comparing scenarios - Age: {request.current_age}, "
-            f"Retirement: {request.retirement_age}"
+            "Comparing scenarios - Age: %s, Retirement: %s",
+            request.current_age, request.retirement_age
         )
         
         investment_years = request.retirement_age - request.current_age
@@ -218,7 +218,7 @@ class ProjectionService:
             comparison_insights=comparison_insights
         )
         
-        logger.info(f"Scenario comparison completed for {len(scenarios)} profiles")
+        logger.info("Scenario comparison completed for %s profiles", len(scenarios))
         return response
     
     def calculate_reverse_pension(
@@ -235,7 +235,7 @@ class ProjectionService:
             Required contribution and feasibility analysis
         """
         logger.info(
-            f"Calculating reverse pension - Target: ₹{request.desired_monthly_pension:,.2f}/month"
+            "Calculating reverse pension - Target: ₹%.2f/month", request.desired_monthly_pension
         )
         
         investment_years = request.retirement_age - request.current_age
@@ -287,7 +287,7 @@ class ProjectionService:
         )
         
         logger.info(
-            f"Reverse calculation completed - Required contribution: ₹{required_contribution:,.2f}/month"
+            "Reverse calculation completed - Required contribution: ₹%.2f/month", required_contribution
         )
         
         return response
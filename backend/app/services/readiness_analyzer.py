@@ -119,7 +119,7 @@ class ReadinessAnalyzer:
             }
         
         except Exception as e:
-            logger.error(f"Error calculating readiness score: {str(e)}")
+            logger.error("Error calculating readiness score: %s", e)
             raise CalculationException(
                 "Failed to calculate retirement readiness score",
                 details={"error": str(e)}
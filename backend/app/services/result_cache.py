@@ -0,0 +1,189 @@
+"""
+Result cache for simulation endpoints
+Serves repeated identical requests without re-running Monte Carlo
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.core.metrics import REGISTRY, stat_family
+
+logger = get_logger(__name__)
+
+# Settings that change simulated results; part of every cache key so a
+# changed assumption never serves results computed under the old one
+ASSUMPTION_SETTINGS = (
+    "APP_VERSION",
+    "DEFAULT_MONTE_CARLO_ITERATIONS",
+    "MAX_MONTE_CARLO_ITERATIONS",
+    "MONTE_CARLO_PARALLEL_ENABLED",
+    "MONTE_CARLO_SHARD_SIZE",
+    "ADAPTIVE_BATCH_SIZE",
+    "ADAPTIVE_CONFIDENCE_LEVEL",
+    "PATH_BANK_ENABLED",
+    "PATH_BANK_SIZE",
+    "PATH_BANK_SEED",
+    "CONSERVATIVE_RETURN_MIN",
+    "CONSERVATIVE_RETURN_MAX",
+    "MODERATE_RETURN_MIN",
+    "MODERATE_RETURN_MAX",
+    "AGGRESSIVE_RETURN_MIN",
+    "AGGRESSIVE_RETURN_MAX",
+    "DEFAULT_ANNUITY_RATE",
+    "CORPUS_ANNUITY_ALLOCATION",
+)
+
+
+def cache_key(endpoint: str, payload: Any) -> str:
+    """
+    Canonical hash of an endpoint, its normalised input and the assumptions
+    
+    Pydantic payloads are dumped after validation, so defaults are filled in
+    and enums, numbers and field order are normalised; requests that differ
+    only in formatting share a key. The seed is part of the input, so
+    unseeded requests share whichever seed their first computation used.
+    """
+    if isinstance(payload, BaseModel):
+        payload = payload.model_dump(mode="json")
+    
+    canonical = json.dumps(
+        {
+            "endpoint": endpoint,
+            "input": payload,
+            "assumptions": {name: getattr(settings, name) for name in ASSUMPTION_SETTINGS},
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ResultCache:
+    """Thread-safe LRU cache whose entries expire after a fixed TTL"""
+    
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize an empty cache
+        
+        Args:
+            max_entries: Entries kept before least recently used are evicted
+            ttl_seconds: Lifetime of an entry after it is stored
+            clock: Monotonic time source (seconds)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            expires_at, value = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entries over capacity"""
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+    
+    def stats(self) -> Dict[str, float]:
+        """Entry count and hit/miss/eviction/expiration counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_result_cache: Optional[ResultCache] = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Return the shared result cache, or None when RESULT_CACHE_ENABLED is off"""
+    global _result_cache
+    if not settings.RESULT_CACHE_ENABLED:
+        return None
+    
+    with _result_cache_lock:
+        if _result_cache is None:
+            _result_cache = ResultCache(
+                max_entries=settings.RESULT_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.RESULT_CACHE_TTL_SECONDS
+            )
+        return _result_cache
+
+
+def reset_result_cache() -> None:
+    """Discard the shared cache, e.g. after settings change"""
+    global _result_cache
+    with _result_cache_lock:
+        _result_cache = None
+
+
+def _collect_metrics():
+    """Shared cache counters for /metrics"""
+    if _result_cache is None:
+        return []
+    stats = _result_cache.stats()
+    return [
+        stat_family("result_cache_hits_total", "counter", "Result cache hits", stats["hits"]),
+        stat_family("result_cache_misses_total", "counter", "Result cache misses", stats["misses"]),
+        stat_family(
+            "result_cache_evictions_total", "counter", "Result cache LRU evictions", stats["evictions"]
+        ),
+        stat_family("result_cache_entries", "gauge", "Result cache entries", stats["entries"]),
+    ]
+
+
+REGISTRY.register_collector(_collect_metrics)
@@ -3,9 +3,11 @@ Contribution sensitivity analysis service
 Simulates impact of contribution increase scenarios on retirement corpus
 """
 from typing import Dict, List
+from app.models.schemas import SamplingMethod
 from app.services.monte_carlo_simulator import MonteCarloSimulator
+from app.services.path_bank import get_path_bank
 from app.core.logging_config import get_logger
-from app.core.exceptions import CalculationException
+from app.core.exceptions import CalculationException, ValidationException
 
 logger = get_logger(__name__)
 
@@ -22,55 +24,73 @@ class SensitivityAnalyzer:
         years: int,
         risk_profile: str,
         annual_income_growth: float = 0.0,
-        scenarios: List[int] = None,
-        iterations: int = None
+        scenarios: List[float] = None,
+        iterations: int = None,
+        seed: int = None,
+        sampling_method: SamplingMethod = SamplingMethod.UNIFORM
     ) -> Dict:
         """
         Analyze impact of contribution increases on final corpus
         
+        Only the base contribution is simulated. Scenario projections are
+        exact rescalings of the base statistics, so the cost does not grow
+        with the number of scenarios and differences between scenarios carry
+        no sampling noise.
+        
         Args:
             base_monthly_contribution: Current monthly contribution
             years: Investment horizon
             risk_profile: Conservative, Moderate, or Aggressive
             annual_income_growth: Annual contribution growth rate
-            scenarios: Contribution increase percentages (default [5, 10, 20])
+            scenarios: Contribution change percentages (default [5, 10, 20]);
+                each must be greater than -100
             iterations: MC simulation iterations
+            seed: Random seed for reproducible simulations
+            sampling_method: Sampling scheme for return paths
         
         Returns:
             Dictionary with:
                 - base_scenario: Original projection (0% increase)
-                - sensitivity_scenarios: +5%, +10%, +20% projections
+                - sensitivity_scenarios: One projection per scenario
                 - impact_analysis: corpus gain, percentage improvement
         """
+        if scenarios is not None and any(pct <= -100 for pct in scenarios):
+            raise ValidationException(
+                "Contribution change scenarios must be greater than -100%",
+                details={"scenarios": scenarios}
+            )
+        
         try:
             if scenarios is None:
                 scenarios = SensitivityAnalyzer.DEFAULT_SCENARIOS
             
-            simulator = MonteCarloSimulator()
+            simulator = MonteCarloSimulator(seed=seed, path_bank=get_path_bank())
             
-            # Run base scenario
-            logger.info(f"Running sensitivity analysis: base={base_monthly_contribution}")
+            # Run base scenario once; the corpus is linear in the contribution,
+            # so every scenario is read off the same simulated paths
+            logger.info(
+                "Running sensitivity analysis: base=%s, scenarios=%s",
+                base_monthly_contribution, len(scenarios)
+            )
             
             base_results = simulator.simulate_retirement_corpus(
                 monthly_contribution=base_monthly_contribution,
                 years=years,
                 risk_profile=risk_profile,
                 annual_income_growth=annual_income_growth,
-                iterations=iterations
+                iterations=iterations,
+                sampling_method=sampling_method
             )
             
-            # Run sensitivity scenarios
+            # Derive sensitivity scenarios
             sensitivity_results = []
             
             for increase_pct in scenarios:
-                adjusted_contribution = base_monthly_contribution * (1 + increase_pct / 100)
+                factor = 1 + increase_pct / 100
+                adjusted_contribution = base_monthly_contribution * factor
                 
-                scenario_results = simulator.simulate_retirement_corpus(
-                    monthly_contribution=adjusted_contribution,
-                    years=years,
-                    risk_profile=risk_profile,
-                    annual_income_growth=annual_income_growth,
-                    iterations=iterations
+                scenario_results = MonteCarloSimulator.scale_statistics(
+                    base_results, factor
                 )
                 
                 # Calculate impact
@@ -90,9 +110,10 @@ class SensitivityAnalyzer:
                 }
                 sensitivity_results.append(impact)
                 
-                logger.info(
-                    f"Sensitivity +{increase_pct}%: p50 corpus = {scenario_results['percentile_50']:.2f}, "
-                    f"gain = {impact['impact_vs_base']['p50_percentage_gain']:.1f}%"
+                logger.debug(
+                    "Sensitivity +%s%%: p50 corpus = %.2f, gain = %.1f%%",
+                    increase_pct, scenario_results["percentile_50"],
+                    impact["impact_vs_base"]["p50_percentage_gain"]
                 )
             
             return {
@@ -105,12 +126,14 @@ class SensitivityAnalyzer:
                     "investment_horizon_years": years,
                     "risk_profile": risk_profile,
                     "annual_income_growth": annual_income_growth,
-                    "scenarios_tested": scenarios
+                    "scenarios_tested": scenarios,
+                    "seed": simulator.seed,
+                    "sampling_method": SamplingMethod(sampling_method).value
                 }
             }
         
         except Exception as e:
-            logger.error(f"Error in sensitivity analysis: {str(e)}")
+            logger.error("Error in sensitivity analysis: %s", e)
             raise CalculationException(
                 "Failed to analyze contribution sensitivity",
                 details={"error": str(e)}
@@ -0,0 +1,195 @@
+"""
+Bounded executor for CPU-bound simulation work
+Keeps blocking Monte Carlo runs off the asyncio event loop
+"""
+import asyncio
+import contextvars
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableException
+from app.core.logging_config import get_logger
+from app.core.metrics import REGISTRY, stat_family
+
+logger = get_logger(__name__)
+
+
+class SimulationExecutor:
+    """
+    Thread or process pool with its own queue-depth limit
+    
+    Handlers await run(); at most `workers` simulations execute at once and
+    at most `queue_limit` more wait for a worker. Beyond that, requests are
+    rejected immediately with ServiceUnavailableException (503) rather than
+    queueing without bound.
+    
+    Threads suit the NumPy kernels, which release the GIL for their array
+    operations; processes isolate pure-Python work at the cost of pickling
+    arguments and results.
+    """
+    
+    KINDS = ("thread", "process")
+    
+    def __init__(self, kind: str = "thread", workers: int = 0, queue_limit: int = 32):
+        """
+        Initialize the pool
+        
+        Args:
+            kind: "thread" or "process"
+            workers: Pool size, 0 = one per CPU core
+            queue_limit: Requests allowed to wait for a free worker
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown simulation executor: {kind}")
+        
+        self.kind = kind
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_limit = queue_limit
+        self._executor: Executor = (
+            ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="simulation")
+            if kind == "thread"
+            else ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        )
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+    
+    @property
+    def capacity(self) -> int:
+        """Running plus waiting requests accepted before rejecting"""
+        return self.workers + self.queue_limit
+    
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run fn(*args) on the pool and await its result
+        
+        Raises:
+            ServiceUnavailableException: When the queue is full
+        """
+        with self._lock:
+            if self.pending >= self.capacity:
+                self.rejected += 1
+                raise ServiceUnavailableException(
+                    "Simulation capacity exhausted, please retry shortly",
+                    details={"workers": self.workers, "queue_limit": self.queue_limit}
+                )
+            self.pending += 1
+        
+        return await asyncio.wrap_future(self._submit(fn, args))
+    
+    def call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Blocking counterpart of run() for worker threads, e.g. background jobs
+        
+        Counts towards pending but is never rejected, since the callers are
+        bounded by their own pool.
+        """
+        with self._lock:
+            self.pending += 1
+        
+        return self._submit(fn, args).result()
+    
+    def _submit(self, fn: Callable[..., Any], args: Tuple[Any, ...]) -> Future:
+        """
+        Submit work already counted in pending
+        
+        The slot is freed when the work itself finishes, not when its caller
+        stops waiting: a cancelled caller cannot stop a started worker.
+        """
+        if self.kind == "thread":
+            # Carry request context (e.g. log sampling) into the worker thread
+            fn, args = contextvars.copy_context().run, (fn, *args)
+        
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            with self._lock:
+                self.pending -= 1
+            raise
+        future.add_done_callback(self._finished)
+        return future
+    
+    def _finished(self, future: Future) -> None:
+        with self._lock:
+            self.pending -= 1
+            if not future.cancelled():
+                self.completed += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Pool configuration and queue counters"""
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "pending": self.pending,
+                "queued": max(0, self.pending - self.workers),
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pool; queued work is cancelled"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_simulation_executor: Optional[SimulationExecutor] = None
+_simulation_executor_lock = threading.Lock()
+
+
+def get_simulation_executor() -> SimulationExecutor:
+    """Return the shared executor, creating it from settings on first use"""
+    global _simulation_executor
+    with _simulation_executor_lock:
+        if _simulation_executor is None:
+            _simulation_executor = SimulationExecutor(
+                kind=settings.SIMULATION_EXECUTOR,
+                workers=settings.SIMULATION_WORKERS,
+                queue_limit=settings.SIMULATION_QUEUE_LIMIT
+            )
+            logger.info(
+                "Simulation executor started: %s pool, %s workers",
+                _simulation_executor.kind, _simulation_executor.workers
+            )
+        return _simulation_executor
+
+
+def shutdown_simulation_executor() -> None:
+    """Shut down the shared executor, if started"""
+    global _simulation_executor
+    with _simulation_executor_lock:
+        if _simulation_executor is not None:
+            _simulation_executor.shutdown(wait=False)
+            _simulation_executor = None
+
+
+def _collect_metrics():
+    """Shared executor queue counters for /metrics"""
+    if _simulation_executor is None:
+        return []
+    stats = _simulation_executor.stats()
+    return [
+        stat_family(
+            "simulation_executor_queue_depth", "gauge",
+            "Simulations waiting for a free worker", stats["queued"]
+        ),
+        stat_family(
+            "simulation_executor_pending", "gauge",
+            "Simulations running or waiting on the executor", stats["pending"]
+        ),
+        stat_family(
+            "simulation_executor_rejected_total", "counter",
+            "Simulations rejected with 503 because the queue was full", stats["rejected"]
+        ),
+    ]
+
+
+REGISTRY.register_collector(_collect_metrics)
@@ -0,0 +1,94 @@
+"""
+Single-flight request coalescing
+Concurrent identical simulations share one in-flight computation
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from app.core.metrics import REGISTRY, stat_family
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key onto one computation
+    
+    The first caller for a key (the leader) runs the computation; callers
+    arriving while it is in flight wait for the leader's result or
+    exception instead of starting their own. Nothing is kept once the
+    computation finishes, so later calls start a new flight (pair this with
+    a result cache for reuse over time).
+    """
+    
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct computations currently running"""
+        return len(self._in_flight)
+    
+    async def do(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """
+        Run compute() for the key, or join the flight already running it
+        
+        Returns:
+            Tuple of (result, coalesced) where coalesced is True for callers
+            that joined another caller's computation
+        """
+        flight = self._in_flight.get(key)
+        if flight is not None:
+            self.coalesced += 1
+            # Shield so a cancelled follower does not cancel the shared flight
+            return await asyncio.shield(flight), True
+        
+        # The flight runs as its own task, so cancelling the leader does not
+        # cancel it for the followers either
+        flight = asyncio.ensure_future(compute())
+        self._in_flight[key] = flight
+        self.leaders += 1
+        flight.add_done_callback(lambda done: self._land(key, done))
+        return await asyncio.shield(flight), False
+    
+    def _land(self, key: str, flight: asyncio.Future) -> None:
+        """Forget a finished flight so later calls start a new one"""
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+        if not flight.cancelled():
+            # Mark retrieved; callers still awaiting it receive the exception
+            flight.exception()
+    
+    def stats(self) -> Dict[str, int]:
+        """Leader, coalesced and in-flight counts"""
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight,
+        }
+
+
+# Shared by the simulation endpoints
+simulation_flights = SingleFlight()
+
+
+def _collect_metrics():
+    """Request coalescing counters for /metrics"""
+    stats = simulation_flights.stats()
+    return [
+        stat_family(
+            "single_flight_in_flight", "gauge",
+            "Distinct endpoint simulations currently in flight", stats["in_flight"]
+        ),
+        stat_family(
+            "single_flight_coalesced_total", "counter",
+            "Requests that joined an in-flight simulation", stats["coalesced"]
+        ),
+    ]
+
+
+REGISTRY.register_collector(_collect_metrics)
@@ -0,0 +1,86 @@
+"""
+Health check latency under simulation load
+Fires concurrent heavy forecasts at the app in-process and samples /health
+latency meanwhile, with simulations on the executor and (for comparison)
+run inline on the event loop as the handlers originally did.
+
+Usage (from the backend directory):
+    python -m benchmarks.health_under_load [--forecasts 8] [--iterations 50000]
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+import httpx
+
+from app.core.config import settings
+from app.main import app
+from app.routes import forecast
+
+
+class InlineExecutor:
+    """Runs simulations directly on the event loop (blocking)"""
+    
+    async def run(self, fn, *args):
+        return fn(*args)
+
+
+async def measure(forecasts: int, iterations: int) -> list:
+    """Return /health latencies (ms) sampled while forecasts run"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        heavy = [
+            asyncio.ensure_future(client.post(
+                f"{settings.API_V1_PREFIX}/forecast/retirement",
+                json={
+                    "current_age": 18, "retirement_age": 70,
+                    "monthly_contribution": 5000 + index,  # Distinct, so not coalesced
+                    "monte_carlo_iterations": iterations,
+                }
+            ))
+            for index in range(forecasts)
+        ]
+        
+        latencies = []
+        while not all(task.done() for task in heavy):
+            start = time.perf_counter()
+            await client.get("/health")
+            latencies.append((time.perf_counter() - start) * 1000)
+            await asyncio.sleep(0.005)
+        
+        await asyncio.gather(*heavy)
+        return latencies
+
+
+def report(label: str, latencies: list) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[int(0.95 * (len(ordered) - 1))]
+    print(f"{label:<12}{len(latencies):>9}{statistics.median(ordered):>12.2f}"
+          f"{p95:>12.2f}{ordered[-1]:>12.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--forecasts", type=int, default=8)
+    parser.add_argument("--iterations", type=int, default=50000)
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    settings.RESULT_CACHE_ENABLED = False
+    
+    print(f"{args.forecasts} concurrent forecasts x {args.iterations} iterations")
+    print(f"{'mode':<12}{'samples':>9}{'p50 (ms)':>12}{'p95 (ms)':>12}{'max (ms)':>12}")
+    report("executor", asyncio.run(measure(args.forecasts, args.iterations)))
+    
+    original = forecast.get_simulation_executor
+    forecast.get_simulation_executor = InlineExecutor
+    try:
+        report("inline", asyncio.run(measure(args.forecasts, args.iterations)))
+    finally:
+        forecast.get_simulation_executor = original
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""
+Load-testing harness for the forecast API
+Drives a weighted mix of simulation requests at fixed concurrency, either
+in-process through an httpx ASGI transport or against a local uvicorn, and
+reports throughput, latency percentiles, error rate and event-loop lag.
+
+Runs entirely offline. Settings can be overridden with --set to compare
+engine and cache options on the same machine.
+
+Usage (from the backend directory):
+    python -m benchmarks.load_test [--concurrency 16] [--duration 10]
+    python -m benchmarks.load_test --set RESULT_CACHE_ENABLED=false --set SIMULATION_WORKERS=2
+    python -m benchmarks.load_test --uvicorn --uvicorn-workers 2 --users 50
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --mix retirement=1
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import numpy as np
+
+from app.core.config import settings
+
+ENDPOINTS = {
+    "retirement": "/forecast/retirement",
+    "scenario-comparison": "/forecast/scenario-comparison",
+    "sensitivity-analysis": "/forecast/sensitivity-analysis",
+    "delay-impact": "/forecast/delay-impact",
+}
+DEFAULT_MIX = "retirement=6,scenario-comparison=2,sensitivity-analysis=1,delay-impact=1"
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse "endpoint=weight,..." into weights"""
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        if name.strip() not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(
+                f"Unknown endpoint {name!r}; choose from {', '.join(ENDPOINTS)}"
+            )
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def make_user(rng: random.Random, iterations: Optional[int]) -> Dict[str, Any]:
+    """One simulated user's planning inputs, drawn from plausible ranges"""
+    user = {
+        "current_age": rng.randint(22, 50),
+        "retirement_age": rng.choice([55, 58, 60, 60, 60, 62, 65]),
+        "monthly_contribution": rng.choice([2000, 3000, 5000, 5000, 7500, 10000, 15000, 25000]),
+        "annual_income_growth": rng.choice([3.0, 5.0, 5.0, 7.0, 10.0]),
+        "risk_profile": rng.choice(["conservative", "moderate", "moderate", "aggressive"]),
+        # A fixed seed per user: repeat requests are identical and cacheable
+        "seed": rng.randrange(2 ** 31),
+    }
+    if iterations:
+        user["monte_carlo_iterations"] = iterations
+    return user
+
+
+def make_payload(endpoint: str, user: Dict[str, Any]) -> Dict[str, Any]:
+    """Request body for an endpoint from a user's inputs"""
+    if endpoint == "retirement":
+        return user
+    if endpoint == "scenario-comparison":
+        return {"base_input": user}
+    if endpoint == "sensitivity-analysis":
+        return user
+    # delay-impact plans against the current retirement age
+    payload = {key: value for key, value in user.items() if key != "retirement_age"}
+    payload["planned_retirement_age"] = user["retirement_age"]
+    return payload
+
+
+async def monitor_loop_lag(interval: float, lags: List[float], stop: asyncio.Event) -> None:
+    """Record how late the event loop wakes from sleep(interval), in ms"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, (time.perf_counter() - start - interval) * 1000))
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    weights: Dict[str, float],
+    users: List[Dict[str, Any]],
+    concurrency: int,
+    duration: float,
+    max_requests: Optional[int],
+    seed: int
+) -> Tuple[List[Tuple[str, float, Optional[int]]], float, List[float]]:
+    """
+    Closed-loop load: each worker sends its next request as soon as the last returns
+    
+    Returns:
+        (endpoint, latency ms, status or None on transport error) per request,
+        the wall time in seconds, and event-loop lag samples in ms
+    """
+    rng = random.Random(seed)
+    names = list(weights)
+    cumulative = np.cumsum([weights[name] for name in names])
+    samples: List[Tuple[str, float, Optional[int]]] = []
+    issued = 0
+    deadline = time.perf_counter() + duration
+    
+    async def worker() -> None:
+        nonlocal issued
+        while time.perf_counter() < deadline and (max_requests is None or issued < max_requests):
+            issued += 1
+            endpoint = names[int(np.searchsorted(cumulative, rng.random() * cumulative[-1], side="right"))]
+            payload = make_payload(endpoint, rng.choice(users))
+            start = time.perf_counter()
+            try:
+                response = await client.post(
+                    settings.API_V1_PREFIX + ENDPOINTS[endpoint], json=payload
+                )
+                status: Optional[int] = response.status_code
+            except httpx.HTTPError:
+                status = None
+            samples.append((endpoint, (time.perf_counter() - start) * 1000, status))
+    
+    lags: List[float] = []
+    stop = asyncio.Event()
+    lag_task = asyncio.ensure_future(monitor_loop_lag(0.01, lags, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await lag_task
+    return samples, elapsed, lags
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {"p50": float(p50), "p95": float(p95), "p99": float(p99), "max": float(max(values))}
+
+
+def summarize(
+    samples: List[Tuple[str, float, Optional[int]]], elapsed: float, lags: List[float]
+) -> Dict[str, Any]:
+    """Throughput, latency percentiles and errors overall and per endpoint"""
+    def block(rows):
+        errors = sum(1 for _, _, status in rows if status is None or status >= 400)
+        return {
+            "requests": len(rows),
+            "rps": len(rows) / elapsed if elapsed else 0.0,
+            "error_rate": errors / len(rows) if rows else 0.0,
+            "latency_ms": percentiles([latency for _, latency, _ in rows]),
+        }
+    
+    by_endpoint = defaultdict(list)
+    for row in samples:
+        by_endpoint[row[0]].append(row)
+    
+    return {
+        "duration_s": elapsed,
+        **block(samples),
+        "status_codes": dict(Counter(
+            "error" if status is None else str(status) for _, _, status in samples
+        )),
+        "event_loop_lag_ms": percentiles(lags),
+        "endpoints": {name: block(rows) for name, rows in sorted(by_endpoint.items())},
+    }
+
+
+def print_report(summary: Dict[str, Any], target: str) -> None:
+    print(f"target: {target}")
+    print(f"{summary['requests']} requests in {summary['duration_s']:.1f} s, "
+          f"{summary['rps']:.1f} req/s, error rate {summary['error_rate']:.2%}, "
+          f"status codes {summary['status_codes']}")
+    print(f"{'endpoint':<24}{'requests':>10}{'req/s':>9}{'errors':>9}"
+          f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, block in [("all", summary), *summary["endpoints"].items()]:
+        latency = block["latency_ms"]
+        print(f"{name:<24}{block['requests']:>10}{block['rps']:>9.1f}{block['error_rate']:>9.2%}"
+              f"{latency['p50']:>10.1f}{latency['p95']:>10.1f}{latency['p99']:>10.1f}"
+              f"{latency['max']:>10.1f}")
+    lag = summary["event_loop_lag_ms"]
+    print(f"event-loop lag: p50 {lag['p50']:.2f} ms, p99 {lag['p99']:.2f} ms, "
+          f"max {lag['max']:.2f} ms")
+
+
+def apply_overrides(overrides: List[str]) -> Dict[str, str]:
+    """Apply KEY=VALUE settings in-process; returns them as environment variables"""
+    env = {}
+    for override in overrides:
+        key, _, value = override.partition("=")
+        if key not in type(settings).model_fields:
+            raise SystemExit(f"Unknown setting: {key}")
+        # Validate through the settings model so "false", "2" etc. convert
+        setattr(settings, key, getattr(type(settings)(**{key: value}), key))
+        env[key] = value
+    return env
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_uvicorn(workers: int, env: Dict[str, str]) -> Tuple[subprocess.Popen, str]:
+    """Start app.main:app on a free local port and wait for /health"""
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1",
+         "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        env={**os.environ, **env},
+        stdout=subprocess.DEVNULL
+    )
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{url}/health").status_code == 200:
+                return process, url
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.terminate()
+    raise SystemExit("uvicorn did not become healthy within 60 s")
+
+
+async def main_async(args: argparse.Namespace, url: Optional[str]) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    users = [make_user(rng, args.iterations) for _ in range(args.users)]
+    
+    if url:
+        transport = httpx.AsyncHTTPTransport(limits=httpx.Limits(max_connections=args.concurrency))
+        base_url = url
+    else:
+        from app.main import app
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://loadtest"
+    
+    async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=None) as client:
+        if args.warmup:
+            await run_load(client, args.mix, users, args.concurrency, args.warmup, None, args.seed + 1)
+        samples, elapsed, lags = await run_load(
+            client, args.mix, users, args.concurrency, args.duration, args.requests, args.seed
+        )
+    return summarize(samples, elapsed, lags)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load")
+    parser.add_argument("--requests", type=int, default=None, help="Stop after this many requests")
+    parser.add_argument("--warmup", type=float, default=1.0, help="Seconds of unmeasured load first")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f"Weighted endpoint mix (default {DEFAULT_MIX})")
+    parser.add_argument("--users", type=int, default=200,
+                        help="Distinct users; fewer users means more cache hits")
+    parser.add_argument("--iterations", type=int, default=None,
+                        help="monte_carlo_iterations per request (default: API default)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                        help="Override a setting, e.g. RESULT_CACHE_ENABLED=false; repeatable")
+    parser.add_argument("--url", help="Load an already running server instead of in-process")
+    parser.add_argument("--uvicorn", action="store_true",
+                        help="Start a local uvicorn with the overrides and load it")
+    parser.add_argument("--uvicorn-workers", type=int, default=1)
+    parser.add_argument("--json", help="Also write the summary to this file")
+    args = parser.parse_args()
+    
+    logging.disable(logging.WARNING)
+    env = apply_overrides(args.set)
+    
+    process = None
+    url = args.url
+    if args.uvicorn:
+        process, url = start_uvicorn(args.uvicorn_workers, env)
+    try:
+        summary = asyncio.run(main_async(args, url))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    
+    target = url or "in-process ASGI"
+    summary["config"] = {
+        "target": target,
+        "concurrency": args.concurrency,
+        "mix": args.mix,
+        "users": args.users,
+        "iterations": args.iterations,
+        "overrides": env,
+    }
+    print_report(summary, target)
+    if url:
+        print("note: event-loop lag is the load generator's loop, not the server's")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Middleware per-request overhead benchmark
+Times requests through the application's middleware stack against the same
+trivial endpoint with no middleware, in-process over ASGI.
+
+Usage (from the backend directory):
+    python -m benchmarks.middleware_overhead [--requests 2000] [--repeats 5]
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from app.core.middleware import ErrorHandlingMiddleware, RequestLoggingMiddleware
+
+
+def build_app(with_middleware: bool) -> FastAPI:
+    app = FastAPI()
+    
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+    
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(10):
+                yield b"x" * 1024
+        return StreamingResponse(chunks())
+    
+    if with_middleware:
+        # Same order as app.main
+        app.add_middleware(ErrorHandlingMiddleware)
+        app.add_middleware(RequestLoggingMiddleware)
+    return app
+
+
+async def time_requests(app: FastAPI, path: str, count: int) -> float:
+    """Return mean microseconds per request"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(50):
+            await client.get(path)
+        start = time.perf_counter()
+        for _ in range(count):
+            await client.get(path)
+        return (time.perf_counter() - start) / count * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    print(f"{'path':<10}{'bare (us)':>12}{'stack (us)':>12}{'overhead (us)':>15}")
+    for path in ("/ping", "/stream"):
+        # Interleave and keep the best run of each to damp machine noise
+        bare, stack = float("inf"), float("inf")
+        for _ in range(args.repeats):
+            bare = min(bare, asyncio.run(time_requests(build_app(False), path, args.requests)))
+            stack = min(stack, asyncio.run(time_requests(build_app(True), path, args.requests)))
+        print(f"{path:<10}{bare:>12.1f}{stack:>12.1f}{stack - bare:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Parallel Monte Carlo speedup benchmark
+Times the sharded process-pool engine against the in-process vectorized
+engine for pool sizes from 1 up to the number of CPU cores.
+
+Usage (from the backend directory):
+    python -m benchmarks.parallel_speedup [--iterations 50000] [--years 30]
+"""
+import argparse
+import logging
+import os
+import time
+
+from app.core.config import settings
+from app.models.schemas import RiskProfile
+from app.services.monte_carlo_simulator import MonteCarloSimulator, shutdown_process_pool
+
+
+def time_engine(engine: str, iterations: int, years: int, repeats: int) -> float:
+    """Return the best wall time in seconds over several repeats"""
+    best = float("inf")
+    for _ in range(repeats):
+        simulator = MonteCarloSimulator(seed=2026)
+        start = time.perf_counter()
+        simulator.simulate_retirement_corpus(
+            monthly_contribution=5000,
+            years=years,
+            risk_profile=RiskProfile.MODERATE,
+            annual_income_growth=5.0,
+            iterations=iterations,
+            engine=engine
+        )
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=settings.MAX_MONTE_CARLO_ITERATIONS)
+    parser.add_argument("--years", type=int, default=30)
+    parser.add_argument("--shard-size", type=int, default=None)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    if args.shard_size:
+        settings.MONTE_CARLO_SHARD_SIZE = args.shard_size
+    else:
+        # One shard per core at the largest pool size
+        cores = os.cpu_count() or 1
+        settings.MONTE_CARLO_SHARD_SIZE = -(-args.iterations // cores)
+    
+    baseline = time_engine("vectorized", args.iterations, args.years, args.repeats)
+    print(f"{args.iterations} iterations x {args.years} years, "
+          f"shard size {settings.MONTE_CARLO_SHARD_SIZE}")
+    print(f"{'engine':<22}{'time (ms)':>12}{'speedup':>10}")
+    print(f"{'vectorized':<22}{baseline * 1000:>12.1f}{1.0:>10.2f}")
+    
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        settings.MONTE_CARLO_POOL_SIZE = workers
+        shutdown_process_pool()
+        time_engine("parallel", args.iterations, args.years, 1)  # Warm up workers
+        elapsed = time_engine("parallel", args.iterations, args.years, args.repeats)
+        print(f"{f'parallel x{workers}':<22}{elapsed * 1000:>12.1f}{baseline / elapsed:>10.2f}")
+    
+    shutdown_process_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+"""
+Service and endpoint benchmark suite with stored baselines
+Times the simulator over a grid of iterations, years and risk profiles, the
+analysis services, and full endpoint round trips through the ASGI app, and
+compares runs against a JSON baseline.
+
+Usage (from the backend directory):
+    python -m benchmarks.run list
+    python -m benchmarks.run run [--filter simulator] [--save benchmarks/baselines/main.json]
+    python -m benchmarks.run compare benchmarks/baselines/main.json [--threshold 0.15]
+    python -m benchmarks.run compare benchmarks/baselines/main.json current.json
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+from app.core.config import settings
+from app.models.schemas import RiskProfile
+from app.services.delay_simulator import DelaySimulator
+from app.services.financial_calculator import FinancialCalculator
+from app.services.insight_generator import InsightGenerator
+from app.services.monte_carlo_simulator import MonteCarloSimulator
+from app.services.result_cache import reset_result_cache
+from app.services.sensitivity_analyzer import SensitivityAnalyzer
+from app.services.simulation_executor import shutdown_simulation_executor
+
+SEED = 2026
+
+# name -> setup() returning the zero-argument callable to time
+BENCHMARKS: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark setup function under a name"""
+    def register(setup: Callable[[], Callable[[], Any]]):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+# Simulator grid
+
+def _simulator_case(iterations: int, years: int, risk_profile: RiskProfile):
+    def setup():
+        return lambda: MonteCarloSimulator(seed=SEED).simulate_retirement_corpus(
+            monthly_contribution=5000,
+            years=years,
+            risk_profile=risk_profile,
+            annual_income_growth=5.0,
+            iterations=iterations,
+            engine="vectorized"
+        )
+    return setup
+
+
+for _iterations, _years, _profile in itertools.product(
+    (1000, 10000), (10, 30), list(RiskProfile)
+):
+    benchmark(
+        f"simulator/simulate_retirement_corpus"
+        f"[iterations={_iterations},years={_years},profile={_profile.value}]"
+    )(_simulator_case(_iterations, _years, _profile))
+
+
+# Services
+
+@benchmark("services/sensitivity_analysis")
+def _sensitivity_analysis():
+    return lambda: SensitivityAnalyzer.analyze_contribution_sensitivity(
+        base_monthly_contribution=5000,
+        years=30,
+        risk_profile=RiskProfile.MODERATE,
+        annual_income_growth=5.0,
+        seed=SEED
+    )
+
+
+@benchmark("services/delay_impact")
+def _delay_impact():
+    return lambda: DelaySimulator.simulate_retirement_delay(
+        base_retirement_age=60,
+        current_age=30,
+        monthly_contribution=5000,
+        risk_profile=RiskProfile.MODERATE,
+        annual_income_growth=5.0,
+        seed=SEED
+    )
+
+
+@benchmark("services/reverse_calculate_required_contribution")
+def _reverse_calculation():
+    return lambda: FinancialCalculator.reverse_calculate_required_contribution(
+        desired_monthly_pension=50000,
+        years=30,
+        annual_return_rate=10.0,
+        annual_income_growth=5.0
+    )
+
+
+@benchmark("services/generate_insights")
+def _generate_insights():
+    generator = InsightGenerator()
+    return lambda: generator.generate_insights(
+        p10=8500000.0,
+        p50=12000000.0,
+        p90=16500000.0,
+        total_contributions=3000000.0,
+        years_to_retirement=30,
+        risk_profile=RiskProfile.MODERATE
+    )
+
+
+# Endpoint round trips through the ASGI app (in-process, no sockets)
+
+class _AppClient:
+    """Event loop and httpx client shared by the endpoint benchmarks"""
+    
+    def __init__(self):
+        from app.main import app
+        self.loop = asyncio.new_event_loop()
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench"
+        )
+    
+    def request(self, method: str, path: str, payload: Optional[dict] = None) -> None:
+        response = self.loop.run_until_complete(
+            self.client.request(method, path, json=payload)
+        )
+        response.raise_for_status()
+    
+    def close(self) -> None:
+        self.loop.run_until_complete(self.client.aclose())
+        self.loop.close()
+        shutdown_simulation_executor()
+
+
+_app_client: Optional[_AppClient] = None
+
+
+def _endpoint_case(method: str, path: str, payload: Optional[dict] = None):
+    def setup():
+        global _app_client
+        if _app_client is None:
+            _app_client = _AppClient()
+        client = _app_client
+        return lambda: client.request(method, path, payload)
+    return setup
+
+
+_FORECAST_INPUT = {
+    "current_age": 30,
+    "retirement_age": 60,
+    "monthly_contribution": 5000,
+    "annual_income_growth": 5.0,
+    "risk_profile": "moderate",
+    "seed": SEED,
+}
+_ANALYSIS_INPUT = {
+    "current_age": 30,
+    "monthly_contribution": 5000,
+    "annual_income_growth": 5.0,
+    "risk_profile": "moderate",
+    "seed": SEED,
+}
+
+for _name, _method, _path, _payload in (
+    ("health", "GET", "/health", None),
+    ("retirement", "POST", "/api/v1/forecast/retirement", _FORECAST_INPUT),
+    ("scenario-comparison", "POST", "/api/v1/forecast/scenario-comparison",
+     {"base_input": _FORECAST_INPUT}),
+    ("sensitivity-analysis", "POST", "/api/v1/forecast/sensitivity-analysis",
+     {**_ANALYSIS_INPUT, "retirement_age": 60}),
+    ("delay-impact", "POST", "/api/v1/forecast/delay-impact",
+     {**_ANALYSIS_INPUT, "planned_retirement_age": 60}),
+    ("reverse-pension", "POST", "/api/v1/forecast/reverse-pension", {
+        "current_age": 30,
+        "retirement_age": 60,
+        "desired_monthly_pension": 50000,
+        "annual_income_growth": 5.0,
+        "risk_profile": "moderate",
+    }),
+):
+    benchmark(f"endpoints/{_name}")(_endpoint_case(_method, _path, _payload))
+
+
+def time_benchmark(fn: Callable[[], Any], repeats: int, min_time: float) -> Dict[str, float]:
+    """
+    Time fn like timeit: each repeat runs enough calls to last min_time
+    
+    Returns:
+        Per-call milliseconds (min, median, mean, stdev over repeats), calls
+        per repeat and repeat count
+    """
+    fn()  # Warm up caches, imports and lazy pools
+    
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    
+    samples = [elapsed / number]
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    
+    samples_ms = [sample * 1000 for sample in samples]
+    return {
+        "min_ms": min(samples_ms),
+        "median_ms": statistics.median(samples_ms),
+        "mean_ms": statistics.fmean(samples_ms),
+        "stdev_ms": statistics.stdev(samples_ms) if len(samples_ms) > 1 else 0.0,
+        "number": number,
+        "repeats": repeats,
+    }
+
+
+def environment() -> Dict[str, Any]:
+    """Machine and library details stored with every result file"""
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_suite(
+    names: List[str], repeats: int, min_time: float, verbose: bool = True
+) -> Dict[str, Any]:
+    """Run the named benchmarks and return a result document"""
+    # Measure the work, not the result cache
+    cache_enabled = settings.RESULT_CACHE_ENABLED
+    settings.RESULT_CACHE_ENABLED = False
+    reset_result_cache()
+    
+    results = {}
+    width = max(map(len, names), default=0) + 2
+    try:
+        for name in names:
+            results[name] = time_benchmark(BENCHMARKS[name](), repeats, min_time)
+            if verbose:
+                print(f"{name:<{width}}{results[name]['median_ms']:>12.3f} ms", flush=True)
+    finally:
+        settings.RESULT_CACHE_ENABLED = cache_enabled
+        global _app_client
+        if _app_client is not None:
+            _app_client.close()
+            _app_client = None
+    
+    return {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "environment": environment(),
+        "results": results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float,
+    metric: str = "min_ms"
+) -> List[Dict[str, Any]]:
+    """
+    Compare benchmarks present in both documents
+    
+    Returns:
+        One row per benchmark with both times, the ratio current/baseline
+        and a status of "regression", "improvement" or "ok"
+    """
+    rows = []
+    for name, base in baseline["results"].items():
+        if name not in current["results"]:
+            continue
+        ratio = current["results"][name][metric] / base[metric]
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append({
+            "name": name,
+            "baseline_ms": base[metric],
+            "current_ms": current["results"][name][metric],
+            "ratio": ratio,
+            "status": status,
+        })
+    return rows
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def _save(document: Dict[str, Any], path: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"saved {len(document['results'])} results to {path}")
+
+
+def _select(pattern: Optional[str]) -> List[str]:
+    return [name for name in BENCHMARKS if not pattern or pattern in name]
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    list_parser = commands.add_parser("list", help="List benchmark names")
+    list_parser.add_argument("--filter", help="Only names containing this text")
+    
+    run_parser = commands.add_parser("run", help="Run benchmarks")
+    compare_parser = commands.add_parser(
+        "compare", help="Compare against a baseline; exit 1 on regressions"
+    )
+    compare_parser.add_argument("baseline", help="Baseline JSON file")
+    compare_parser.add_argument(
+        "current", nargs="?", help="Result JSON to compare (default: run the suite now)"
+    )
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.15,
+        help="Relative slowdown flagged as a regression (default 0.15 = 15%%)"
+    )
+    compare_parser.add_argument(
+        "--metric", default="min_ms", choices=("min_ms", "median_ms", "mean_ms")
+    )
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("--filter", help="Only benchmarks whose name contains this text")
+        sub.add_argument("--repeats", type=int, default=7)
+        sub.add_argument("--min-time", type=float, default=0.1, help="Seconds per repeat")
+        sub.add_argument("--save", help="Write the results of this run to a JSON file")
+    args = parser.parse_args(argv)
+    
+    logging.disable(logging.INFO)
+    
+    if args.command == "list":
+        print("\n".join(_select(args.filter)))
+        return 0
+    
+    if args.command == "run":
+        document = run_suite(_select(args.filter), args.repeats, args.min_time)
+        if args.save:
+            _save(document, args.save)
+        return 0
+    
+    if not os.path.exists(args.baseline):
+        parser.error(
+            f"baseline {args.baseline} not found; record one with "
+            f"python -m benchmarks.run run --save {args.baseline}"
+        )
+    baseline = _load(args.baseline)
+    if args.current:
+        current = _load(args.current)
+    else:
+        names = [name for name in _select(args.filter) if name in baseline["results"]]
+        current = run_suite(names, args.repeats, args.min_time, verbose=False)
+        if args.save:
+            _save(current, args.save)
+    
+    rows = compare(baseline, current, args.threshold, args.metric)
+    width = max((len(row["name"]) for row in rows), default=9) + 2
+    print(f"{'benchmark':<{width}}{'baseline':>12}{'current':>12}{'ratio':>8}")
+    for row in rows:
+        flag = {"regression": "  REGRESSION", "improvement": "  faster"}.get(row["status"], "")
+        print(f"{row['name']:<{width}}{row['baseline_ms']:>10.3f}ms{row['current_ms']:>10.3f}ms"
+              f"{row['ratio']:>8.2f}{flag}")
+    
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if baseline["environment"] != current["environment"]:
+        print("note: baseline was recorded on a different environment")
+    print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%} in {len(rows)} benchmarks")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
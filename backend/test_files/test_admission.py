@@ -0,0 +1,159 @@
+"""
+Unit tests for admission module
+Tests the cost budget, the bounded wait queue and 429 responses
+"""
+import asyncio
+import threading
+import httpx
+import pytest
+from app.core.config import settings
+from app.core.exceptions import TooManyRequestsException
+from app.core.metrics import REGISTRY
+from app.main import app
+from app.routes import forecast
+from app.services import admission
+from app.services.admission import AdmissionController, estimate_cost
+
+
+class TestAdmissionController:
+    """Test suite for AdmissionController"""
+    
+    def test_estimate_cost(self):
+        """Test that cost is iterations x years x simulations"""
+        assert estimate_cost(10000, 30) == 300000
+        assert estimate_cost(50000, 40, 3) == 6000000
+        assert estimate_cost(None, 10) == settings.DEFAULT_MONTE_CARLO_ITERATIONS * 10
+    
+    @pytest.mark.asyncio
+    async def test_admits_within_budget(self):
+        """Test that requests within the budget run at once and return their cost"""
+        controller = AdmissionController(budget=100)
+        
+        async with controller.admit(40):
+            async with controller.admit(60):
+                assert controller.stats()["in_flight"] == 100
+        
+        assert controller.stats()["in_flight"] == 0
+        assert controller.admitted == 2
+    
+    @pytest.mark.asyncio
+    async def test_waits_for_budget_in_order(self):
+        """Test that queued requests are admitted in arrival order as budget frees"""
+        controller = AdmissionController(budget=100, queue_limit=4, queue_timeout=5)
+        order = []
+        
+        async def request(name, cost):
+            async with controller.admit(cost):
+                order.append(name)
+        
+        async with controller.admit(100):
+            waiting = [
+                asyncio.ensure_future(request("large", 80)),
+                asyncio.ensure_future(request("small", 10)),
+            ]
+            await asyncio.sleep(0.01)
+            assert controller.stats()["queued"] == 2
+            assert order == []
+        
+        await asyncio.gather(*waiting)
+        assert order == ["large", "small"]
+        assert controller.stats()["in_flight"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        """Test that requests past the queue limit are rejected with 429"""
+        controller = AdmissionController(budget=100, queue_limit=1, queue_timeout=5)
+        
+        async with controller.admit(100):
+            waiting = asyncio.ensure_future(controller.admit(50).__aenter__())
+            await asyncio.sleep(0.01)
+            
+            with pytest.raises(TooManyRequestsException) as error:
+                async with controller.admit(50):
+                    pass
+            assert error.value.status_code == 429
+            assert error.value.retry_after >= 1
+            assert controller.rejected == 1
+        
+        await waiting
+        assert controller.stats()["in_flight"] == 50
+    
+    @pytest.mark.asyncio
+    async def test_wait_times_out(self):
+        """Test that a request waiting longer than the timeout is rejected and dequeued"""
+        controller = AdmissionController(budget=100, queue_limit=4, queue_timeout=0.05)
+        
+        async with controller.admit(100):
+            with pytest.raises(TooManyRequestsException):
+                async with controller.admit(10):
+                    pass
+            assert controller.stats()["queued"] == 0
+        
+        assert controller.stats()["in_flight"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_blocking_hold_waits_in_queue(self):
+        """Test that a worker thread's hold() waits for budget released by the loop"""
+        controller = AdmissionController(budget=100, queue_limit=0)
+        held = threading.Event()
+        
+        def worker():
+            with controller.hold(60):
+                held.set()
+        
+        async with controller.admit(50):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            await asyncio.sleep(0.05)
+            assert controller.stats()["queued"] == 1
+            assert not held.is_set()
+        
+        thread.join(timeout=5)
+        assert held.is_set()
+        assert controller.admitted == 2
+        assert controller.stats()["in_flight"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_oversized_request_runs_alone(self):
+        """Test that a request above the whole budget is clamped and still runs"""
+        controller = AdmissionController(budget=100)
+        
+        async with controller.admit(10 ** 9):
+            assert controller.stats()["in_flight"] == 100
+        
+        assert controller.stats()["in_flight"] == 0
+
+
+class TestAdmissionEndpoints:
+    """Test suite for admission control on the forecast endpoints"""
+    
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_returns_429(self, monkeypatch):
+        """Test that a request shed by admission control maps to 429 with Retry-After"""
+        monkeypatch.setattr(settings, "RESULT_CACHE_ENABLED", False)
+        full = AdmissionController(budget=100, queue_limit=0)
+        full.in_flight = 100
+        monkeypatch.setattr(forecast, "get_admission_controller", lambda: full)
+        
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post(
+                f"{settings.API_V1_PREFIX}/forecast/sensitivity-analysis",
+                json={"current_age": 30, "retirement_age": 60, "monthly_contribution": 5000}
+            )
+        
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+        assert full.rejected == 1
+    
+    @pytest.mark.asyncio
+    async def test_budget_usage_on_metrics(self, monkeypatch):
+        """Test that /metrics reports the shared controller's budget usage"""
+        monkeypatch.setattr(admission, "_admission_controller", AdmissionController(budget=1000))
+        
+        async with admission._admission_controller.admit(250):
+            rendered = REGISTRY.render()
+        
+        assert "admission_budget_path_years 1000" in rendered
+        assert "admission_in_flight_path_years 250" in rendered
+        assert "admission_budget_utilization 0.25" in rendered
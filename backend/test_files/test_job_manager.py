@@ -0,0 +1,231 @@
+"""
+Unit tests for job_manager module
+Tests background jobs, result retention, idempotency keys and the /jobs API
+"""
+import threading
+import time
+import pytest
+from fastapi.testclient import TestClient
+from app.core.config import settings
+from app.core.exceptions import ConflictException, TooManyRequestsException
+from app.main import app
+from app.models.schemas import JobStatus, SensitivityRequest
+from app.routes import forecast
+from app.services import job_manager
+from app.services.admission import AdmissionController
+from app.services.job_manager import FINISHED, JobManager
+
+
+def wait_for(manager, job_id, timeout=10.0):
+    """Poll until the job finishes"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = manager.get(job_id)
+        if job.status in FINISHED:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestJobManager:
+    """Test suite for JobManager"""
+    
+    @pytest.fixture
+    def manager(self):
+        manager = JobManager(workers=1, ttl_seconds=60, max_pending=2)
+        yield manager
+        manager.shutdown()
+    
+    def test_runs_steps_in_order(self, manager):
+        """Test that steps run in order and their results become the job's"""
+        job, created = manager.submit(["a", "b"], [lambda: 1, lambda: 2])
+        
+        job = wait_for(manager, job.job_id)
+        
+        assert created
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.results == [1, 2]
+        assert job.progress == 1.0
+        assert job.expires_at == job.finished_at + 60
+    
+    def test_failed_step(self, manager):
+        """Test that an exception fails the job and skips later steps"""
+        def fail():
+            raise ValueError("bad input")
+        
+        job, _ = manager.submit(["a", "b", "c"], [lambda: 1, fail, lambda: 3])
+        
+        job = wait_for(manager, job.job_id)
+        
+        assert job.status == JobStatus.FAILED
+        assert job.error == "bad input"
+        assert job.results == [1]
+        assert job.progress == pytest.approx(1 / 3)
+        assert manager.stats()["failed"] == 1
+    
+    def test_idempotency_key(self, manager):
+        """Test that a known key returns its job and a different request conflicts"""
+        first, created = manager.submit(["a"], [lambda: 1], "key-1", "request-a")
+        again, replayed_created = manager.submit(["a"], [lambda: 1], "key-1", "request-a")
+        
+        assert created and not replayed_created
+        assert again is first
+        assert manager.stats()["submitted"] == 1
+        with pytest.raises(ConflictException) as error:
+            manager.submit(["b"], [lambda: 2], "key-1", "request-b")
+        assert error.value.status_code == 409
+    
+    def test_results_expire(self):
+        """Test that finished jobs and their keys are dropped after the TTL"""
+        clock = FakeClock()
+        manager = JobManager(workers=1, ttl_seconds=60, clock=clock)
+        job, _ = manager.submit(["a"], [lambda: 1], "key-1", "request-a")
+        wait_for(manager, job.job_id)
+        
+        clock.now += 59
+        assert manager.get(job.job_id) is not None
+        clock.now += 1
+        assert manager.get(job.job_id) is None
+        
+        replacement, created = manager.submit(["a"], [lambda: 1], "key-1", "request-a")
+        assert created
+        assert replacement.job_id != job.job_id
+        assert manager.stats()["expired"] == 1
+        manager.shutdown()
+    
+    def test_rejects_beyond_max_pending(self, manager):
+        """Test that submissions past max_pending unfinished jobs are rejected"""
+        release = threading.Event()
+        manager.submit(["a"], [release.wait])
+        manager.submit(["b"], [release.wait])
+        
+        with pytest.raises(TooManyRequestsException) as error:
+            manager.submit(["c"], [release.wait])
+        assert error.value.status_code == 429
+        release.set()
+    
+    def test_cancel_queued_job(self, manager):
+        """Test that a queued job is cancelled without running"""
+        release = threading.Event()
+        running, _ = manager.submit(["a"], [release.wait])
+        ran = []
+        queued, _ = manager.submit(["b"], [lambda: ran.append(True)])
+        
+        assert manager.cancel(queued.job_id).status == JobStatus.CANCELLED
+        release.set()
+        wait_for(manager, running.job_id)
+        
+        assert ran == []
+        assert manager.cancel("unknown") is None
+    
+    def test_persisted_jobs_reload(self, tmp_path):
+        """Test that finished results survive a restart and unfinished jobs fail"""
+        manager = JobManager(workers=1, storage_dir=str(tmp_path))
+        done, _ = manager.submit(["a"], [lambda: {"value": 1}], "key-1", "request-a")
+        wait_for(manager, done.job_id)
+        release = threading.Event()
+        interrupted, _ = manager.submit(["b"], [release.wait])
+        manager.shutdown(wait=False)
+        
+        reloaded = JobManager(workers=1, storage_dir=str(tmp_path))
+        
+        assert reloaded.get(done.job_id).results == [{"value": 1}]
+        assert reloaded.get(interrupted.job_id).status == JobStatus.FAILED
+        assert reloaded.submit(["a"], [lambda: 1], "key-1", "request-a")[0].job_id == done.job_id
+        release.set()
+        reloaded.shutdown()
+
+
+class TestJobEndpoints:
+    """Test suite for the /jobs API"""
+    
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setattr(job_manager, "_job_manager", JobManager(workers=1))
+        yield TestClient(app)
+        job_manager._job_manager.shutdown()
+    
+    def _tasks(self):
+        base = {
+            "current_age": 30, "retirement_age": 60,
+            "monthly_contribution": 5000, "monte_carlo_iterations": 1000, "seed": 7
+        }
+        return {"tasks": [
+            {"endpoint": "scenario-comparison", "payload": {"base_input": base}},
+            {"endpoint": "sensitivity-analysis", "payload": base},
+        ]}
+    
+    def test_submit_poll_and_fetch_result(self, client):
+        """Test that a job is accepted at once and its results can be fetched"""
+        url = f"{settings.API_V1_PREFIX}/jobs"
+        
+        response = client.post(url, json=self._tasks())
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        assert response.headers["Location"] == f"{url}/{job_id}"
+        assert response.json()["tasks_total"] == 2
+        
+        wait_for(job_manager._job_manager, job_id)
+        status = client.get(f"{url}/{job_id}").json()
+        result = client.get(status["result_url"]).json()
+        
+        assert status["status"] == "succeeded"
+        assert status["progress"] == 1.0
+        assert [task["endpoint"] for task in result["results"]] == [
+            "scenario-comparison", "sensitivity-analysis"
+        ]
+        assert len(result["results"][0]["result"]["scenarios"]) == 3
+    
+    def test_idempotent_retry(self, client):
+        """Test that a retried submission with the same key returns the same job"""
+        url = f"{settings.API_V1_PREFIX}/jobs"
+        headers = {"Idempotency-Key": "retry-me"}
+        
+        first = client.post(url, json=self._tasks(), headers=headers)
+        second = client.post(url, json=self._tasks(), headers=headers)
+        conflict = client.post(url, json={"tasks": self._tasks()["tasks"][:1]}, headers=headers)
+        
+        assert second.json()["job_id"] == first.json()["job_id"]
+        assert second.headers["Idempotent-Replayed"] == "true"
+        assert conflict.status_code == 409
+    
+    def test_invalid_payload_rejected(self, client):
+        """Test that task payloads are validated against their endpoint's model"""
+        response = client.post(f"{settings.API_V1_PREFIX}/jobs", json={"tasks": [
+            {"endpoint": "retirement", "payload": {"current_age": 30}}
+        ]})
+        
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][:4] == ["body", "tasks", 0, "payload"]
+    
+    def test_steps_charged_to_admission_budget(self, client, monkeypatch):
+        """Test that a job step waits for and holds its cost on the admission controller"""
+        monkeypatch.setattr(settings, "RESULT_CACHE_ENABLED", False)
+        controller = AdmissionController(budget=100)
+        monkeypatch.setattr(forecast, "get_admission_controller", lambda: controller)
+        request = SensitivityRequest(**self._tasks()["tasks"][1]["payload"])
+        step = threading.Thread(
+            target=forecast.compute_simulation, args=("sensitivity-analysis", request)
+        )
+        
+        with controller.hold(100):
+            step.start()
+            time.sleep(0.05)
+            assert controller.stats()["queued"] == 1
+        step.join(timeout=10)
+        
+        assert controller.admitted == 2
+        assert controller.stats()["in_flight"] == 0
+    
+    def test_unknown_job(self, client):
+        """Test that unknown or expired jobs return 404"""
+        assert client.get(f"{settings.API_V1_PREFIX}/jobs/unknown").status_code == 404
+        assert client.get(f"{settings.API_V1_PREFIX}/jobs/unknown/result").status_code == 404
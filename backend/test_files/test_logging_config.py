@@ -0,0 +1,98 @@
+"""
+Unit tests for logging configuration
+Tests the queued handler and per-request log sampling
+"""
+import contextvars
+import logging
+import queue
+import sys
+from app.core.logging_config import (
+    NonBlockingQueueHandler,
+    RequestSamplingFilter,
+    sample_request,
+)
+
+
+def make_record(level: int = logging.INFO, msg: str = "value=%s", args=(42,), exc_info=None):
+    return logging.LogRecord("test", level, __file__, 1, msg, args, exc_info)
+
+
+class TestNonBlockingQueueHandler:
+    """Test suite for NonBlockingQueueHandler"""
+    
+    def test_record_enqueued_with_merged_message(self):
+        """Test that args are merged into the message before enqueueing"""
+        log_queue = queue.Queue()
+        NonBlockingQueueHandler(log_queue).handle(make_record())
+        
+        record = log_queue.get_nowait()
+        assert record.msg == "value=42"
+        assert record.args is None
+    
+    def test_traceback_kept_as_text(self):
+        """Test that exception info survives as exc_text for the formatter"""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        
+        log_queue = queue.Queue()
+        NonBlockingQueueHandler(log_queue).handle(make_record(logging.ERROR, exc_info=exc_info))
+        
+        record = log_queue.get_nowait()
+        assert record.exc_info is None
+        assert "ValueError: boom" in record.exc_text
+        assert record.msg == "value=42"
+    
+    def test_full_queue_drops_instead_of_blocking(self):
+        """Test that records are counted and dropped when the queue is full"""
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=2))
+        
+        for _ in range(5):
+            handler.handle(make_record())
+        
+        assert handler.queue.qsize() == 2
+        assert handler.dropped == 3
+
+
+class TestRequestSampling:
+    """Test suite for request log sampling"""
+    
+    def test_unsampled_request_drops_info_keeps_warnings(self):
+        """Test that only warnings and above pass for unsampled requests"""
+        log_filter = RequestSamplingFilter()
+        
+        def check():
+            assert sample_request(0.0) is False
+            return (
+                log_filter.filter(make_record(logging.INFO)),
+                log_filter.filter(make_record(logging.WARNING)),
+            )
+        
+        info_kept, warning_kept = contextvars.copy_context().run(check)
+        assert info_kept is False
+        assert warning_kept is True
+    
+    def test_sampled_request_keeps_info(self):
+        """Test that a full sample rate keeps every record"""
+        log_filter = RequestSamplingFilter()
+        
+        def check():
+            assert sample_request(1.0) is True
+            return log_filter.filter(make_record(logging.DEBUG))
+        
+        assert contextvars.copy_context().run(check) is True
+    
+    def test_sampling_scoped_to_context(self):
+        """Test that a decision in one request context does not leak out"""
+        contextvars.copy_context().run(sample_request, 0.0)
+        
+        assert RequestSamplingFilter().filter(make_record(logging.INFO)) is True
+    
+    def test_sample_rate_fraction(self):
+        """Test that roughly the configured fraction of requests is sampled"""
+        sampled = sum(
+            contextvars.copy_context().run(sample_request, 0.25) for _ in range(4000)
+        )
+        
+        assert 800 < sampled < 1200
@@ -0,0 +1,107 @@
+"""
+Unit tests for metrics module
+Tests the exposition format and simulation instrumentation
+"""
+import pytest
+from fastapi.testclient import TestClient
+from app.core.metrics import (
+    CONTENT_TYPE,
+    SIMULATION_ITERATIONS,
+    SIMULATION_PATHS,
+    MetricsRegistry,
+    stat_family,
+)
+from app.models.schemas import RiskProfile
+from app.services.monte_carlo_simulator import MonteCarloSimulator
+
+
+class TestMetricsRegistry:
+    """Test suite for MetricsRegistry rendering"""
+    
+    def test_counter_and_gauge(self):
+        """Test that counters accumulate and unlabelled gauges start at 0"""
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests", ("route",))
+        depth = registry.gauge("queue_depth", "Queue depth")
+        
+        requests.inc(route="/a")
+        requests.inc(2, route="/a")
+        text = registry.render()
+        
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{route="/a"} 3' in text
+        assert "queue_depth 0" in text
+    
+    def test_histogram_buckets_cumulative(self):
+        """Test that histogram buckets are cumulative with sum and count"""
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+        
+        for value in (0.05, 0.5, 5.0):
+            latency.observe(value, route="/a")
+        text = registry.render()
+        
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{route="/a",le="1"} 2' in text
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+        assert 'latency_seconds_sum{route="/a"} 5.55' in text
+        assert 'latency_seconds_count{route="/a"} 3' in text
+    
+    def test_label_values_escaped(self):
+        """Test that quotes and backslashes in label values are escaped"""
+        registry = MetricsRegistry()
+        registry.counter("errors_total", "Errors", ("message",)).inc(message='say "hi"\\')
+        
+        assert 'errors_total{message="say \\"hi\\"\\\\"} 1' in registry.render()
+    
+    def test_wrong_labels_rejected(self):
+        """Test that labels must match the declared label names"""
+        counter = MetricsRegistry().counter("requests_total", "Requests", ("route",))
+        
+        with pytest.raises(ValueError):
+            counter.inc(path="/a")
+    
+    def test_collectors_rendered(self):
+        """Test that collector families are read at render time"""
+        registry = MetricsRegistry()
+        state = {"entries": 1}
+        registry.register_collector(
+            lambda: [stat_family("cache_entries", "gauge", "Entries", state["entries"])]
+        )
+        state["entries"] = 7
+        
+        assert "cache_entries 7" in registry.render()
+
+
+class TestSimulationMetrics:
+    """Test suite for simulator and endpoint instrumentation"""
+    
+    def test_simulation_recorded(self):
+        """Test that a simulation call records its paths by profile and engine"""
+        labels = {"risk_profile": RiskProfile.CONSERVATIVE.value, "engine": "vectorized"}
+        paths_before = SIMULATION_PATHS.value(**labels)
+        calls_before = SIMULATION_ITERATIONS.count(**labels)
+        
+        MonteCarloSimulator(seed=1).simulate_retirement_corpus(
+            monthly_contribution=5000,
+            years=10,
+            risk_profile=RiskProfile.CONSERVATIVE,
+            iterations=1000,
+            engine="vectorized"
+        )
+        
+        assert SIMULATION_PATHS.value(**labels) == paths_before + 1000
+        assert SIMULATION_ITERATIONS.count(**labels) == calls_before + 1
+    
+    def test_metrics_endpoint(self):
+        """Test that /metrics serves request latency by route template"""
+        from app.main import app
+        client = TestClient(app)
+        client.get("/health")
+        
+        response = client.get("/metrics")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == CONTENT_TYPE
+        assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in response.text
+        assert "simulations_in_flight" in response.text
@@ -0,0 +1,114 @@
+"""
+Unit tests for middleware module
+Tests request IDs, error bodies and unbuffered streaming
+"""
+import asyncio
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from app.core.exceptions import ValidationException
+from app.core.middleware import ErrorHandlingMiddleware, RequestLoggingMiddleware
+
+
+def build_app(stream_gate: asyncio.Event = None) -> FastAPI:
+    app = FastAPI()
+    
+    @app.get("/request-id")
+    async def request_id(request: Request):
+        return {"request_id": request.state.request_id}
+    
+    @app.get("/app-error")
+    async def app_error():
+        raise ValidationException("Bad input", details={"field": "age"})
+    
+    @app.get("/crash")
+    async def crash():
+        raise RuntimeError("boom")
+    
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            yield b"first"
+            # Only released once the client has received the first chunk
+            await stream_gate.wait()
+            yield b"second"
+        return StreamingResponse(chunks())
+    
+    app.add_middleware(ErrorHandlingMiddleware)
+    app.add_middleware(RequestLoggingMiddleware)
+    return app
+
+
+class TestRequestLoggingMiddleware:
+    """Test suite for request IDs"""
+    
+    def test_request_id_header_matches_state(self):
+        """Test that the handler sees the request ID sent in X-Request-ID"""
+        response = TestClient(build_app()).get("/request-id")
+        
+        assert response.status_code == 200
+        assert response.headers["X-Request-ID"] == response.json()["request_id"]
+    
+    def test_request_ids_unique(self):
+        """Test that every request gets its own ID"""
+        client = TestClient(build_app())
+        
+        ids = {client.get("/request-id").headers["X-Request-ID"] for _ in range(5)}
+        assert len(ids) == 5
+
+
+class TestErrorHandlingMiddleware:
+    """Test suite for JSON error bodies"""
+    
+    def test_app_exception_body(self):
+        """Test that application exceptions keep their status and details"""
+        response = TestClient(build_app()).get("/app-error")
+        
+        assert response.status_code == 400
+        body = response.json()
+        assert body["detail"] == "Bad input"
+        assert body["details"] == {"field": "age"}
+        assert body["request_id"] == response.headers["X-Request-ID"]
+    
+    def test_unexpected_exception_body(self):
+        """Test that unexpected exceptions become a 500 JSON body"""
+        response = TestClient(build_app(), raise_server_exceptions=False).get("/crash")
+        
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Internal server error"
+        assert response.json()["request_id"] == response.headers["X-Request-ID"]
+
+
+class TestStreaming:
+    """Test suite for unbuffered streaming through both middlewares"""
+    
+    @pytest.mark.asyncio
+    async def test_chunks_forwarded_before_body_completes(self):
+        """Test that the first chunk reaches the client before the stream ends"""
+        gate = asyncio.Event()
+        app = build_app(gate)
+        sent = []
+        
+        async def receive():
+            await asyncio.sleep(3600)
+        
+        async def send(message):
+            sent.append(message)
+            if message.get("body") == b"first":
+                gate.set()
+        
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": "GET", "scheme": "http", "path": "/stream", "raw_path": b"/stream",
+            "root_path": "", "query_string": b"", "headers": [],
+            "client": ("127.0.0.1", 1234), "server": ("test", 80),
+        }
+        # A buffering middleware would wait for the whole body and deadlock
+        await asyncio.wait_for(app(scope, receive, send), timeout=5)
+        
+        start = sent[0]
+        bodies = [message.get("body") for message in sent[1:] if message.get("body")]
+        assert start["type"] == "http.response.start"
+        assert any(name == b"x-request-id" for name, _ in start["headers"])
+        assert bodies == [b"first", b"second"]
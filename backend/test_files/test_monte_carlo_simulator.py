@@ -0,0 +1,480 @@
+"""
+Unit tests for monte_carlo_simulator module
+Tests the vectorized path engine and accumulation kernels
+"""
+import numpy as np
+import pytest
+from pydantic import ValidationError
+from app.core.config import settings
+from app.services.monte_carlo_simulator import (
+    MonteCarloSimulator,
+    _draw_uniforms,
+    _simulate_shard,
+    shutdown_process_pool,
+)
+from app.models.schemas import (
+    MAX_SEED,
+    RetirementInput,
+    RiskProfile,
+    SamplingMethod,
+    ScenarioComparisonRequest,
+)
+from app.core.exceptions import ValidationException
+from app.routes.forecast import _compute_scenario_comparison
+
+
+class TestVectorizedEngine:
+    """Test suite for the vectorized Monte Carlo path engine"""
+    
+    def test_paths_match_single_path_reference(self):
+        """Test that vectorized paths equal the per-path reference loop"""
+        simulator = MonteCarloSimulator()
+        rng = np.random.default_rng(7)
+        annual_returns = rng.uniform(6.0, 8.0, size=(50, 25))
+        
+        vectorized = simulator._simulate_paths(5000, 25, annual_returns, 5.0)
+        reference = [
+            simulator._simulate_single_path(5000, 25, annual_returns[i], 5.0)
+            for i in range(50)
+        ]
+        
+        np.testing.assert_allclose(vectorized, reference, rtol=1e-12)
+    
+    def test_statistics_keys(self):
+        """Test that the statistics dict keeps its shape"""
+        simulator = MonteCarloSimulator(seed=42)
+        result = simulator.simulate_retirement_corpus(
+            monthly_contribution=5000,
+            years=30,
+            risk_profile=RiskProfile.MODERATE,
+            annual_income_growth=5.0,
+            iterations=1000
+        )
+        
+        assert set(result) == {
+            "mean", "std_deviation",
+            "percentile_10", "percentile_25", "percentile_50",
+            "percentile_75", "percentile_90",
+            "min", "max",
+        }
+        assert result["min"] <= result["percentile_10"] <= result["percentile_50"]
+        assert result["percentile_50"] <= result["percentile_90"] <= result["max"]
+    
+    def test_constant_returns_match_deterministic(self):
+        """Test that a zero-width return range reproduces the closed form"""
+        simulator = MonteCarloSimulator()
+        annual_returns = np.full((3, 20), 7.0)
+        
+        paths = simulator._simulate_paths(10000, 20, annual_returns, 0.0)
+        
+        monthly_rate = 7.0 / 100 / 12
+        expected = 10000 * ((1 + monthly_rate) ** 240 - 1) / monthly_rate * (1 + monthly_rate)
+        assert paths == pytest.approx([expected] * 3, rel=1e-10)
+
+
+class TestAnnualKernel:
+    """Test suite for the closed-form annual accumulation kernel"""
+    
+    @pytest.mark.parametrize("growth", [0.0, 5.0, 7.0, 20.0])
+    def test_annual_matches_monthly(self, growth):
+        """Test that yearly closed-form steps match the monthly loop"""
+        simulator = MonteCarloSimulator()
+        rng = np.random.default_rng(11)
+        annual_returns = rng.uniform(4.0, 10.0, size=(200, 35))
+        
+        annual = simulator._simulate_paths(7500, 35, annual_returns, growth, kernel="annual")
+        monthly = simulator._simulate_paths(7500, 35, annual_returns, growth, kernel="monthly")
+        
+        np.testing.assert_allclose(annual, monthly, rtol=1e-9)
+    
+    def test_annual_handles_return_equal_to_growth(self):
+        """Test the a == b limit where the closed form divides by zero"""
+        simulator = MonteCarloSimulator()
+        annual_returns = np.array([[6.0, 6.0000001, 5.9999999, 8.0]])
+        
+        annual = simulator._simulate_paths(5000, 4, annual_returns, 6.0, kernel="annual")
+        monthly = simulator._simulate_paths(5000, 4, annual_returns, 6.0, kernel="monthly")
+        
+        np.testing.assert_allclose(annual, monthly, rtol=1e-9)
+    
+    def test_unknown_kernel_rejected(self):
+        """Test that an unknown kernel name is a validation error"""
+        simulator = MonteCarloSimulator()
+        
+        with pytest.raises(ValidationException):
+            simulator.simulate_retirement_corpus(
+                monthly_contribution=5000,
+                years=10,
+                risk_profile=RiskProfile.MODERATE,
+                iterations=1000,
+                kernel="weekly"
+            )
+
+
+class TestRandomStreams:
+    """Test suite for per-simulator random streams"""
+    
+    def _run(self, simulator):
+        return simulator.simulate_retirement_corpus(
+            monthly_contribution=5000,
+            years=20,
+            risk_profile=RiskProfile.AGGRESSIVE,
+            annual_income_growth=5.0,
+            iterations=1000
+        )
+    
+    def test_same_seed_reproduces_results(self):
+        """Test that a seed fully determines the simulation"""
+        assert self._run(MonteCarloSimulator(seed=123)) == self._run(MonteCarloSimulator(seed=123))
+    
+    def test_interleaved_simulators_do_not_interfere(self):
+        """Test that one simulator's draws don't shift another's stream"""
+        expected = self._run(MonteCarloSimulator(seed=5))
+        
+        first = MonteCarloSimulator(seed=5)
+        other = MonteCarloSimulator(seed=6)
+        self._run(other)
+        
+        assert self._run(first) == expected
+    
+    def test_global_numpy_state_untouched(self):
+        """Test that seeding a simulator leaves np.random's global state alone"""
+        state_before = np.random.get_state()[1].copy()
+        self._run(MonteCarloSimulator(seed=99))
+        
+        np.testing.assert_array_equal(np.random.get_state()[1], state_before)
+    
+    def test_generated_seed_is_reported(self):
+        """Test that an unseeded simulator exposes a reusable seed"""
+        simulator = MonteCarloSimulator()
+        result = self._run(simulator)
+        
+        assert isinstance(simulator.seed, int)
+        assert simulator.seed < 2 ** 53
+        assert self._run(MonteCarloSimulator(seed=simulator.seed)) == result
+    
+    def test_request_seed_within_safe_integer_range(self):
+        """Test that request seeds are limited to the range of generated seeds"""
+        base = dict(current_age=30, retirement_age=60, monthly_contribution=5000)
+        
+        assert RetirementInput(**base, seed=MAX_SEED).seed == MAX_SEED
+        with pytest.raises(ValidationError):
+            RetirementInput(**base, seed=MAX_SEED + 1)
+    
+    def test_spawned_streams_are_independent(self):
+        """Test that child streams are reproducible and distinct"""
+        first = [g.random(4) for g in MonteCarloSimulator(seed=1).spawn_streams(3)]
+        again = [g.random(4) for g in MonteCarloSimulator(seed=1).spawn_streams(3)]
+        
+        for a, b in zip(first, again):
+            np.testing.assert_array_equal(a, b)
+        assert not np.allclose(first[0], first[1])
+
+
+class TestHorizonCheckpoints:
+    """Test suite for multi-horizon simulation with checkpoints"""
+    
+    def test_longest_horizon_matches_direct_simulation(self):
+        """Test that the longest checkpoint equals a plain simulation"""
+        horizons = MonteCarloSimulator(seed=21).simulate_horizons(
+            monthly_contribution=5000,
+            horizons=[25, 26, 27, 30],
+            risk_profile=RiskProfile.MODERATE,
+            annual_income_growth=5.0,
+            iterations=1000
+        )
+        direct = MonteCarloSimulator(seed=21).simulate_retirement_corpus(
+            monthly_contribution=5000,
+            years=30,
+            risk_profile=RiskProfile.MODERATE,
+            annual_income_growth=5.0,
+            iterations=1000
+        )
+        
+        assert set(horizons) == {25, 26, 27, 30}
+        assert horizons[30] == pytest.approx(direct, rel=1e-12)
+    
+    @pytest.mark.parametrize("kernel", MonteCarloSimulator.KERNELS)
+    def test_checkpoints_are_path_prefixes(self, kernel):
+        """Test that each checkpoint equals simulating the truncated paths"""
+        simulator = MonteCarloSimulator()
+        rng = np.random.default_rng(4)
+        annual_returns = rng.uniform(6.0, 8.0, size=(100, 12))
+        accumulate = (
+            simulator._accumulate_annual if kernel == "annual" else simulator._accumulate_monthly
+        )
+        
+        snapshots = accumulate(5000, 12, annual_returns, 5.0, checkpoints=[3, 7, 12])
+        
+        for year in (3, 7, 12):
+            truncated = simulator._simulate_paths(
+                5000, year, annual_returns[:, :year], 5.0, kernel=kernel
+            )
+            np.testing.assert_allclose(snapshots[year], truncated, rtol=1e-12)
+
+
+class TestParallelEngine:
+    """Test suite for the sharded process-pool engine"""
+    
+    @pytest.fixture(autouse=True)
+    def small_pool(self, monkeypatch):
+        monkeypatch.setattr(settings, "MONTE_CARLO_POOL_SIZE", 2)
+        monkeypatch.setattr(settings, "MONTE_CARLO_SHARD_SIZE", 700)
+        yield
+        shutdown_process_pool()
+    
+    def _run(self, seed, engine):
+        return MonteCarloSimulator(seed=seed).simulate_retirement_corpus(
+            monthly_contribution=5000,
+            years=20,
+            risk_profile=RiskProfile.MODERATE,
+            annual_income_growth=5.0,
+            iterations=2000,
+            engine=engine
+        )
+    
+    def test_parallel_is_reproducible(self):
+        """Test that shards use seed-derived streams"""
+        assert self._run(17, "parallel") == self._run(17, "parallel")
+    
+    def test_parallel_merges_all_shards(self):
+        """Test that merged statistics equal simulating each shard in-process"""
+        simulator = MonteCarloSimulator(seed=17)
+        streams = simulator.spawn_streams(3)
+        paths = np.concatenate([
+            _simulate_shard(rng, 5000, 20, 6.0, 8.0, 5.0, size, "annual")
+            for rng, size in zip(streams, [700, 700, 600])
+        ])
+        
+        assert self._run(17, "parallel") == MonteCarloSimulator._summarize(paths)
+    
+    def test_parallel_agrees_with_vectorized(self):
+        """Test that both engines estimate the same distribution"""
+        parallel = self._run(3, "parallel")
+        vectorized = self._run(3, "vectorized")
+        
+        assert parallel["percentile_50"] == pytest.approx(vectorized["percentile_50"], rel=0.01)
+        assert parallel["mean"] == pytest.approx(vectorized["mean"], rel=0.01)
+
+
+
+class TestAdaptiveEngine:
+    """Test suite for convergence-based early stopping"""
+    
+    def _run(self, target_precision, iterations=50000, seed=5):
+        return MonteCarloSimulator(seed=seed).simulate_retirement_corpus(
+            monthly_contribution=5000,
+            years=30,
+            risk_profile=RiskProfile.AGGRESSIVE,
+            annual_income_growth=5.0,
+            iterations=iterations,
+            target_precision=target_precision
+        )
+    
+    def test_stops_early_once_precise(self):
+        """Test that a loose target stops well before the iteration cap"""
+        result = self._run(0.01)
+        
+        assert result["iterations_used"] < 50000
+        assert result["achieved_precision"] <= 0.01
+    
+    def test_tighter_target_needs_more_paths(self):
+        """Test that precision and iterations trade off monotonically"""
+        loose = self._run(0.002)
+        tight = self._run(0.0005)
+        
+        assert tight["iterations_used"] > loose["iterations_used"]
+        assert tight["achieved_precision"] <= 0.0005
+    
+    def test_iteration_cap_respected(self):
+        """Test that an unreachable target stops at the requested iterations"""
+        result = self._run(1e-9, iterations=5000)
+        
+        assert result["iterations_used"] == 5000
+        assert result["achieved_precision"] > 1e-9
+    
+    def test_precision_bounds_cover_true_percentile(self):
+        """Test that the reported precision brackets a high-iteration reference"""
+        reference = self._run(None, iterations=50000, seed=99)
+        result = self._run(0.002, seed=6)
+        
+        for key in ("percentile_10", "percentile_50", "percentile_90"):
+            relative_error = abs(result[key] - reference[key]) / reference[key]
+            assert relative_error <= result["achieved_precision"] * 2
+
+
+class TestSamplingMethods:
+    """Test suite for variance-reduction sampling schemes"""
+    
+    @pytest.mark.parametrize("method", list(SamplingMethod))
+    def test_uniform_marginals(self, method):
+        """Test that every scheme yields (years, size) draws inside (0, 1)"""
+        uniforms = _draw_uniforms(np.random.default_rng(3), 1001, 12, method)
+        
+        assert uniforms.shape == (12, 1001)
+        assert uniforms.min() >= 0 and uniforms.max() < 1
+        assert abs(uniforms.mean() - 0.5) < 0.02
+    
+    @pytest.mark.parametrize("method", list(SamplingMethod))
+    def test_seed_reproduces_results(self, method):
+        """Test that each scheme is reproducible from the seed"""
+        first, second = (
+            MonteCarloSimulator(seed=21).simulate_retirement_corpus(
+                5000, 20, RiskProfile.MODERATE, iterations=2000, sampling_method=method
+            )
+            for _ in range(2)
+        )
+        
+        assert first == second
+    
+    def test_antithetic_pairs(self):
+        """Test that antithetic draws mirror the first half"""
+        uniforms = _draw_uniforms(np.random.default_rng(3), 10, 5, SamplingMethod.ANTITHETIC)
+        
+        np.testing.assert_allclose(uniforms[:, :5] + uniforms[:, 5:], 1.0)
+    
+    def test_stratified_covers_every_stratum(self):
+        """Test that each year hits every equal-probability stratum once"""
+        uniforms = _draw_uniforms(np.random.default_rng(3), 500, 8, SamplingMethod.STRATIFIED)
+        
+        strata = np.sort(np.floor(uniforms * 500), axis=1)
+        np.testing.assert_array_equal(strata, np.broadcast_to(np.arange(500), (8, 500)))
+    
+    def test_schemes_reduce_mean_error(self):
+        """Test that variance reduction beats plain sampling on the mean"""
+        def mean_spread(method):
+            means = [
+                MonteCarloSimulator(seed=seed).simulate_retirement_corpus(
+                    5000, 20, RiskProfile.AGGRESSIVE, iterations=1000, sampling_method=method
+                )["mean"]
+                for seed in range(20)
+            ]
+            return np.std(means)
+        
+        baseline = mean_spread(SamplingMethod.UNIFORM)
+        for method in (SamplingMethod.ANTITHETIC, SamplingMethod.STRATIFIED, SamplingMethod.SOBOL):
+            assert mean_spread(method) < baseline / 2
+    
+    def test_unknown_method_rejected(self):
+        """Test that an unknown sampling method raises ValidationException"""
+        with pytest.raises(ValidationException):
+            MonteCarloSimulator(seed=1).simulate_retirement_corpus(
+                5000, 20, RiskProfile.MODERATE, iterations=100, sampling_method="halton"
+            )
+
+
+class TestControlVariate:
+    """Test suite for the deterministic-corpus control variate"""
+    
+    def _run(self, seed, control_variate=True, iterations=1000, **kwargs):
+        return MonteCarloSimulator(seed=seed).simulate_retirement_corpus(
+            monthly_contribution=5000,
+            years=30,
+            risk_profile=RiskProfile.AGGRESSIVE,
+            annual_income_growth=5.0,
+            iterations=iterations,
+            control_variate=control_variate,
+            **kwargs
+        )
+    
+    def test_reports_variance_reduction(self):
+        """Test that the control is strongly correlated with the corpus"""
+        result = self._run(seed=1)
+        
+        assert result["variance_reduction_factor"] > 10
+        assert result["percentile_10"] <= result["percentile_50"] <= result["percentile_90"]
+        assert result["min"] <= result["percentile_10"]
+    
+    def test_shrinks_mean_error(self):
+        """Test that adjusted means scatter far less than plain means"""
+        plain = [self._run(seed, control_variate=False)["mean"] for seed in range(15)]
+        adjusted = [self._run(seed)["mean"] for seed in range(15)]
+        
+        assert np.std(adjusted) < np.std(plain) / 5
+        assert abs(np.mean(adjusted) - np.mean(plain)) < 3 * np.std(plain) / np.sqrt(15)
+    
+    def test_sensitivities_match_kernel(self):
+        """Test that finite-difference sensitivities predict a small perturbation"""
+        sensitivities = MonteCarloSimulator._return_sensitivities(5000, 10, 10.0, 5.0, "annual")
+        perturbation = np.linspace(-0.05, 0.05, 10)
+        base, bumped = MonteCarloSimulator._simulate_paths(
+            5000, 10, np.array([np.full(10, 10.0), 10.0 + perturbation]), 5.0
+        )
+        
+        assert bumped - base == pytest.approx(perturbation @ sensitivities, rel=1e-3)
+    
+    def test_other_engines_rejected(self):
+        """Test that control variates require the vectorized engine"""
+        with pytest.raises(ValidationException):
+            self._run(seed=1, engine="streaming")
+        with pytest.raises(ValidationException):
+            self._run(seed=1, target_precision=0.01)
+
+
+class TestPensionScenarios:
+    """Test suite for the shared-draw multi-profile simulation"""
+    
+    def test_profiles_share_one_draw(self):
+        """Test that each profile matches a single-profile run on the same seed"""
+        scenarios = MonteCarloSimulator(seed=8).simulate_pension_scenarios(
+            5000, 25, annual_income_growth=5.0, iterations=3000
+        )
+        
+        assert list(scenarios) == list(RiskProfile)
+        for risk_profile, statistics in scenarios.items():
+            assert statistics == MonteCarloSimulator(seed=8).simulate_retirement_corpus(
+                5000, 25, risk_profile, annual_income_growth=5.0, iterations=3000
+            )
+    
+    def test_common_random_numbers_order_profiles(self):
+        """Test that higher-return profiles dominate at every percentile"""
+        scenarios = MonteCarloSimulator(seed=8).simulate_pension_scenarios(
+            5000, 25, iterations=500
+        )
+        conservative, moderate, aggressive = (scenarios[profile] for profile in RiskProfile)
+        
+        for key in MonteCarloSimulator.CORPUS_STATISTICS:
+            if key != "std_deviation":
+                assert conservative[key] < moderate[key] < aggressive[key]
+    
+    def test_options_forwarded(self):
+        """Test that adaptive and control-variate options apply per profile"""
+        simulator = MonteCarloSimulator(seed=8)
+        adaptive = simulator.simulate_pension_scenarios(
+            5000, 25, iterations=20000, target_precision=0.01
+        )
+        controlled = simulator.simulate_pension_scenarios(
+            5000, 25, iterations=2000, control_variate=True,
+            risk_profiles=[RiskProfile.MODERATE]
+        )
+        
+        assert all("achieved_precision" in result for result in adaptive.values())
+        assert list(controlled) == [RiskProfile.MODERATE]
+        assert controlled[RiskProfile.MODERATE]["variance_reduction_factor"] > 10
+    
+    def test_adaptive_control_variate_rejected(self):
+        """Test that control variates cannot be combined with adaptive runs"""
+        with pytest.raises(ValidationException):
+            MonteCarloSimulator(seed=8).simulate_pension_scenarios(
+                5000, 25, iterations=2000, target_precision=0.01, control_variate=True
+            )
+    
+    @pytest.mark.parametrize("option", [
+        {"target_precision": 0.01, "monte_carlo_iterations": 20000},
+        {"control_variate": True},
+    ])
+    def test_comparison_reports_run_per_profile(self, option):
+        """Test that scenario comparison reports each profile's run details"""
+        base_input = RetirementInput(
+            current_age=35, retirement_age=60, monthly_contribution=5000, seed=8, **option
+        )
+        
+        response = _compute_scenario_comparison(ScenarioComparisonRequest(base_input=base_input))
+        
+        for scenario in response.scenarios:
+            assert scenario.simulation.seed == 8
+            assert scenario.simulation.iterations_used <= base_input.monte_carlo_iterations
+            if "target_precision" in option:
+                assert scenario.simulation.achieved_precision is not None
+            else:
+                assert scenario.simulation.variance_reduction_factor > 1
@@ -0,0 +1,228 @@
+"""
+Unit tests for path_bank module
+Tests the shared return-path bank and its use by the simulator
+"""
+import json
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from app.core.config import settings
+from app.main import app
+from app.services import path_bank
+from app.services.monte_carlo_simulator import MonteCarloSimulator
+from app.services.path_bank import (
+    PathBank,
+    get_path_bank,
+    reset_path_bank,
+    settings_fingerprint,
+    main as path_bank_main,
+)
+from app.models.schemas import RiskProfile, SamplingMethod
+
+
+class TestPathBank:
+    """Test suite for PathBank storage and eviction"""
+    
+    def test_matches_fresh_draw(self):
+        """Test that banked paths equal the simulator's own draw for the seed"""
+        bank = PathBank(size=500, max_bytes=10 ** 7, seed=4)
+        banked = bank.get_returns(RiskProfile.MODERATE, 20, 500, seed=4)
+        fresh = MonteCarloSimulator(seed=4)._draw_returns(RiskProfile.MODERATE, 500, 20)
+        
+        np.testing.assert_array_equal(banked, fresh)
+    
+    def test_shorter_horizon_is_prefix(self):
+        """Test that one entry serves shorter horizons as a fresh draw would"""
+        bank = PathBank(size=300, max_bytes=10 ** 7, seed=4)
+        bank.get_returns(RiskProfile.AGGRESSIVE, 40, 300, seed=4)
+        shorter = bank.get_returns(RiskProfile.AGGRESSIVE, 15, 300, seed=4)
+        fresh = MonteCarloSimulator(seed=4)._draw_returns(RiskProfile.AGGRESSIVE, 300, 15)
+        
+        np.testing.assert_array_equal(shorter, fresh)
+        assert bank.stats()["entries"] == 1
+        assert bank.hits == 1 and bank.misses == 1
+    
+    def test_read_only(self):
+        """Test that shared matrices cannot be modified by callers"""
+        bank = PathBank(size=100, max_bytes=10 ** 7, seed=1)
+        returns = bank.get_returns(RiskProfile.MODERATE, 10, 100, seed=1)
+        
+        with pytest.raises(ValueError):
+            returns[0, 0] = 0.0
+    
+    def test_lru_eviction_under_budget(self):
+        """Test that least recently used entries are evicted over budget"""
+        entry_bytes = 100 * 10 * 8
+        bank = PathBank(size=100, max_bytes=2 * entry_bytes, seed=1)
+        for risk_profile in (RiskProfile.CONSERVATIVE, RiskProfile.MODERATE):
+            bank.get_returns(risk_profile, 10, 100, seed=1)
+        bank.get_returns(RiskProfile.CONSERVATIVE, 10, 100, seed=1)
+        bank.get_returns(RiskProfile.AGGRESSIVE, 10, 100, seed=1)
+        
+        assert bank.evictions == 1
+        assert bank.nbytes <= bank.max_bytes
+        bank.get_returns(RiskProfile.CONSERVATIVE, 10, 100, seed=1)
+        assert bank.hits == 2
+    
+    def test_larger_runs_bypass(self):
+        """Test that runs beyond the bank size are not served"""
+        bank = PathBank(size=100, max_bytes=10 ** 7, seed=1)
+        
+        assert bank.get_returns(RiskProfile.MODERATE, 10, 101, seed=1) is None
+    
+    def test_other_seeds_bypass(self):
+        """Test that seeds the bank was not built for are neither served nor stored"""
+        bank = PathBank(size=100, max_bytes=10 ** 7, seed=1)
+        
+        assert bank.get_returns(RiskProfile.MODERATE, 10, 100, seed=2) is None
+        assert bank.stats()["entries"] == 0
+
+
+class TestSimulatorWithPathBank:
+    """Test suite for simulations served from the path bank"""
+    
+    def test_same_results_as_fresh_draw(self):
+        """Test that a full-size banked run reproduces a plain run"""
+        bank = PathBank(size=2000, max_bytes=10 ** 8, seed=6)
+        kwargs = dict(monthly_contribution=5000, years=25, annual_income_growth=5.0, iterations=2000)
+        
+        banked = MonteCarloSimulator(seed=6, path_bank=bank).simulate_retirement_corpus(
+            risk_profile=RiskProfile.MODERATE, **kwargs
+        )
+        plain = MonteCarloSimulator(seed=6).simulate_retirement_corpus(
+            risk_profile=RiskProfile.MODERATE, **kwargs
+        )
+        scenarios = MonteCarloSimulator(seed=6, path_bank=bank).simulate_pension_scenarios(**kwargs)
+        
+        assert banked == plain
+        assert scenarios[RiskProfile.MODERATE] == plain
+        assert bank.hits == 1
+    
+    def test_unseeded_runs_use_bank_seed(self):
+        """Test that runs without a seed share the bank's paths"""
+        bank = PathBank(size=1000, max_bytes=10 ** 8, seed=11)
+        first, second = (
+            MonteCarloSimulator(path_bank=bank).simulate_retirement_corpus(
+                5000, 20, RiskProfile.CONSERVATIVE, iterations=1000
+            )
+            for _ in range(2)
+        )
+        
+        assert first == second
+        assert bank.hits == 1
+    
+    def test_user_seed_reproducible_with_bank(self):
+        """Test that a request's own seed gives the same result with or without the bank"""
+        bank = PathBank(size=5000, max_bytes=10 ** 8, seed=11)
+        kwargs = dict(monthly_contribution=5000, years=20, iterations=1000)
+        
+        banked = MonteCarloSimulator(seed=99, path_bank=bank).simulate_retirement_corpus(
+            risk_profile=RiskProfile.MODERATE, **kwargs
+        )
+        plain = MonteCarloSimulator(seed=99).simulate_retirement_corpus(
+            risk_profile=RiskProfile.MODERATE, **kwargs
+        )
+        
+        assert banked == plain
+        assert bank.stats()["entries"] == 0
+    
+    def test_variance_reduced_sampling_bypasses_bank(self):
+        """Test that only plain uniform sampling is served from the bank"""
+        bank = PathBank(size=1000, max_bytes=10 ** 8, seed=11)
+        MonteCarloSimulator(path_bank=bank).simulate_retirement_corpus(
+            5000, 20, RiskProfile.CONSERVATIVE, iterations=1000,
+            sampling_method=SamplingMethod.ANTITHETIC
+        )
+        
+        assert bank.stats()["entries"] == 0
+    
+    def test_shared_bank_follows_settings(self, monkeypatch):
+        """Test that the shared bank is only created when enabled"""
+        reset_path_bank()
+        monkeypatch.setattr(settings, "PATH_BANK_ENABLED", False)
+        assert get_path_bank() is None
+        
+        monkeypatch.setattr(settings, "PATH_BANK_ENABLED", True)
+        monkeypatch.setattr(settings, "PATH_BANK_SIZE", 123)
+        assert get_path_bank().size == 123
+        assert get_path_bank() is get_path_bank()
+        reset_path_bank()
+
+
+class TestPersistedPathBank:
+    """Test suite for the memory-mapped on-disk bank"""
+    
+    def _bank(self, directory, size=200):
+        return PathBank(size=size, max_bytes=10 ** 7, seed=5, directory=str(directory))
+    
+    def test_build_and_map(self, tmp_path):
+        """Test that a built bank is mapped read-only and serves identical paths"""
+        self._bank(tmp_path).build(30, seeds=[5, 6])
+        bank = self._bank(tmp_path)
+        
+        assert bank.load(30)
+        assert bank.stats()["mapped_entries"] == 2 * len(RiskProfile)
+        returns = bank.get_returns(RiskProfile.AGGRESSIVE, 12, 150, seed=6)
+        fresh = MonteCarloSimulator(seed=6)._draw_returns(RiskProfile.AGGRESSIVE, 200, 12)
+        
+        np.testing.assert_array_equal(returns, fresh[:150])
+        assert isinstance(returns.base, np.memmap) or isinstance(returns, np.memmap)
+        assert not returns.flags.writeable
+        assert bank.stats()["bytes"] == 0
+        assert not list(tmp_path.glob("*.tmp"))
+    
+    def test_manifest_records_settings(self, tmp_path):
+        """Test that the manifest records seeds and the settings fingerprint"""
+        manifest_path = self._bank(tmp_path).build(10)
+        manifest = json.loads(manifest_path.read_text())
+        
+        assert manifest["seeds"] == [5]
+        assert manifest["settings_fingerprint"] == settings_fingerprint(200)
+        assert manifest["app_version"] == settings.APP_VERSION
+    
+    def test_stale_bank_rejected_and_rebuilt(self, tmp_path, monkeypatch):
+        """Test that changed return ranges invalidate a persisted bank"""
+        self._bank(tmp_path).build(10)
+        monkeypatch.setattr(settings, "MODERATE_RETURN_MAX", 9.0)
+        bank = self._bank(tmp_path)
+        
+        assert not bank.load(10)
+        bank.warm(10)
+        assert bank.stats()["mapped_entries"] == len(RiskProfile)
+        assert bank.get_returns(RiskProfile.MODERATE, 10, 200, seed=5).max() > 8.0
+    
+    def test_rebuild_keeps_manifest_seeds(self, tmp_path, monkeypatch):
+        """Test that rebuilding a stale bank keeps every seed it was built with"""
+        self._bank(tmp_path).build(10, seeds=[5, 6])
+        monkeypatch.setattr(settings, "MODERATE_RETURN_MAX", 9.0)
+        bank = self._bank(tmp_path)
+        
+        bank.warm(10)
+        
+        assert bank.stats()["mapped_entries"] == 2 * len(RiskProfile)
+        assert bank.get_returns(RiskProfile.MODERATE, 10, 200, seed=6) is not None
+    
+    def test_mapped_at_startup_without_preload(self, tmp_path, monkeypatch):
+        """Test that startup maps a built bank even when nothing is preloaded"""
+        self._bank(tmp_path).build(10, seeds=[5, 6])
+        monkeypatch.setattr(settings, "PATH_BANK_ENABLED", True)
+        monkeypatch.setattr(settings, "PATH_BANK_PRELOAD_YEARS", 0)
+        monkeypatch.setattr(path_bank, "_path_bank", self._bank(tmp_path))
+        
+        with TestClient(app):
+            assert path_bank._path_bank.stats()["mapped_entries"] == 2 * len(RiskProfile)
+    
+    def test_short_or_resized_bank_rejected(self, tmp_path):
+        """Test that a bank too short or of another size is not used"""
+        self._bank(tmp_path).build(10)
+        
+        assert not self._bank(tmp_path).load(20)
+        assert not self._bank(tmp_path, size=300).load(10)
+    
+    def test_command_line_build(self, tmp_path, capsys):
+        """Test the build and check commands"""
+        path_bank_main(["build", "--dir", str(tmp_path), "--years", "5", "--size", "50"])
+        path_bank_main(["check", "--dir", str(tmp_path), "--size", "50"])
+        
+        assert (tmp_path / "manifest.json").exists()
+        assert "valid" in capsys.readouterr().out
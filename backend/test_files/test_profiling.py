@@ -0,0 +1,104 @@
+"""
+Unit tests for profiling module
+Tests cProfile reports and access control of profiled requests
+"""
+import os
+from fastapi.testclient import TestClient
+from app.core.config import settings
+from app.core.profiling import profile_call
+
+
+def busy_work(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+class TestProfileCall:
+    """Test suite for profile_call"""
+    
+    def test_result_and_hotspots(self, monkeypatch):
+        """Test that the result is returned with a hotspot table"""
+        monkeypatch.setattr(settings, "PROFILING_DIR", "")
+        monkeypatch.setattr(settings, "PROFILING_TOP_N", 5)
+        
+        result, report = profile_call("test", busy_work, 10000)
+        
+        assert result == busy_work(10000)
+        assert len(report["hotspots"]) <= 5
+        assert any("busy_work" in entry["function"] for entry in report["hotspots"])
+        assert report["hotspots"][0]["cumulative_ms"] >= report["hotspots"][-1]["cumulative_ms"]
+        assert report["file"] is None
+    
+    def test_profile_written_to_directory(self, monkeypatch, tmp_path):
+        """Test that a .prof file is written when PROFILING_DIR is set"""
+        monkeypatch.setattr(settings, "PROFILING_DIR", str(tmp_path))
+        
+        _, report = profile_call("retirement", busy_work, 100)
+        
+        assert os.path.dirname(report["file"]) == str(tmp_path)
+        assert os.path.basename(report["file"]).startswith("retirement-")
+        assert os.path.getsize(report["file"]) > 0
+
+
+class TestProfiledRequests:
+    """Test suite for profiling forecast requests"""
+    
+    payload = {
+        "current_age": 35,
+        "retirement_age": 60,
+        "monthly_contribution": 4000,
+        "risk_profile": "aggressive",
+        "monte_carlo_iterations": 1000,
+        "seed": 7,
+    }
+    
+    def client(self):
+        from app.main import app
+        return TestClient(app)
+    
+    def test_profiling_forbidden_without_debug_or_token(self, monkeypatch):
+        """Test that profiling is refused outside DEBUG without the admin token"""
+        monkeypatch.setattr(settings, "DEBUG", False)
+        monkeypatch.setattr(settings, "PROFILING_ADMIN_TOKEN", "secret")
+        
+        response = self.client().post(
+            "/api/v1/forecast/retirement",
+            json=self.payload,
+            headers={"X-Profile": "1", "X-Admin-Token": "wrong"}
+        )
+        
+        assert response.status_code == 403
+    
+    def test_admin_token_profiles_request(self, monkeypatch):
+        """Test that the admin token enables profiling covering the services"""
+        monkeypatch.setattr(settings, "DEBUG", False)
+        monkeypatch.setattr(settings, "PROFILING_ADMIN_TOKEN", "secret")
+        monkeypatch.setattr(settings, "PROFILING_TOP_N", 500)
+        
+        response = self.client().post(
+            "/api/v1/forecast/retirement",
+            json=self.payload,
+            headers={"X-Profile": "1", "X-Admin-Token": "secret"}
+        )
+        
+        assert response.status_code == 200
+        functions = " ".join(entry["function"] for entry in response.json()["profile"]["hotspots"])
+        assert "simulate_retirement_corpus" in functions
+        assert "calculate_total_contributions" in functions
+        assert "generate_insights" in functions
+    
+    def test_debug_query_parameter(self, monkeypatch):
+        """Test that ?profile=true works in DEBUG and unflagged requests are unprofiled"""
+        monkeypatch.setattr(settings, "DEBUG", True)
+        client = self.client()
+        
+        profiled = client.post("/api/v1/forecast/delay-impact?profile=true", json={
+            "current_age": 35,
+            "planned_retirement_age": 60,
+            "monthly_contribution": 4000,
+            "risk_profile": "moderate",
+        })
+        plain = client.post("/api/v1/forecast/retirement", json=self.payload)
+        
+        assert profiled.status_code == 200
+        assert profiled.json()["profile"]["hotspots"]
+        assert plain.json()["profile"] is None
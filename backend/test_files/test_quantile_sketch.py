@@ -0,0 +1,142 @@
+"""
+Unit tests for quantile_sketch module
+Tests sketch accuracy against exact percentiles and the streaming engine
+"""
+import numpy as np
+import pytest
+from app.core.config import settings
+from app.services.quantile_sketch import QuantileSketch, RunningMoments
+from app.services.monte_carlo_simulator import MonteCarloSimulator
+from app.models.schemas import RiskProfile
+
+
+QUANTILES = [0.10, 0.25, 0.50, 0.75, 0.90]
+
+
+def exact_rank(sorted_values, value):
+    """Fraction of values at or below the estimate"""
+    return np.searchsorted(sorted_values, value, side="right") / len(sorted_values)
+
+
+class TestQuantileSketch:
+    """Test suite for QuantileSketch"""
+    
+    def test_rank_error_within_documented_bound(self):
+        """Test that p10-p90 estimates stay within the rank error bound"""
+        values = np.random.default_rng(0).lognormal(0, 0.3, 200000)
+        sketch = QuantileSketch(compression=200)
+        for block in np.array_split(values, 40):
+            sketch.update(block)
+        
+        sorted_values = np.sort(values)
+        for q in QUANTILES:
+            error = abs(exact_rank(sorted_values, sketch.quantile(q)) - q)
+            assert error <= sketch.rank_error_bound(q)
+    
+    def test_memory_bounded(self):
+        """Test that the centroid count does not grow with the data"""
+        sketch = QuantileSketch(compression=100)
+        rng = np.random.default_rng(1)
+        for _ in range(50):
+            sketch.update(rng.normal(size=5000))
+        
+        assert sketch.count == 250000
+        assert sketch.centroid_count <= 100
+    
+    def test_merge_matches_single_sketch(self):
+        """Test that merged shard sketches stay within the bound"""
+        values = np.random.default_rng(2).gamma(3.0, size=100000)
+        merged = QuantileSketch()
+        for shard in np.array_split(values, 4):
+            part = QuantileSketch()
+            part.update(shard)
+            merged.merge(part)
+        
+        sorted_values = np.sort(values)
+        assert merged.count == values.size
+        assert merged.min == values.min()
+        assert merged.max == values.max()
+        for q in QUANTILES:
+            error = abs(exact_rank(sorted_values, merged.quantile(q)) - q)
+            assert error <= merged.rank_error_bound(q)
+    
+    def test_empty_sketch_rejected(self):
+        """Test that an empty sketch has no quantiles"""
+        with pytest.raises(ValueError):
+            QuantileSketch().quantile(0.5)
+
+
+class TestRunningMoments:
+    """Test suite for RunningMoments"""
+    
+    def test_matches_numpy(self):
+        """Test that blockwise and merged moments equal numpy's"""
+        values = np.random.default_rng(3).normal(1e7, 2e5, 30000)
+        moments = RunningMoments()
+        for block in np.array_split(values[:20000], 7):
+            moments.update(block)
+        other = RunningMoments()
+        other.update(values[20000:])
+        moments.merge(other)
+        
+        assert moments.count == values.size
+        assert moments.mean == pytest.approx(np.mean(values), rel=1e-12)
+        assert moments.std == pytest.approx(np.std(values), rel=1e-9)
+
+
+class TestStreamingEngine:
+    """Test suite for the streaming simulation engine"""
+    
+    def test_streaming_matches_exact_paths(self, monkeypatch):
+        """Test streaming statistics against the exact same simulated paths"""
+        monkeypatch.setattr(settings, "STREAMING_BLOCK_SIZE", 1000)
+        kwargs = dict(
+            monthly_contribution=5000,
+            years=30,
+            risk_profile=RiskProfile.MODERATE,
+            annual_income_growth=5.0,
+        )
+        
+        streamed = MonteCarloSimulator(seed=12).simulate_retirement_corpus(
+            iterations=20000, engine="streaming", **kwargs
+        )
+        
+        # Replay the identical blocks and keep every path
+        replay = MonteCarloSimulator(seed=12)
+        paths = np.sort(np.concatenate([
+            replay._simulate_paths(
+                5000, 30, replay._draw_returns(RiskProfile.MODERATE, 1000, 30), 5.0
+            )
+            for _ in range(20)
+        ]))
+        
+        bound = QuantileSketch(settings.STREAMING_SKETCH_COMPRESSION).rank_error_bound
+        for q in QUANTILES:
+            value = streamed[f"percentile_{int(q * 100)}"]
+            assert abs(exact_rank(paths, value) - q) <= bound(q)
+        assert streamed["mean"] == pytest.approx(paths.mean(), rel=1e-12)
+        assert streamed["std_deviation"] == pytest.approx(paths.std(), rel=1e-9)
+        assert streamed["min"] == paths[0]
+        assert streamed["max"] == paths[-1]
+    
+    def test_streaming_allows_larger_runs(self, monkeypatch):
+        """Test that streaming uses its own, higher iteration cap"""
+        monkeypatch.setattr(settings, "MAX_MONTE_CARLO_ITERATIONS", 1000)
+        seen = []
+        original = MonteCarloSimulator._draw_returns
+        
+        def recording(self, risk_profile, iterations, years, *args):
+            seen.append(iterations)
+            return original(self, risk_profile, iterations, years, *args)
+        
+        monkeypatch.setattr(MonteCarloSimulator, "_draw_returns", recording)
+        
+        MonteCarloSimulator(seed=1).simulate_retirement_corpus(
+            monthly_contribution=5000,
+            years=10,
+            risk_profile=RiskProfile.CONSERVATIVE,
+            iterations=25000,
+            engine="streaming"
+        )
+        
+        assert sum(seen) == 25000
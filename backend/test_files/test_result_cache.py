@@ -0,0 +1,133 @@
+"""
+Unit tests for result_cache module
+Tests LRU/TTL behaviour, canonical keys and cached forecast endpoints
+"""
+import pytest
+from fastapi.testclient import TestClient
+from app.core.config import settings
+from app.main import app
+from app.models.schemas import RetirementInput
+from app.services.result_cache import ResultCache, cache_key, reset_result_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestResultCache:
+    """Test suite for ResultCache eviction, expiry and counters"""
+    
+    def test_hit_and_miss_counters(self):
+        """Test that lookups are counted"""
+        cache = ResultCache(max_entries=4, ttl_seconds=60)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        
+        assert cache.get("a") == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hit_rate"] == 0.5
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted at capacity"""
+        cache = ResultCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert cache.evictions == 1
+    
+    def test_ttl_expiry(self):
+        """Test that entries expire after the TTL"""
+        clock = FakeClock()
+        cache = ResultCache(max_entries=2, ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert cache.expirations == 1
+        assert len(cache) == 0
+
+
+class TestCacheKey:
+    """Test suite for canonical request keys"""
+    
+    def _input(self, **overrides):
+        fields = dict(current_age=30, retirement_age=60, monthly_contribution=5000)
+        fields.update(overrides)
+        return RetirementInput(**fields)
+    
+    def test_normalised_inputs_share_key(self):
+        """Test that explicit defaults and int/float spellings share a key"""
+        implicit = self._input()
+        explicit = self._input(risk_profile="moderate", annual_income_growth=5, monte_carlo_iterations=10000)
+        
+        assert cache_key("retirement", implicit) == cache_key("retirement", explicit)
+    
+    def test_seed_endpoint_and_settings_change_key(self, monkeypatch):
+        """Test that seed, endpoint and assumption changes give new keys"""
+        base = cache_key("retirement", self._input())
+        
+        assert cache_key("retirement", self._input(seed=1)) != base
+        assert cache_key("scenario-comparison", self._input()) != base
+        monkeypatch.setattr(settings, "MODERATE_RETURN_MAX", 9.0)
+        assert cache_key("retirement", self._input()) != base
+
+
+class TestCachedEndpoints:
+    """Test suite for cache use by the forecast routes"""
+    
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setattr(settings, "RESULT_CACHE_ENABLED", True)
+        reset_result_cache()
+        yield TestClient(app)
+        reset_result_cache()
+    
+    def test_repeat_forecast_served_from_cache(self, client):
+        """Test that an identical forecast is served from cache"""
+        url = f"{settings.API_V1_PREFIX}/forecast/retirement"
+        payload = {"current_age": 30, "retirement_age": 60, "monthly_contribution": 5000}
+        
+        first = client.post(url, json=payload).json()
+        second = client.post(url, json=payload).json()
+        
+        assert first["simulation"]["served_from_cache"] is False
+        assert second["simulation"]["served_from_cache"] is True
+        assert second["corpus_projection"] == first["corpus_projection"]
+        assert second["simulation"]["seed"] == first["simulation"]["seed"]
+    
+    def test_repeat_analysis_served_from_cache(self, client):
+        """Test that dict endpoints report cache use in analysis_metadata"""
+        url = f"{settings.API_V1_PREFIX}/forecast/delay-impact"
+        payload = {
+            "current_age": 30, "planned_retirement_age": 58,
+            "monthly_contribution": 5000, "monte_carlo_iterations": 1000
+        }
+        
+        first = client.post(url, json=payload).json()
+        second = client.post(url, json=payload).json()
+        
+        assert first["analysis_metadata"]["served_from_cache"] is False
+        assert second["analysis_metadata"]["served_from_cache"] is True
+        assert second["delay_scenarios"] == first["delay_scenarios"]
+    
+    def test_disabled_cache_recomputes(self, client, monkeypatch):
+        """Test that nothing is cached when the cache is disabled"""
+        monkeypatch.setattr(settings, "RESULT_CACHE_ENABLED", False)
+        url = f"{settings.API_V1_PREFIX}/forecast/retirement"
+        payload = {"current_age": 30, "retirement_age": 60, "monthly_contribution": 5000}
+        
+        client.post(url, json=payload)
+        second = client.post(url, json=payload).json()
+        
+        assert second["simulation"]["served_from_cache"] is False
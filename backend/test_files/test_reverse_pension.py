@@ -0,0 +1,30 @@
+"""
+Unit tests for the reverse pension endpoint
+Tests the required-contribution calculation through the API
+"""
+from fastapi.testclient import TestClient
+from app.core.config import settings
+from app.main import app
+
+
+class TestReversePensionEndpoint:
+    """Test suite for POST /forecast/reverse-pension"""
+    
+    def test_returns_required_contribution(self):
+        """Test that a valid request succeeds with insights and suggestions"""
+        client = TestClient(app)
+        
+        response = client.post(f"{settings.API_V1_PREFIX}/forecast/reverse-pension", json={
+            "current_age": 30,
+            "retirement_age": 60,
+            "desired_monthly_pension": 50000,
+            "annual_income_growth": 5.0,
+            "risk_profile": "moderate"
+        })
+        
+        assert response.status_code == 200
+        result = response.json()
+        assert result["required_monthly_contribution"] > 0
+        assert result["investment_horizon_years"] == 30
+        assert result["insights"]
+        assert result["strategic_suggestions"]
@@ -5,7 +5,9 @@ Tests contribution sensitivity and retirement delay impact analysis
 import pytest  
 from app.services.sensitivity_analyzer import SensitivityAnalyzer
 from app.services.delay_simulator import DelaySimulator
+from app.services.monte_carlo_simulator import MonteCarloSimulator
 from app.models.schemas import RiskProfile
+from app.core.exceptions import ValidationException
 
 
 class TestSensitivityAnalyzer:
@@ -102,6 +104,96 @@ class TestSensitivityAnalyzer:
         assert metadata["investment_horizon_years"] == 30
         assert metadata["risk_profile"] == RiskProfile.AGGRESSIVE
         assert metadata["annual_income_growth"] == 3.5
+    
+    def test_sensitivity_seed_reproducible(self):
+        """Test that the reported seed reproduces the analysis"""
+        kwargs = dict(
+            base_monthly_contribution=10000,
+            years=30,
+            risk_profile=RiskProfile.MODERATE,
+            iterations=1000
+        )
+        first = SensitivityAnalyzer.analyze_contribution_sensitivity(**kwargs)
+        seed = first["analysis_metadata"]["seed"]
+        again = SensitivityAnalyzer.analyze_contribution_sensitivity(seed=seed, **kwargs)
+        
+        assert again["base_scenario"] == first["base_scenario"]
+    
+    def test_sensitivity_single_simulation(self, monkeypatch):
+        """Test that any number of scenarios costs one simulation"""
+        calls = []
+        original = MonteCarloSimulator.simulate_retirement_corpus
+        
+        def counting(self, *args, **kwargs):
+            calls.append(kwargs)
+            return original(self, *args, **kwargs)
+        
+        monkeypatch.setattr(MonteCarloSimulator, "simulate_retirement_corpus", counting)
+        
+        result = SensitivityAnalyzer.analyze_contribution_sensitivity(
+            base_monthly_contribution=10000,
+            years=30,
+            risk_profile=RiskProfile.MODERATE,
+            scenarios=list(range(-50, 250)),
+            iterations=1000
+        )
+        
+        assert len(calls) == 1
+        assert len(result["sensitivity_scenarios"]) == 300
+    
+    def test_sensitivity_scenarios_scale_linearly(self):
+        """Test that scenario projections are exact rescalings of the base"""
+        result = SensitivityAnalyzer.analyze_contribution_sensitivity(
+            base_monthly_contribution=10000,
+            years=30,
+            risk_profile=RiskProfile.MODERATE,
+            scenarios=[5, 10],
+            iterations=1000,
+            seed=3
+        )
+        
+        base = result["base_scenario"]["corpus_projection"]
+        for scenario in result["sensitivity_scenarios"]:
+            factor = 1 + scenario["contribution_increase_percent"] / 100
+            for key in ("mean", "std_deviation", "percentile_10", "percentile_90"):
+                assert scenario["corpus_projection"][key] == pytest.approx(base[key] * factor)
+            assert scenario["impact_vs_base"]["p50_percentage_gain"] == pytest.approx(
+                scenario["contribution_increase_percent"]
+            )
+    
+    def test_sensitivity_matches_direct_simulation(self):
+        """Test that a rescaled scenario equals simulating it on the same paths"""
+        result = SensitivityAnalyzer.analyze_contribution_sensitivity(
+            base_monthly_contribution=10000,
+            years=25,
+            risk_profile=RiskProfile.AGGRESSIVE,
+            annual_income_growth=4.0,
+            scenarios=[20],
+            iterations=1000,
+            seed=8
+        )
+        direct = MonteCarloSimulator(seed=8).simulate_retirement_corpus(
+            monthly_contribution=12000,
+            years=25,
+            risk_profile=RiskProfile.AGGRESSIVE,
+            annual_income_growth=4.0,
+            iterations=1000
+        )
+        
+        scenario = result["sensitivity_scenarios"][0]["corpus_projection"]
+        for key, value in direct.items():
+            assert scenario[key] == pytest.approx(value, rel=1e-12)
+    
+    def test_sensitivity_rejects_non_positive_contribution(self):
+        """Test that scenarios at or below -100% are rejected"""
+        with pytest.raises(ValidationException):
+            SensitivityAnalyzer.analyze_contribution_sensitivity(
+                base_monthly_contribution=10000,
+                years=30,
+                risk_profile=RiskProfile.MODERATE,
+                scenarios=[-100],
+                iterations=1000
+            )
 
 
 class TestDelaySimulator:
@@ -238,3 +330,24 @@ class TestDelaySimulator:
         assert metadata["monthly_contribution"] == 10000
         assert metadata["risk_profile"] == RiskProfile.CONSERVATIVE
         assert metadata["annual_income_growth"] == 4.0
+    
+    def test_delay_single_simulation(self, monkeypatch):
+        """Test that all delay scenarios come from one horizon simulation"""
+        calls = []
+        original = MonteCarloSimulator.simulate_horizons
+        
+        def counting(self, *args, **kwargs):
+            calls.append(kwargs["horizons"])
+            return original(self, *args, **kwargs)
+        
+        monkeypatch.setattr(MonteCarloSimulator, "simulate_horizons", counting)
+        
+        DelaySimulator.simulate_retirement_delay(
+            base_retirement_age=60,
+            current_age=35,
+            monthly_contribution=10000,
+            risk_profile=RiskProfile.MODERATE,
+            iterations=1000
+        )
+        
+        assert calls == [[25, 26, 27, 30]]
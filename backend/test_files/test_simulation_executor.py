@@ -0,0 +1,137 @@
+"""
+Unit tests for simulation_executor module
+Tests the bounded pool and event-loop responsiveness under load
+"""
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableException
+from app.main import app
+from app.routes import forecast
+from app.services.simulation_executor import SimulationExecutor
+
+
+class TestSimulationExecutor:
+    """Test suite for SimulationExecutor"""
+    
+    @pytest.mark.asyncio
+    async def test_runs_on_worker_thread(self):
+        """Test that work runs off the event loop thread"""
+        executor = SimulationExecutor(kind="thread", workers=2, queue_limit=2)
+        
+        name = await executor.run(lambda: threading.current_thread().name)
+        
+        assert name.startswith("simulation")
+        assert executor.stats()["completed"] == 1
+        executor.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_process_pool(self):
+        """Test that the process pool runs picklable work"""
+        executor = SimulationExecutor(kind="process", workers=1, queue_limit=1)
+        
+        assert await executor.run(pow, 2, 10) == 1024
+        executor.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_rejects_beyond_queue_limit(self):
+        """Test that requests past workers + queue limit are rejected"""
+        executor = SimulationExecutor(kind="thread", workers=1, queue_limit=1)
+        release = threading.Event()
+        
+        running = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        
+        with pytest.raises(ServiceUnavailableException) as error:
+            await executor.run(release.wait)
+        assert error.value.status_code == 503
+        assert executor.stats()["queued"] == 1
+        assert executor.rejected == 1
+        
+        release.set()
+        await asyncio.gather(*running)
+        assert executor.stats()["pending"] == 0
+        executor.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_run_holds_slot_until_work_returns(self):
+        """Test that cancelling a caller does not free the slot of running work"""
+        executor = SimulationExecutor(kind="thread", workers=1, queue_limit=0)
+        started, release = threading.Event(), threading.Event()
+        
+        def work():
+            started.set()
+            release.wait()
+        
+        running = asyncio.ensure_future(executor.run(work))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait)
+        running.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await running
+        
+        assert executor.stats()["pending"] == 1
+        with pytest.raises(ServiceUnavailableException):
+            await executor.run(work)
+        
+        release.set()
+        executor.shutdown()
+        assert executor.stats()["pending"] == 0
+        assert executor.completed == 1
+    
+    def test_unknown_kind(self):
+        """Test that an unknown pool kind is rejected"""
+        with pytest.raises(ValueError):
+            SimulationExecutor(kind="fiber")
+
+
+class TestEventLoopResponsiveness:
+    """Test suite for serving while simulations run"""
+    
+    @pytest.mark.asyncio
+    async def test_health_responds_during_heavy_forecast(self, monkeypatch):
+        """Test that /health answers while a heavy simulation is running"""
+        monkeypatch.setattr(settings, "RESULT_CACHE_ENABLED", False)
+        payload = {"base_input": {
+            "current_age": 18, "retirement_age": 70,
+            "monthly_contribution": 5000, "monte_carlo_iterations": 50000
+        }}
+        
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            heavy = asyncio.ensure_future(client.post(
+                f"{settings.API_V1_PREFIX}/forecast/scenario-comparison", json=payload
+            ))
+            await asyncio.sleep(0.01)
+            
+            start = time.perf_counter()
+            health = await client.get("/health")
+            health_latency = time.perf_counter() - start
+            health_finished_first = not heavy.done()
+            
+            assert (await heavy).status_code == 200
+        
+        assert health.status_code == 200
+        assert health_finished_first
+        assert health_latency < 0.1
+    
+    @pytest.mark.asyncio
+    async def test_full_queue_returns_503(self, monkeypatch):
+        """Test that an exhausted executor maps to 503 with Retry-After"""
+        monkeypatch.setattr(settings, "RESULT_CACHE_ENABLED", False)
+        full = SimulationExecutor(kind="thread", workers=1, queue_limit=0)
+        full.pending = full.capacity
+        monkeypatch.setattr(forecast, "get_simulation_executor", lambda: full)
+        
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post(
+                f"{settings.API_V1_PREFIX}/forecast/retirement",
+                json={"current_age": 30, "retirement_age": 60, "monthly_contribution": 5000}
+            )
+        
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        full.shutdown()
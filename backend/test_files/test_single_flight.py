@@ -0,0 +1,131 @@
+"""
+Unit tests for single_flight module
+Tests coalescing of identical concurrent computations
+"""
+import asyncio
+import httpx
+import pytest
+from app.core.config import settings
+from app.main import app
+from app.services.single_flight import SingleFlight, simulation_flights
+
+
+class TestSingleFlight:
+    """Test suite for SingleFlight coordination"""
+    
+    @pytest.mark.asyncio
+    async def test_identical_calls_share_one_computation(self):
+        """Test that concurrent calls with one key run compute once"""
+        flight = SingleFlight()
+        calls = []
+        
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"value": 42}
+        
+        results = await asyncio.gather(*(flight.do("k", compute) for _ in range(5)))
+        
+        assert len(calls) == 1
+        assert all(result == {"value": 42} for result, _ in results)
+        assert [coalesced for _, coalesced in results].count(False) == 1
+        assert flight.stats() == {"leaders": 1, "coalesced": 4, "in_flight": 0}
+    
+    @pytest.mark.asyncio
+    async def test_distinct_keys_and_later_calls_run_separately(self):
+        """Test that only concurrent calls with the same key are coalesced"""
+        flight = SingleFlight()
+        
+        async def compute():
+            await asyncio.sleep(0.01)
+            return 1
+        
+        await asyncio.gather(flight.do("a", compute), flight.do("b", compute))
+        await flight.do("a", compute)
+        
+        assert flight.leaders == 3
+        assert flight.coalesced == 0
+    
+    @pytest.mark.asyncio
+    async def test_exception_shared_with_followers(self):
+        """Test that followers receive the leader's exception"""
+        flight = SingleFlight()
+        
+        async def compute():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+        
+        results = await asyncio.gather(
+            flight.do("k", compute), flight.do("k", compute), return_exceptions=True
+        )
+        
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flight.in_flight == 0
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_follower_leaves_flight_running(self):
+        """Test that cancelling a waiter does not cancel the computation"""
+        flight = SingleFlight()
+        
+        async def compute():
+            await asyncio.sleep(0.05)
+            return "done"
+        
+        leader = asyncio.ensure_future(flight.do("k", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", compute))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+        
+        assert await leader == ("done", False)
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_leaves_flight_running(self):
+        """Test that cancelling the leader still delivers the result to followers"""
+        flight = SingleFlight()
+        calls = 0
+        
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return 42
+        
+        leader = asyncio.ensure_future(flight.do("k", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", compute))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        
+        assert await follower == (42, True)
+        assert leader.cancelled()
+        assert calls == 1
+        assert flight.in_flight == 0
+
+
+class TestCoalescedEndpoints:
+    """Test suite for coalescing in the forecast routes"""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_forecasts_coalesce(self, monkeypatch):
+        """Test that identical concurrent forecasts run one simulation"""
+        monkeypatch.setattr(settings, "RESULT_CACHE_ENABLED", False)
+        before = simulation_flights.stats()
+        payload = {
+            "current_age": 30, "retirement_age": 60,
+            "monthly_contribution": 5000, "monte_carlo_iterations": 50000
+        }
+        
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(*(
+                client.post(f"{settings.API_V1_PREFIX}/forecast/retirement", json=payload)
+                for _ in range(4)
+            ))
+            stats = (await client.get("/health/stats")).json()["single_flight"]
+        
+        corpora = [response.json()["corpus_projection"] for response in responses]
+        assert all(response.status_code == 200 for response in responses)
+        assert all(corpus == corpora[0] for corpus in corpora)
+        assert stats["leaders"] - before["leaders"] == 1
+        assert stats["coalesced"] - before["coalesced"] == 3
@@ -0,0 +1,96 @@
+"""
+Unit tests for timing module
+Tests stage timers and the Server-Timing header on forecasts
+"""
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fastapi.testclient import TestClient
+from app.core.timing import StageTimer, current_timer, stage
+
+
+class TestStageTimer:
+    """Test suite for StageTimer"""
+    
+    def test_stages_accumulate(self):
+        """Test that repeated stages add up and total covers them"""
+        timer = StageTimer()
+        for _ in range(2):
+            with timer.stage("work"):
+                time.sleep(0.01)
+        
+        timings = timer.timings()
+        assert list(timings) == ["work", "total"]
+        assert timings["work"] >= 20
+        assert timings["total"] >= timings["work"]
+    
+    def test_server_timing_format(self):
+        """Test the Server-Timing header value"""
+        timer = StageTimer()
+        timer.stages = {"simulation": 12.5, "insights": 0.25}
+        
+        entries = timer.server_timing().split(", ")
+        assert entries[:2] == ["simulation;dur=12.500", "insights;dur=0.250"]
+        assert entries[2].startswith("total;dur=")
+    
+    def test_stage_without_timer_is_noop(self):
+        """Test that stage() works outside a timed request"""
+        def run():
+            assert current_timer() is None
+            with stage("work"):
+                return 42
+        
+        assert contextvars.copy_context().run(run) == 42
+    
+    def test_stage_recorded_from_worker_thread(self):
+        """Test that a worker running in a copy of the context records into the timer"""
+        def work():
+            with stage("simulation"):
+                time.sleep(0.005)
+        
+        def request():
+            timer = StageTimer.activate()
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                pool.submit(contextvars.copy_context().run, work).result()
+            return timer
+        
+        timer = contextvars.copy_context().run(request)
+        assert timer.stages["simulation"] >= 5
+
+
+class TestForecastServerTiming:
+    """Test suite for stage timing on /forecast/retirement"""
+    
+    payload = {
+        "current_age": 30,
+        "retirement_age": 60,
+        "monthly_contribution": 5000,
+        "risk_profile": "moderate",
+        "monte_carlo_iterations": 1000,
+        "seed": 20260101,
+    }
+    
+    def test_header_and_timings_block(self):
+        """Test that stages are reported in the header and, on request, the body"""
+        from app.main import app
+        client = TestClient(app)
+        
+        response = client.post("/api/v1/forecast/retirement?timings=true", json=self.payload)
+        
+        assert response.status_code == 200
+        header_stages = [entry.split(";")[0] for entry in response.headers["Server-Timing"].split(", ")]
+        timings = response.json()["timings"]
+        for name in ("simulation", "contributions", "pension", "insights", "response", "total"):
+            assert name in header_stages
+            assert name in timings
+    
+    def test_cached_response_without_timings(self):
+        """Test that timings are opt-in and never stored in the cached result"""
+        from app.main import app
+        client = TestClient(app)
+        client.post("/api/v1/forecast/retirement?timings=true", json=self.payload)
+        
+        response = client.post("/api/v1/forecast/retirement", json=self.payload)
+        
+        assert response.json()["timings"] is None
+        assert "cache;dur=" in response.headers["Server-Timing"]